@@ -6,6 +6,7 @@ from flask_login import LoginManager
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 from models import db, User, RestaurantInfo
+from schema_migrations import apply_schema_migrations, drop_dependent_views
 from services.mailService import mail
 from routes.authRoute import auth_bp
 from routes.locationRoute import location_bp
@@ -14,6 +15,8 @@ from routes.suggestionRoute import suggestion_bp
 from routes.badgeRoute import badge_bp
 from routes.visitRoute import visit_bp
 from routes.restaurantRoutes import restaurant_bp
+from services.restaurantService import warmup_haversine
+from services.schedulerService import start_scheduler
 
 from flask.json.provider import DefaultJSONProvider
 
@@ -76,7 +79,15 @@ app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
     "pool_pre_ping": True,
     "pool_recycle": 1800,
+    # 거리 계산 등으로 커넥션을 오래 잡는 요청이 있어 기본(5+10)보다 넉넉하게
+    "pool_size": int(os.environ.get("DB_POOL_SIZE", 20)),
+    "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 40)),
+    # 컴파일된 SQL 캐시 (lambda_stmt/필터 조합이 많아 기본 500보다 크게)
+    "query_cache_size": 1200,
 }
+# psycopg3 드라이버면 5회 이상 실행된 쿼리를 서버측 prepared statement로
+if (app.config['SQLALCHEMY_DATABASE_URI'] or "").startswith("postgresql+psycopg://"):
+    app.config['SQLALCHEMY_ENGINE_OPTIONS']["connect_args"] = {"prepare_threshold": 5}
 
 app.config['JWT_SECRET_KEY'] = os.environ.get("JWT_SECRET_KEY", app.config['SECRET_KEY'])
 app.config['JWT_ACCESS_TOKEN_EXPIRES'] = int(os.environ.get("JWT_ACCESS_TOKEN_EXPIRES", 3600))
@@ -162,6 +173,36 @@ app.register_blueprint(restaurant_bp, url_prefix="/restaurants")
 def index():
     return "서버 정상 작동 중!"
 
+def warmup_hot_queries():
+    """
+    기동 직후 자주 쓰는 조회 API를 한 번씩 호출
+    → 커넥션 풀/SQL 컴파일 캐시/DB 플랜을 실제 트래픽 전에 채움
+    """
+    sample_res_id = db.session.query(RestaurantInfo.res_id).order_by(RestaurantInfo.res_id).limit(1).scalar()
+    paths = [
+        "/restaurants/",
+        "/restaurants/?sort=score_desc",
+        "/restaurants/?sort=price_asc",
+        "/restaurants/stats",
+        "/restaurants/nearby?lat=37.4784&lng=126.9516",
+        "/restaurants/?lat=37.4784&lng=126.9516&sort=distance",
+    ]
+    if sample_res_id is not None:
+        paths += [
+            f"/badges/badges/restaurant/{sample_res_id}",
+            f"/reviews/reviews/restaurant/{sample_res_id}",
+            f"/reviews/reviews/restaurant/{sample_res_id}/summary",
+            f"/visits/visits/restaurant/{sample_res_id}",
+        ]
+
+    with app.test_client() as client:
+        for path in paths:
+            try:
+                resp = client.get(path)
+                print(f"[WARMUP] {resp.status_code} {path}")
+            except Exception as e:
+                print(f"[WARMUP] ✗ {path}: {e}")
+
 def run_pdf_downloader_inprocess():
     import sys
     from services.pdf_downloader import main as downloader_main
@@ -237,6 +278,7 @@ if __name__ == "__main__":
         RESET_DB = _env_flag("RESET_DB", "0")
         if RESET_DB:
             print("[DB] Dropping and recreating all tables...")
+            drop_dependent_views()
             db.drop_all()
             db.create_all()
             print("[DB] ✓ Tables recreated")
@@ -245,6 +287,12 @@ if __name__ == "__main__":
             print("[DB] ✓ Tables verified/created")
 
         if run_once:
+            # 리로더 부모 프로세스에서는 실행하지 않음 (CONCURRENTLY 인덱스 빌드 경합, 요청을 받지 않는 프로세스 워밍업 방지)
+            apply_schema_migrations()
+            warmup_haversine()
+            if _env_flag("DB_WARMUP", "1"):
+                warmup_hot_queries()
+
             # 1) INIT_DATA_ENABLE이 켜져 있을 때만 init_data 실행
             if INIT_DATA_ENABLE:
                 if (not TESTMODE) and _env_flag("DOWNLOAD_ON_BOOT", "1"):
@@ -375,5 +423,8 @@ if __name__ == "__main__":
             else:
                 print("[REPAIR] Skipped (ENABLE_REPAIR=0)")
 
+    if run_once:
+        start_scheduler(app)
+
     print("\n[APP] Starting Flask application...")
     app.run(host="0.0.0.0", port=_env_int("PORT", 5000), debug=True, threaded=True)
\ No newline at end of file
@@ -1,14 +1,19 @@
 import os
 import re
+import sys
+import hashlib
+from array import array
 import csv
 import math
 import logging
 import unicodedata
 from functools import lru_cache
-from typing import Optional, List, Tuple, Dict, Set, Any
+from typing import Optional, List, Tuple, Dict, Set, Any, Iterator, Literal
 from datetime import datetime
 import time
+import threading
 from collections import defaultdict
+from itertools import islice
 
 import requests
 import pdfplumber
@@ -29,11 +34,19 @@ try:
 except ImportError:
     olefile = None
 
+try:
+    import lz4.frame  # 프로세스 풀 결과 압축 (IPC 바이트 절감)
+except ImportError:
+    lz4 = None
+
+import pickle
 import zipfile            # .hwpx (ZIP)
 import xml.etree.ElementTree as ET  # XML text extraction for HWPX
 
+from psycopg2.extras import execute_values
+
 from models import db, RestaurantInfo
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import multiprocessing
 
 # ============================================
@@ -63,11 +76,20 @@ REGION_HINTS: List[str] = [h.strip() for h in os.getenv("GEOCODE_REGION_HINT", "
 ALLOW_NO_GEOCODE = os.getenv("ALLOW_NO_GEOCODE", "true").lower() in ("1", "true", "yes", "y")
 print("[DEBUG] NAVER_CLIENT_ID =", repr(NAVER_CLIENT_ID))
 
+# 레코드 dict 키 (dedup 루프에서 반복 조회하므로 intern)
+K_NAME = sys.intern("res_name")
+K_ADDR = sys.intern("address")
+
 # 성능 최적화 설정
 MAX_GEOCODE_CACHE = 2000  # 지오코딩 캐시 크기
-DEFAULT_BATCH_SIZE = 300  # 기본 배치 크기
+DEFAULT_BATCH_SIZE = 500  # 기본 배치 크기 (배치 업서트 기준)
+MAX_BATCH_PARAMS = 60_000  # 배치 1문장당 바인드 값 상한 (PG 65535 여유분)
 DB_RETRY_COUNT = 3  # DB 작업 재시도 횟수
 DB_RETRY_DELAY = 0.5  # 재시도 간 대기 시간 (초)
+# 실행 간 처리 완료 파일 캐시 (비우면 비활성화): 파일 지문 uint64를 append-only로 기록
+DEDUP_CACHE_PATH = os.getenv("INIT_DEDUP_CACHE", "")
+POOL_PROBE_FILES = 3  # pool_type="auto"일 때 동기 실행으로 측정할 파일 수
+POOL_CPU_RATIO = 0.7  # CPU 시간 / 경과 시간이 이 값을 넘으면 프로세스 풀 사용
 # ============================================
 # 네이버 Local 검색으로 카테고리 가져오기
 # ============================================
@@ -75,18 +97,53 @@ DB_RETRY_DELAY = 0.5  # 재시도 간 대기 시간 (초)
 # (이름, 주소) 단위로 카테고리 캐시
 _LOCAL_CATEGORY_CACHE: Dict[Tuple[str, str], Optional[str]] = {}
 
-def _worker_parse_and_process(filepath: str, limit: Optional[int] = None) -> List[Dict]:
+def _worker_parse_and_process(
+    filepath: str,
+    limit: Optional[int] = None,
+    compress: bool = False,
+) -> Any:
     """
     서브 프로세스에서 실행:
     - 파일 파싱(parse_file)
     - 행 변환(process_extracted_rows)
-    - DB는 건드리지 않고 record 리스트만 반환
+    - DB는 건드리지 않고 record 리스트만 반환 (compress=True면 lz4 압축 bytes)
+    - 모든 record에 K_NAME/K_ADDR 키가 있음을 보장 (메인에서 직접 인덱싱)
     """
-    rows = parse_file(filepath)
+    rows = _prefilter_rows(parse_file(filepath))
     if not rows:
         return []
     # limit은 각 파일당 제한이라, 전체 limit는 메인에서 다시 체크
-    return process_extracted_rows(rows, limit)
+    records = process_extracted_rows(rows, limit)
+    for rec in records:
+        if rec.get(K_NAME) is None:
+            rec[K_NAME] = ""
+        if rec.get(K_ADDR) is None:
+            rec[K_ADDR] = ""
+    if compress:
+        return _pack_records(records)
+    return records
+
+def _pack_records(records: List[Dict]) -> bytes:
+    """record dict 리스트는 키가 반복되어 압축이 잘 됨 → 파이프로 보내는 바이트 감소"""
+    return lz4.frame.compress(pickle.dumps(records, protocol=5))
+
+def _unpack_records(payload: Any) -> List[Dict]:
+    if isinstance(payload, bytes):
+        return pickle.loads(lz4.frame.decompress(payload))
+    return payload
+
+def _prefilter_rows(
+    rows: List[Tuple[str, Optional[int], Optional[int]]]
+) -> List[Tuple[str, Optional[int], Optional[int]]]:
+    """
+    process_extracted_rows 전에 C 레벨 연산으로 걸러냄 (결과는 동일)
+    - 장소 텍스트가 비어 있는 행 제거
+    - 완전히 같은 (장소, 인원, 금액) 행은 첫 행만 유지 (순서 보존)
+      → 표 머리글/반복 행이 많은 PDF에서 정제·지오코딩 전에 중복이 빠짐
+    """
+    if not rows:
+        return []
+    return [row for row in dict.fromkeys(rows) if row[0] and not row[0].isspace()]
 
 def haversine(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
     """
@@ -1088,8 +1145,8 @@ def process_extracted_rows(
         
         # 결과 추가
         results.append({
-            "res_name": name_clean[:64] if name_clean else "",
-            "address": addr_clean[:255] if addr_clean else "",
+            K_NAME: name_clean[:64] if name_clean else "",
+            K_ADDR: addr_clean[:255] if addr_clean else "",
             "lat": lat,
             "lng": lng,
             "res_phone": None,
@@ -1126,6 +1183,12 @@ def upsert_restaurant_record(record: Dict) -> Tuple[bool, bool, Optional[str]]:
     # 재시도 로직
     for attempt in range(DB_RETRY_COUNT):
         try:
+            # 이름+주소가 모두 있으면 uq_name_addr 기준 단일 ON CONFLICT 문으로 처리
+            if name and addr and _bulk_upsert_supported:
+                created, updated = _execute_upsert_values([_upsert_row_values(record, name, addr)])
+                db.session.commit()
+                return bool(created), bool(updated), None
+
             # 기존 레코드 찾기
             existing = None
             
@@ -1246,6 +1309,10 @@ def upsert_restaurant_record(record: Dict) -> Tuple[bool, bool, Optional[str]]:
         
         except Exception as e:
             db.session.rollback()
+
+            if getattr(e, "pgcode", None) == "42P10":
+                _disable_bulk_upsert()
+                continue
             
             if attempt < DB_RETRY_COUNT - 1:
                 time.sleep(DB_RETRY_DELAY)
@@ -1254,6 +1321,271 @@ def upsert_restaurant_record(record: Dict) -> Tuple[bool, bool, Optional[str]]:
             return False, False, str(e)[:100]
     
     return False, False, "Max retries exceeded"
+
+
+# 배치 단위 업서트: (res_name, address) 충돌 시 upsert_restaurant_record와 같은 규칙으로 보강
+# - 좌표/인원/카테고리/전화번호는 비어 있을 때만 채움
+# - 가격은 첫 값이면 그대로, 이후에는 min/max/avg/count 누적
+#   (EXCLUDED 한 행이 같은 배치의 반복 레코드 여러 개를 합친 값일 수 있어 price_count개 단위로 누적)
+# - 바뀔 게 없는 행은 WHERE에서 걸러져 RETURNING에 안 잡힘 → skipped
+_COORD_FILL_SQL = (
+    "COALESCE(EXCLUDED.lat, 0) <> 0 AND COALESCE(EXCLUDED.lng, 0) <> 0 "
+    "AND (COALESCE(t.lat, 0) = 0 OR COALESCE(t.lng, 0) = 0)"
+)
+_PRICE_ACC_SQL = "COALESCE(EXCLUDED.price, 0) > 0 AND COALESCE(t.price, 0) <> 0"
+# 기존 행에 가격이 없을 때: 가격과 함께 EXCLUDED의 통계(합쳐진 반복 레코드 포함)를 그대로 가져옴
+_PRICE_FILL_SQL = "COALESCE(EXCLUDED.price, 0) > 0 AND COALESCE(t.price, 0) = 0"
+_PRICE_OLD_COUNT_SQL = "COALESCE(NULLIF(t.price_count, 0), 1)"
+_PRICE_NEW_COUNT_SQL = "COALESCE(NULLIF(EXCLUDED.price_count, 0), 1)"
+_PRICE_NEW_AVG_SQL = (
+    f"(COALESCE(NULLIF(t.price_avg, 0), t.price) * {_PRICE_OLD_COUNT_SQL}"
+    f" + COALESCE(EXCLUDED.price_avg, EXCLUDED.price) * {_PRICE_NEW_COUNT_SQL})"
+    f" / ({_PRICE_OLD_COUNT_SQL} + {_PRICE_NEW_COUNT_SQL})"
+)
+_PEOPLE_FILL_SQL = "COALESCE(EXCLUDED.people, 0) > 0 AND COALESCE(t.people, 0) = 0"
+_CATEGORY_FILL_SQL = "COALESCE(EXCLUDED.category, '') <> '' AND COALESCE(t.category, '') = ''"
+_PHONE_FILL_SQL = "COALESCE(EXCLUDED.res_phone, '') <> '' AND COALESCE(t.res_phone, '') = ''"
+
+_UPSERT_COLUMNS = (
+    "res_name", "address", "lat", "lng", "res_phone", "category", "price", "score",
+    "people", "price_min", "price_max", "price_avg", "price_count",
+)
+# 한 문장의 바인드 값 수가 상한을 넘지 않는 최대 배치
+SAFE_BATCH_SIZE = MAX_BATCH_PARAMS // len(_UPSERT_COLUMNS)
+
+_BULK_UPSERT_SQL = f"""
+WITH ins AS (
+    INSERT INTO restaurant_info AS t ({", ".join(_UPSERT_COLUMNS)})
+    VALUES %s
+    ON CONFLICT (res_name, address) DO UPDATE SET
+        lat = CASE WHEN {_COORD_FILL_SQL} THEN EXCLUDED.lat ELSE t.lat END,
+        lng = CASE WHEN {_COORD_FILL_SQL} THEN EXCLUDED.lng ELSE t.lng END,
+        price = CASE
+            WHEN {_PRICE_FILL_SQL} THEN EXCLUDED.price
+            WHEN {_PRICE_ACC_SQL} THEN {_PRICE_NEW_AVG_SQL}
+            ELSE t.price
+        END,
+        price_count = CASE
+            WHEN {_PRICE_FILL_SQL} THEN EXCLUDED.price_count
+            WHEN {_PRICE_ACC_SQL} THEN {_PRICE_OLD_COUNT_SQL} + {_PRICE_NEW_COUNT_SQL}
+            ELSE t.price_count
+        END,
+        price_min = CASE
+            WHEN {_PRICE_FILL_SQL} THEN EXCLUDED.price_min
+            WHEN {_PRICE_ACC_SQL}
+                THEN LEAST(COALESCE(NULLIF(t.price_min, 0), EXCLUDED.price_min), EXCLUDED.price_min)
+            ELSE t.price_min
+        END,
+        price_max = CASE
+            WHEN {_PRICE_FILL_SQL} THEN EXCLUDED.price_max
+            WHEN {_PRICE_ACC_SQL}
+                THEN GREATEST(COALESCE(NULLIF(t.price_max, 0), EXCLUDED.price_max), EXCLUDED.price_max)
+            ELSE t.price_max
+        END,
+        price_avg = CASE
+            WHEN {_PRICE_FILL_SQL} THEN EXCLUDED.price_avg
+            WHEN {_PRICE_ACC_SQL} THEN {_PRICE_NEW_AVG_SQL}
+            ELSE t.price_avg
+        END,
+        people = CASE WHEN {_PEOPLE_FILL_SQL} THEN EXCLUDED.people ELSE t.people END,
+        category = CASE WHEN {_CATEGORY_FILL_SQL} THEN EXCLUDED.category ELSE t.category END,
+        res_phone = CASE WHEN {_PHONE_FILL_SQL} THEN EXCLUDED.res_phone ELSE t.res_phone END
+    WHERE ({_COORD_FILL_SQL})
+        OR COALESCE(EXCLUDED.price, 0) > 0
+        OR ({_PEOPLE_FILL_SQL})
+        OR ({_CATEGORY_FILL_SQL})
+        OR ({_PHONE_FILL_SQL})
+    RETURNING (xmax = 0) AS created
+)
+SELECT COUNT(*) FILTER (WHERE created), COUNT(*) FILTER (WHERE NOT created) FROM ins
+"""
+
+# uq_name_addr 유니크 인덱스가 없는 DB(마이그레이션 전)면 조회 후 갱신 경로로 고정
+_bulk_upsert_supported = True
+
+
+def _disable_bulk_upsert() -> None:
+    global _bulk_upsert_supported
+    if _bulk_upsert_supported:
+        log.warning("uq_name_addr index missing; using SELECT-then-write upserts")
+    _bulk_upsert_supported = False
+
+
+def _upsert_row_values(record: Dict, name: str, addr: str) -> Tuple:
+    """_BULK_UPSERT_SQL VALUES 한 행 (_UPSERT_COLUMNS 순서, 신규 생성 시 upsert_restaurant_record와 같은 값)"""
+    price = record.get("price")
+    return (
+        name,
+        addr,
+        record.get("lat", 0.0),
+        record.get("lng", 0.0),
+        record.get("res_phone"),
+        record.get("category"),
+        price,
+        record.get("score", 0.0),
+        record.get("people_count") or None,
+        price or None,
+        price or None,
+        price or None,
+        1 if price else 0,
+    )
+
+
+def _new_batch_row(record: Dict) -> Dict:
+    """배치 안 (이름, 주소)별 누적 행 (첫 레코드 기준, _fold_batch_record로 반복 레코드를 합침)"""
+    price = record.get("price")
+    priced = bool(price and price > 0)
+    return {
+        "lat": record.get("lat", 0.0),
+        "lng": record.get("lng", 0.0),
+        "res_phone": record.get("res_phone"),
+        "category": record.get("category"),
+        "price": price,
+        "score": record.get("score", 0.0),
+        "people_count": record.get("people_count"),
+        "price_min": price if priced else None,
+        "price_max": price if priced else None,
+        "price_sum": price if priced else 0,
+        "price_count": 1 if priced else 0,
+    }
+
+
+def _fold_batch_record(row: Dict, record: Dict) -> bool:
+    """
+    같은 배치에서 반복된 (이름, 주소) 레코드를 row에 합침 → 바뀐 값이 있으면 True
+    (한 문장에서 같은 키를 두 번 갱신할 수 없으므로 ON CONFLICT 규칙을 미리 적용:
+     빈 값만 채우고, 가격은 min/max/합계/개수로 누적 → 정수 평균 절사 외에는 배치 경계와 무관)
+    """
+    changed = False
+
+    lat, lng = record.get("lat") or 0, record.get("lng") or 0
+    if lat and lng and not (row["lat"] and row["lng"]):
+        row["lat"], row["lng"] = lat, lng
+        changed = True
+
+    for key in ("people_count", "category", "res_phone"):
+        if record.get(key) and not row[key]:
+            row[key] = record[key]
+            changed = True
+
+    price = record.get("price")
+    if price and price > 0:
+        if row["price_count"]:
+            row["price_min"] = min(row["price_min"], price)
+            row["price_max"] = max(row["price_max"], price)
+        else:
+            row["price_min"] = row["price_max"] = price
+        row["price_sum"] += price
+        row["price_count"] += 1
+        changed = True
+
+    return changed
+
+
+def _batch_row_values(row: Dict, name: str, addr: str) -> Tuple:
+    """누적 행 → _BULK_UPSERT_SQL VALUES 한 행 (레코드 하나뿐이면 _upsert_row_values와 같은 값)"""
+    count = row["price_count"]
+    avg = int(row["price_sum"] / count) if count else None
+    return (
+        name,
+        addr,
+        row["lat"],
+        row["lng"],
+        row["res_phone"],
+        row["category"],
+        avg if count else row["price"],
+        row["score"],
+        row["people_count"] or None,
+        row["price_min"],
+        row["price_max"],
+        avg,
+        count,
+    )
+
+
+def _execute_upsert_values(values: List[Tuple]) -> Tuple[int, int]:
+    """_BULK_UPSERT_SQL 1회 실행 (커밋은 호출 측) → (created, updated)"""
+    cursor = db.session.connection().connection.cursor()
+    try:
+        rows = execute_values(
+            cursor, _BULK_UPSERT_SQL, values,
+            page_size=len(values), fetch=True,
+        )
+    finally:
+        cursor.close()
+    return rows[0]
+
+
+def bulk_upsert_restaurant_records(
+    records: List[Dict],
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    배치 업서트 (배치당 SQL 1회 + 커밋 1회)
+    - records[start:end] 범위를 복사 없이 그대로 순회
+    - 이름/주소가 모두 있는 레코드만 ON CONFLICT 경로 (배치 안 같은 키는 한 행으로 합침)
+    - 나머지(이름만/주소만)와 실패 시에는 upsert_restaurant_record로 처리
+    Returns: {"created", "updated", "skipped", "errors"}
+    """
+    result = {"created": 0, "updated": 0, "skipped": 0, "errors": 0}
+    rows: Dict[Tuple[str, str], Dict] = {}
+    folded = 0
+    fallback: Any = []
+
+    for record in islice(records, start, end):
+        name = (record.get("res_name") or "")[:64].strip()
+        addr = (record.get("address") or "")[:255].strip()
+
+        if not (_bulk_upsert_supported and name and addr):
+            fallback.append(record)
+            continue
+
+        if len(name) < 2:
+            result["errors"] += 1
+            log.debug(f"Error: Name too short: {name}")
+            continue
+
+        # 같은 문장 안에서 같은 키를 두 번 갱신할 수 없음 → 한 행으로 합쳐서 전송
+        row = rows.get((name, addr))
+        if row is None:
+            rows[(name, addr)] = _new_batch_row(record)
+        elif _fold_batch_record(row, record):
+            folded += 1
+        else:
+            result["skipped"] += 1
+
+    if rows:
+        values = [_batch_row_values(row, name, addr) for (name, addr), row in rows.items()]
+        try:
+            created, updated = _execute_upsert_values(values)
+            db.session.commit()
+
+            result["created"] += created
+            result["updated"] += updated + folded
+            result["skipped"] += len(values) - created - updated
+        except Exception as e:
+            db.session.rollback()
+            # 42P10: ON CONFLICT 대상 유니크 인덱스 없음 → 이번 실행 동안 배치 경로 비활성화
+            if getattr(e, "pgcode", None) == "42P10":
+                _disable_bulk_upsert()
+            log.warning(f"Bulk upsert failed, falling back to per-row upsert: {str(e)[:100]}")
+            result = {"created": 0, "updated": 0, "skipped": 0, "errors": 0}
+            fallback = islice(records, start, end)
+
+    for record in fallback:
+        created, updated, error = upsert_restaurant_record(record)
+        if error:
+            result["errors"] += 1
+            log.debug(f"Error: {error}")
+        elif created:
+            result["created"] += 1
+        elif updated:
+            result["updated"] += 1
+        else:
+            result["skipped"] += 1
+
+    return result
 # ============================================
 # RestaurantInfo 보정용 (주소 / 상호명 채우기)
 # ============================================
@@ -1709,14 +2041,128 @@ def repair_restaurant_info(
 # ============================================
 # 메인 처리 함수
 # ============================================
+def _iter_parsed_files(
+    files: List[str],
+    pool_type: str = "auto",
+) -> Iterator[Tuple[str, List[Dict], Optional[Exception]]]:
+    """
+    파일별 파싱 결과를 완료 순서대로 yield: (filepath, records, error)
+    - "process": ProcessPoolExecutor (CPU 위주 파싱)
+    - "thread": ThreadPoolExecutor (파일/네트워크 I/O 위주)
+    - "auto": 처음 POOL_PROBE_FILES개를 동기 실행하며 CPU 시간 비율을 재고 결정
+    """
+    pending = list(files)
+
+    if pool_type == "auto":
+        cpu_used = wall_used = 0.0
+        for filepath in pending[:POOL_PROBE_FILES]:
+            cpu0, wall0 = time.process_time(), time.perf_counter()
+            try:
+                records, error = _worker_parse_and_process(filepath, None), None
+            except Exception as e:
+                records, error = [], e
+            cpu_used += time.process_time() - cpu0
+            wall_used += time.perf_counter() - wall0
+            yield filepath, records, error
+        pending = pending[POOL_PROBE_FILES:]
+
+        ratio = cpu_used / wall_used if wall_used > 0 else 0.0
+        pool_type = "process" if ratio > POOL_CPU_RATIO else "thread"
+        log.info(f"[pool] cpu/wall ratio={ratio:.2f} → {pool_type} pool")
+
+    if not pending:
+        return
+
+    if pool_type == "thread":
+        # I/O 대기가 대부분이면 GIL 영향이 작으므로 스레드를 넉넉히
+        executor = ThreadPoolExecutor(max_workers=min(32, (multiprocessing.cpu_count() or 2) * 4))
+    else:
+        executor = ProcessPoolExecutor(max_workers=max(1, (multiprocessing.cpu_count() or 2) - 1))
+
+    # 스레드 풀은 같은 메모리를 쓰므로 압축하면 손해 → 프로세스 풀 + lz4 설치 시에만
+    compress = pool_type != "thread" and lz4 is not None
+
+    with executor:
+        # 각 파일에 대해 워커 제출
+        future_to_file = {
+            executor.submit(_worker_parse_and_process, filepath, None, compress): filepath
+            for filepath in pending
+        }
+
+        # 완료된 future부터 순서대로 처리
+        for future in as_completed(future_to_file):
+            filepath = future_to_file[future]
+            try:
+                yield filepath, _unpack_records(future.result()), None
+            except Exception as e:
+                yield filepath, [], e
+
+def _file_fingerprint(filepath: str) -> int:
+    """경로 + 크기 + 수정 시각 기반 64bit 지문 (내용이 바뀐 파일은 다시 처리됨)"""
+    st = os.stat(filepath)
+    raw = f"{os.path.abspath(filepath)}\x1f{st.st_size}\x1f{st.st_mtime_ns}".encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(raw, digest_size=8).digest(), "little")
+
+
+def _load_dedup_cache(path: str) -> Set[int]:
+    """append-only uint64 파일 → set (없거나 깨진 꼬리는 무시)"""
+    fps = array("Q")
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return set()
+    usable = len(data) - len(data) % fps.itemsize
+    fps.frombytes(data[:usable])
+    return set(fps)
+
+
+def _append_dedup_cache(path: str, fingerprints: List[int]) -> None:
+    if not fingerprints:
+        return
+    with open(path, "ab") as f:
+        # 중간에 끊긴 쓰기로 남은 꼬리 바이트는 잘라서 8바이트 정렬 유지
+        tail = f.tell() % 8
+        if tail:
+            f.truncate(f.tell() - tail)
+            f.seek(0, os.SEEK_END)
+        array("Q", fingerprints).tofile(f)
+
+
+def _report_progress_loop(
+    stats: Dict[str, int],
+    progress: Dict[str, int],
+    total_files: int,
+    start_time: float,
+    stop_event: threading.Event,
+) -> None:
+    """5초마다 진행 상황 출력 (카운터는 메인 스레드만 쓰고 여기서는 읽기만)"""
+    while not stop_event.wait(5.0):
+        elapsed = time.time() - start_time
+        rate = stats["total_processed"] / elapsed if elapsed > 0 else 0.0
+        print(
+            f"📊 Progress: {progress['files_done']}/{total_files} files | "
+            f"Total: {stats['total_processed']} | "
+            f"Created: {stats['created']} | "
+            f"Updated: {stats['updated']} | "
+            f"Rate: {rate:.1f}/sec"
+        )
+
+
 def process_files_streaming(
     base_dir: str = PDF_BASE_DIR,
     limit: int = 0,
     batch_size: int = DEFAULT_BATCH_SIZE,
-    show_progress: bool = True
+    show_progress: bool = True,
+    pool_type: Literal["process", "thread", "auto"] = "auto",
+    dedup_cache_path: Optional[str] = None,
 ) -> Dict[str, int]:
     """
-    파일을 스트리밍 방식으로 처리하고 DB에 저장 (멀티프로세스 버전)
+    파일을 스트리밍 방식으로 처리하고 DB에 저장 (병렬 파싱 버전)
+
+    Args:
+        pool_type: 파싱 워커 풀 종류 ("auto"는 처음 몇 개 파일로 CPU 비중 측정 후 결정)
+        dedup_cache_path: 이전 실행에서 끝까지 처리한 파일 지문 캐시 (None이면 INIT_DEDUP_CACHE)
 
     Returns:
         통계 딕셔너리 (created, updated, skipped, errors)
@@ -1736,103 +2182,84 @@ def process_files_streaming(
         log.warning(f"No supported files found in {base_dir}")
         return stats
 
+    # 증분 실행: 이전 실행에서 끝까지 반영한 (변경 없는) 파일은 건너뜀
+    cache_path = DEDUP_CACHE_PATH if dedup_cache_path is None else dedup_cache_path
+    file_fps: Dict[str, int] = {}
+    done_fps: List[int] = []
+    if cache_path:
+        cached_fps = _load_dedup_cache(cache_path)
+        file_fps = {f: _file_fingerprint(f) for f in files}
+        files = [f for f in files if file_fps[f] not in cached_fps]
+        print(f"\n♻️  Dedup cache: {len(file_fps) - len(files)} unchanged files skipped")
+        if not files:
+            return stats
+
     print(f"\n🔍 Found {len(files)} files to process")
 
-    # 전역 중복 체크용 (이것도 메인 프로세스에서만 관리)
-    global_seen: Set[Tuple[str, str]] = set()
+    # 파일 간 중복 판정은 DB가 담당 (uq_name_addr + ON CONFLICT)
+    # → 메인 프로세스에 파일 간 상태를 들고 있지 않음
 
-    # 진행 표시용
+    # 진행 표시는 별도 데몬 스레드가 5초마다 카운터를 읽어 출력 (메인 루프는 카운터만 갱신)
     start_time = time.time()
-    last_report_time = start_time
-
-    # 멀티프로세스 워커 수 결정
-    max_workers = max(1, (multiprocessing.cpu_count() or 2) - 1)
-
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        # 각 파일에 대해 워커 제출
-        future_to_file = {
-            executor.submit(_worker_parse_and_process, filepath, None): filepath
-            for filepath in files
-        }
-
-        # 완료된 future부터 순서대로 처리
-        for idx, future in enumerate(as_completed(future_to_file), 1):
-            filepath = future_to_file[future]
-
-            try:
-                records = future.result()
-            except Exception as e:
-                log.error(f"Failed to process {filepath}: {e}")
-                stats["errors"] += 1
-                continue
-
-            if not records:
-                continue
-
-            # 전체 limit 적용
-            if limit > 0:
-                remaining_limit = limit - stats["total_processed"]
-                if remaining_limit <= 0:
-                    break
-                if remaining_limit < len(records):
-                    records = records[:remaining_limit]
-
-            # 중복 제거 (이름+주소 기준)
-            unique_records: List[Dict[str, Any]] = []
-            for rec in records:
-                key = (rec.get("res_name", ""), rec.get("address", ""))
-                if key not in global_seen:
-                    global_seen.add(key)
-                    unique_records.append(rec)
-
-            if not unique_records:
-                continue
+    progress: Dict[str, int] = {"files_done": 0}
+    stop_event = threading.Event()
+    if show_progress:
+        threading.Thread(
+            target=_report_progress_loop,
+            args=(stats, progress, len(files), start_time, stop_event),
+            daemon=True,
+        ).start()
+
+    batch_size = max(1, min(batch_size, SAFE_BATCH_SIZE))
+
+    for idx, (filepath, records, error) in enumerate(
+        _iter_parsed_files(files, pool_type), 1
+    ):
+        progress["files_done"] = idx
+        if error is not None:
+            log.error(f"Failed to process {filepath}: {error}")
+            stats["errors"] += 1
+            continue
 
-            # === 여기부터는 기존 DB 업서트 로직 그대로 사용 ===
-            for batch_start in range(0, len(unique_records), batch_size):
-                batch = unique_records[batch_start:batch_start + batch_size]
+        if not records:
+            if file_fps:
+                done_fps.append(file_fps[filepath])
+            continue
 
-                for record in batch:
-                    created, updated, error = upsert_restaurant_record(record)
+        # 전체 limit 적용 (슬라이스 대신 처리 범위만 줄임)
+        n_records = len(records)
+        truncated = False
+        if limit > 0:
+            remaining_limit = limit - stats["total_processed"]
+            if remaining_limit <= 0:
+                break
+            if remaining_limit < n_records:
+                n_records = remaining_limit
+                truncated = True
 
-                    if error:
-                        stats["errors"] += 1
-                        log.debug(f"Error: {error}")
-                    elif created:
-                        stats["created"] += 1
-                    elif updated:
-                        stats["updated"] += 1
-                    else:
-                        stats["skipped"] += 1
+        # 배치 단위 업서트 (배치당 SQL 1회, 인덱스 범위로 전달해 배치 리스트 복사 없음)
+        for batch_start in range(0, n_records, batch_size):
+            batch_end = min(batch_start + batch_size, n_records)
 
-                    stats["total_processed"] += 1
+            batch_stats = bulk_upsert_restaurant_records(records, batch_start, batch_end)
+            for k, v in batch_stats.items():
+                stats[k] += v
+            stats["total_processed"] += batch_end - batch_start
 
-                    # limit 초과 시 중단
-                    if limit > 0 and stats["total_processed"] >= limit:
-                        break
+            # limit 초과 시 중단
+            if limit > 0 and stats["total_processed"] >= limit:
+                break
 
-                if limit > 0 and stats["total_processed"] >= limit:
-                    break
+        # 파일 전체가 반영된 경우에만 캐시에 기록
+        if file_fps and not truncated:
+            done_fps.append(file_fps[filepath])
 
-            # 진행 상황 출력
-            if show_progress:
-                current_time = time.time()
-                if current_time - last_report_time >= 5.0:  # 5초마다
-                    elapsed = current_time - start_time
-                    rate = (
-                        stats["total_processed"] / elapsed if elapsed > 0 else 0.0
-                    )
-                    print(
-                        f"📊 Progress: {idx}/{len(files)} files | "
-                        f"Total: {stats['total_processed']} | "
-                        f"Created: {stats['created']} | "
-                        f"Updated: {stats['updated']} | "
-                        f"Rate: {rate:.1f}/sec"
-                    )
-                    last_report_time = current_time
+        if limit > 0 and stats["total_processed"] >= limit:
+            break
 
-            if limit > 0 and stats["total_processed"] >= limit:
-                break
+    stop_event.set()
+    if cache_path:
+        _append_dedup_cache(cache_path, done_fps)
 
     # 최종 보고
     if show_progress:
@@ -2023,8 +2450,12 @@ if __name__ == "__main__":
             elif command == "process":
                 # 전체 처리
                 limit = int(sys.argv[2]) if len(sys.argv) > 2 else 0
-                print(f"[INIT] Processing files with limit={limit}...")
-                process_files_streaming(limit=limit, show_progress=True)
+                pool_type = sys.argv[3] if len(sys.argv) > 3 else "auto"
+                if pool_type not in ("process", "thread", "auto"):
+                    print(f"Unknown pool type: {pool_type} (process | thread | auto)")
+                    sys.exit(1)
+                print(f"[INIT] Processing files with limit={limit}, pool={pool_type}...")
+                process_files_streaming(limit=limit, show_progress=True, pool_type=pool_type)
                 
             else:
                 print(f"Unknown command: {command}")
@@ -2032,7 +2463,7 @@ if __name__ == "__main__":
                 print("  test          - Test parsing")
                 print("  debug         - Debug mode with limited processing")
                 print("  repair [mode] [limit] [dry_run] - Repair restaurant data")
-                print("  process [limit] - Process all files")
+                print("  process [limit] [pool_type] - Process all files (pool_type: process | thread | auto)")
                 
         else:
             # 기본 실행: 전체 처리
@@ -9,6 +9,10 @@ db = SQLAlchemy()
 # 음식점 정보 테이블
 class RestaurantInfo(db.Model):
     __tablename__ = 'restaurant_info'
+    __table_args__ = (
+        # 업서트 충돌 대상 (init_data의 ON CONFLICT (res_name, address))
+        db.UniqueConstraint('res_name', 'address', name='uq_name_addr'),
+    )
     res_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     res_name = db.Column(db.String(64), nullable=False)
     address = db.Column(db.String(255), nullable=False)
@@ -43,8 +47,8 @@ class EmailVerification(db.Model):
     __tablename__ = 'email_verifications'
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String(128), nullable=False, unique=True)
-    code = db.Column(db.String(6), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
+    code_hash = db.Column(db.LargeBinary(32), nullable=False)  # sha256(code), 평문 코드는 저장하지 않음
+    created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow, index=True)
 
 # 리뷰 테이블
 class Review(db.Model):
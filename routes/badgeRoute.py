@@ -1,4 +1,6 @@
 from flask import Blueprint, request, jsonify
+from services.paginationUtil import keyset_enabled
+from routes.querySchemas import parse_qs, CursorPageQuery
 from services.badgeService import (
     create_badge_service,
     get_badges_by_restaurant_service,
@@ -23,10 +25,12 @@ def create_badge():
 # 특정 식당의 뱃지 목록(최근 발급순)
 @badge_bp.route("/badges/restaurant/<int:res_id>", methods=["GET"])
 def list_badges_by_restaurant(res_id):
-    page = request.args.get("page", default=1, type=int)
-    per_page = request.args.get("per_page", default=20, type=int)
+    params, err = parse_qs(CursorPageQuery)
+    if err:
+        return jsonify({"message": err}), 400
+    cursor = params.cursor if keyset_enabled() else None
 
-    result, msg, status = get_badges_by_restaurant_service(res_id, page, per_page)
+    result, msg, status = get_badges_by_restaurant_service(res_id, params.page, params.per_page, cursor)
     if status != 200:
         return jsonify({"message": msg}), status
     return jsonify(result), status
@@ -5,6 +5,7 @@ from services.locationService import (
     get_restaurants_nearby_service,
     geocode_address_service
 )
+from services.jsonUtil import fast_json
 
 location_bp = Blueprint("location", __name__)
 
@@ -32,7 +33,7 @@ def set_location_by_address():
 @location_bp.route("/restaurants/markers", methods=["GET"])
 def get_restaurant_markers():
     result, status = get_restaurant_markers_service()
-    return jsonify(result), status
+    return fast_json(result, status)
 
 from services.locationService import (
     set_location_service,
@@ -61,4 +62,4 @@ def get_restaurants_nearby():
     result, status = get_restaurants_nearby_service(radius)
     if status != 200:
         return jsonify({"message": result}), status
-    return jsonify(result), status
+    return fast_json(result, status)
@@ -0,0 +1,80 @@
+# routes/querySchemas.py
+# 목록 API 쿼리스트링 스키마 (msgspec)
+# - 문자열 → 숫자 변환/검증을 C 구현으로 한 번에 처리
+# - 숫자 필드의 빈 값(?min_score=)은 기존 request.args.get(type=...)처럼 "없음"으로 취급
+#   (문자열 필드는 빈 값 유지 - 예: ?cursor= 는 keyset 첫 페이지)
+
+from functools import lru_cache
+from typing import Optional, Tuple, Type, TypeVar
+
+import msgspec
+from flask import request
+
+T = TypeVar("T", bound=msgspec.Struct)
+
+
+@lru_cache(maxsize=None)
+def _str_fields(struct_cls) -> frozenset:
+    return frozenset(
+        f.name for f in msgspec.structs.fields(struct_cls) if f.type in (str, Optional[str])
+    )
+
+
+def parse_qs(struct_cls: Type[T]) -> Tuple[Optional[T], Optional[str]]:
+    """
+    request.args → struct_cls
+    Returns: (params, None) 또는 (None, 에러 메시지) → 라우트에서 400 응답
+    """
+    str_fields = _str_fields(struct_cls)
+    args = {k: v for k, v in request.args.items() if v != "" or k in str_fields}
+    try:
+        return msgspec.convert(args, struct_cls, strict=False), None
+    except msgspec.ValidationError as e:
+        return None, f"잘못된 쿼리 파라미터: {e}"
+
+
+class PageQuery(msgspec.Struct):
+    page: int = 1
+    per_page: int = 20
+
+    # 하위 스키마(CursorPageQuery/OrderedPageQuery)도 그대로 상속
+    def __post_init__(self):
+        self.page = max(self.page, 1)
+        self.per_page = min(max(self.per_page, 1), 100)
+
+
+class CursorPageQuery(PageQuery):
+    cursor: Optional[str] = None  # keyset 페이징 (KEYSET_PAGINATION=1 일 때만 사용)
+
+
+class OrderedPageQuery(CursorPageQuery):
+    order: str = "recent"
+
+
+class RestaurantListQuery(PageQuery):
+    search: str = ""
+    category: str = ""
+    min_score: Optional[float] = None
+    max_price: Optional[int] = None
+    lat: Optional[float] = None
+    lng: Optional[float] = None
+    radius: int = 1000  # 기본 1km
+    sort: str = "name_asc"
+    cursor: Optional[str] = None
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.search = self.search.strip()
+        self.category = self.category.strip()
+
+
+class NearbyQuery(msgspec.Struct):
+    lat: Optional[float] = None
+    lng: Optional[float] = None
+    radius: int = 1000
+    limit: int = 20
+    category: str = ""
+
+    def __post_init__(self):
+        self.category = self.category.strip()
+        self.limit = min(max(self.limit, 1), 100)
@@ -1,9 +1,26 @@
 # routes/restaurantRoutes.py
 
-from flask import Blueprint, request, jsonify
-from services.restaurantService import fetch_restaurant_detail_from_naver_service
+from flask import Blueprint, request, jsonify, current_app
+from services.restaurantService import (
+    fetch_restaurant_detail_from_naver_service,
+    postgis_available,
+    filter_within_radius,
+    order_by_distance,
+    distances_within_radius,
+    load_restaurants_with_distance,
+    restaurant_list_stmt,
+    approximate_restaurant_count,
+    top_categories,
+    RESTAURANT_LIST_COLUMNS,
+)
+from services.cacheService import cached
+from services.taskService import enqueue_fetch_restaurant_detail, get_task_status
+from services.jsonUtil import fast_json
+from routes.querySchemas import parse_qs, RestaurantListQuery, NearbyQuery
+from services.paginationUtil import paginate_stmt, keyset_enabled, keyset_page, decode_cursor
 from models import db, RestaurantInfo
 from sqlalchemy import func, or_
+from sqlalchemy.orm import load_only, raiseload
 
 restaurant_bp = Blueprint("restaurant", __name__)
 
@@ -21,10 +38,20 @@ def fetch_restaurant_detail():
         "lng": 126.xxx,
         "radius": 300  # 선택, 기본 300m
     }
+
+    FETCH_DETAIL_ASYNC=1 (+ rq, REDIS_URL)이면 워커 큐에 넣고 202 + task_id 반환
+    → GET /fetch-detail/<task_id>로 결과 조회
     """
     try:
         data = request.json or {}
 
+        task_id = enqueue_fetch_restaurant_detail(data)
+        if task_id is not None:
+            return jsonify({
+                "message": "음식점 정보 조회 작업이 등록되었습니다.",
+                "task_id": task_id,
+            }), 202
+
         result, msg, status = fetch_restaurant_detail_from_naver_service(data)
 
         if status not in (200, 201):
@@ -39,8 +66,37 @@ def fetch_restaurant_detail():
         return jsonify({"message": "음식점 정보 조회 실패", "error": str(e)}), 500
 
 
+# ✅ 상세정보 비동기 작업 결과 조회
+@restaurant_bp.route("/fetch-detail/<task_id>", methods=["GET"])
+def get_fetch_detail_task(task_id):
+    try:
+        status, payload = get_task_status(task_id)
+
+        if status is None:
+            return jsonify({"message": "작업을 찾을 수 없습니다."}), 404
+
+        if status == "failed":
+            return jsonify({"message": "음식점 정보 조회 실패", "status": status}), 500
+
+        if status != "finished":
+            return jsonify({"status": status}), 202
+
+        if payload["status"] not in (200, 201):
+            return jsonify({"status": status, "message": payload["message"]}), payload["status"]
+
+        return jsonify({
+            "status": status,
+            "message": payload["message"],
+            "data": payload["result"],
+        }), payload["status"]
+
+    except Exception as e:
+        return jsonify({"message": "작업 상태 조회 실패", "error": str(e)}), 500
+
+
 # ✅ 음식점 목록 조회 (검색/필터링)
 @restaurant_bp.route("/", methods=["GET"])
+@cached("restaurants:list", expire=30)
 def get_restaurants():
     """
     음식점 목록 조회 (검색, 필터링, 페이징)
@@ -54,28 +110,80 @@ def get_restaurants():
     - page: 페이지 번호 (기본 1)
     - per_page: 페이지당 항목 수 (기본 20, 최대 100)
     - sort: 정렬 기준 (score_desc, price_asc, price_desc, name_asc, distance)
+    - cursor: name_asc keyset 페이징 (KEYSET_PAGINATION=1 일 때, 빈 값이면 첫 페이지)
+              응답 pagination에 total 대신 next_cursor가 들어감
     """
     try:
         # 쿼리 파라미터 파싱
-        search = request.args.get('search', '').strip()
-        category = request.args.get('category', '').strip()
-        min_score = request.args.get('min_score', type=float)
-        max_price = request.args.get('max_price', type=int)
-        
+        params, err = parse_qs(RestaurantListQuery)
+        if err:
+            return jsonify({"message": err}), 400
+
+        search, category = params.search, params.category
+        min_score, max_price = params.min_score, params.max_price
+
         # 위치 기반 검색
-        lat = request.args.get('lat', type=float)
-        lng = request.args.get('lng', type=float)
-        radius = request.args.get('radius', 1000, type=int)  # 기본 1km
-        
+        lat, lng, radius = params.lat, params.lng, params.radius
+
         # 페이징
-        page = request.args.get('page', 1, type=int)
-        per_page = min(request.args.get('per_page', 20, type=int), 100)
-        
+        page, per_page = params.page, params.per_page
+
         # 정렬
-        sort = request.args.get('sort', 'name_asc')
+        sort = params.sort
+
+        # ✅ 일반 검색 (위치 기반이 아닌 경우): 컴파일 캐시되는 lambda_stmt로 조회
+        if lat is None or lng is None or sort != 'distance':
+            cursor = params.cursor
+            if keyset_enabled() and cursor is not None and sort == 'name_asc':
+                # keyset: OFFSET/COUNT 없이 (res_name, res_id) > 커서인 다음 행들
+                try:
+                    after = decode_cursor(cursor, 2) if cursor else None
+                except ValueError as e:
+                    return jsonify({"message": str(e)}), 400
+                stmt = restaurant_list_stmt(
+                    search, category, min_score, max_price, sort,
+                    debug=current_app.debug, after=after,
+                )
+                items, pagination = keyset_page(
+                    stmt, per_page, key=lambda r: (r.res_name, r.res_id)
+                )
+            else:
+                stmt = restaurant_list_stmt(
+                    search, category, min_score, max_price, sort, debug=current_app.debug
+                )
+                items, pagination = paginate_stmt(stmt, page, per_page)
 
-        # 쿼리 빌드
-        query = RestaurantInfo.query
+            # 결과 포맷팅
+            restaurants = []
+            for r in items:
+                restaurant_data = {
+                    "res_id": r.res_id,
+                    "res_name": r.res_name,
+                    "address": r.address,
+                    "lat": r.lat,
+                    "lng": r.lng,
+                    "res_phone": r.res_phone,
+                    "category": r.category,
+                    "price": r.price,
+                    "score": r.score,
+                    "price_min": r.price_min,
+                    "price_max": r.price_max,
+                    "price_avg": r.price_avg,
+                    "price_count": r.price_count,
+                }
+                restaurants.append(restaurant_data)
+
+            return fast_json({
+                "restaurants": restaurants,
+                "pagination": pagination,
+            })
+
+        # ✅ 위치 기반 검색 (거리순): PostGIS 헬퍼가 Query를 받으므로 ORM Query로 조회
+        # 쿼리 빌드 (응답에 쓰는 컬럼만 로드)
+        query = RestaurantInfo.query.options(load_only(*RESTAURANT_LIST_COLUMNS))
+        if current_app.debug:
+            # 개발 모드: 목록에서 관계 lazy load(N+1)가 일어나면 바로 에러
+            query = query.options(raiseload("*"))
 
         # 검색 필터
         if search:
@@ -104,129 +212,88 @@ def get_restaurants():
                 )
             )
 
-        # ✅ 위치 기반 검색인 경우 별도 처리
-        if lat is not None and lng is not None and sort == 'distance':
-            # 좌표가 있는 것만 먼저 필터링
-            query = query.filter(
-                RestaurantInfo.lat.isnot(None),
-                RestaurantInfo.lng.isnot(None)
-            )
-            
-            # 모든 결과를 가져와서 거리 계산
-            all_restaurants = query.all()
-            
-            from services.restaurantService import _haversine
-            restaurants_with_distance = []
-            
-            for r in all_restaurants:
-                distance = _haversine(lat, lng, r.lat, r.lng)
-                if distance <= radius:
-                    restaurants_with_distance.append({
-                        "restaurant": r,
-                        "distance": distance
-                    })
-            
-            # 거리순 정렬
-            restaurants_with_distance.sort(key=lambda x: x['distance'])
-            
+        # 좌표가 있는 것만 먼저 필터링
+        query = query.filter(
+            RestaurantInfo.lat.isnot(None),
+            RestaurantInfo.lng.isnot(None)
+        )
+        
+        if postgis_available():
+            # 반경 필터 + 거리순 정렬/페이징을 DB에서 처리
+            query = filter_within_radius(query, lat, lng, radius)
+            total = query.count()
+            pages = (total + per_page - 1) // per_page
+            paginated_items = [
+                {"restaurant": r, "distance": distance}
+                for r, distance in order_by_distance(query, lat, lng)
+                .offset(max(page - 1, 0) * per_page)
+                .limit(per_page)
+                .all()
+            ]
+        else:
+            # 좌표만 가져와 일괄 거리 계산 후, 현재 페이지 행만 로드
+            hits = distances_within_radius(query, lat, lng, radius)
+
             # 페이징 직접 처리
-            total = len(restaurants_with_distance)
+            total = len(hits)
             pages = (total + per_page - 1) // per_page
-            start = (page - 1) * per_page
+            start = max(page - 1, 0) * per_page
             end = start + per_page
-            
-            paginated_items = restaurants_with_distance[start:end]
-            
-            # 결과 포맷팅
-            restaurants = []
-            for item in paginated_items:
-                r = item["restaurant"]
-                restaurants.append({
-                    "res_id": r.res_id,
-                    "res_name": r.res_name,
-                    "address": r.address,
-                    "lat": r.lat,
-                    "lng": r.lng,
-                    "res_phone": r.res_phone,
-                    "category": r.category,
-                    "price": r.price,
-                    "score": r.score,
-                    "price_min": r.price_min,
-                    "price_max": r.price_max,
-                    "price_avg": r.price_avg,
-                    "price_count": r.price_count,
-                    "distance_m": round(item["distance"], 2),
-                })
-            
-            return jsonify({
-                "restaurants": restaurants,
-                "pagination": {
-                    "page": page,
-                    "per_page": per_page,
-                    "total": total,
-                    "pages": pages,
-                    "has_next": page < pages,
-                    "has_prev": page > 1,
-                }
-            }), 200
+
+            paginated_items = [
+                {"restaurant": r, "distance": distance}
+                for r, distance in load_restaurants_with_distance(hits[start:end])
+            ]
+
+        # 결과 포맷팅
+        restaurants = []
+        for item in paginated_items:
+            r = item["restaurant"]
+            restaurants.append({
+                "res_id": r.res_id,
+                "res_name": r.res_name,
+                "address": r.address,
+                "lat": r.lat,
+                "lng": r.lng,
+                "res_phone": r.res_phone,
+                "category": r.category,
+                "price": r.price,
+                "score": r.score,
+                "price_min": r.price_min,
+                "price_max": r.price_max,
+                "price_avg": r.price_avg,
+                "price_count": r.price_count,
+                "distance_m": round(item["distance"], 2),
+            })
         
-        # ✅ 일반 검색 (위치 기반이 아닌 경우)
-        else:
-            # 정렬
-            if sort == 'score_desc':
-                query = query.order_by(RestaurantInfo.score.desc().nullslast())
-            elif sort == 'price_asc':
-                query = query.order_by(RestaurantInfo.price_avg.asc().nullslast())
-            elif sort == 'price_desc':
-                query = query.order_by(RestaurantInfo.price_avg.desc().nullslast())
-            elif sort == 'name_asc':
-                query = query.order_by(RestaurantInfo.res_name.asc())
-            elif sort == 'name_desc':
-                query = query.order_by(RestaurantInfo.res_name.desc())
-            else:
-                query = query.order_by(RestaurantInfo.res_id.desc())
+        return fast_json({
+            "restaurants": restaurants,
+            "pagination": {
+                "page": page,
+                "per_page": per_page,
+                "total": total,
+                "pages": pages,
+                "has_next": page < pages,
+                "has_prev": page > 1,
+            }
+        })
 
-            # 페이징 실행
-            pagination = query.paginate(
-                page=page,
-                per_page=per_page,
-                error_out=False
-            )
+    except Exception as e:
+        return jsonify({"message": "음식점 목록 조회 실패", "error": str(e)}), 500
 
-            # 결과 포맷팅
-            restaurants = []
-            for r in pagination.items:
-                restaurant_data = {
-                    "res_id": r.res_id,
-                    "res_name": r.res_name,
-                    "address": r.address,
-                    "lat": r.lat,
-                    "lng": r.lng,
-                    "res_phone": r.res_phone,
-                    "category": r.category,
-                    "price": r.price,
-                    "score": r.score,
-                    "price_min": r.price_min,
-                    "price_max": r.price_max,
-                    "price_avg": r.price_avg,
-                    "price_count": r.price_count,
-                }
-                restaurants.append(restaurant_data)
 
-            return jsonify({
-                "restaurants": restaurants,
-                "pagination": {
-                    "page": pagination.page,
-                    "per_page": pagination.per_page,
-                    "total": pagination.total,
-                    "pages": pagination.pages,
-                    "has_next": pagination.has_next,
-                    "has_prev": pagination.has_prev,
-                }
-            }), 200
+# ✅ 음식점 개수 (대략값, pg_class 통계 기반)
+@restaurant_bp.route("/count/approx", methods=["GET"])
+def get_restaurant_count_approx():
+    """
+    keyset 목록은 total을 주지 않으므로, 전체 개수가 필요하면 여기서 대략값 조회
+    (마지막 ANALYZE/VACUUM 기준 추정치)
+    """
+    try:
+        return jsonify({"approx_total": approximate_restaurant_count()}), 200
 
     except Exception as e:
-        return jsonify({"message": "음식점 목록 조회 실패", "error": str(e)}), 500
+        return jsonify({"message": "음식점 개수 조회 실패", "error": str(e)}), 500
 
 
 # ✅ 특정 음식점 상세 조회
@@ -265,6 +332,7 @@ def get_restaurant_detail(res_id):
 
 # ✅ 주변 음식점 검색 (위치 기반)
 @restaurant_bp.route("/nearby", methods=["GET"])
+@cached("restaurants:nearby", expire=60)
 def get_nearby_restaurants():
     """
     현재 위치 기반 주변 음식점 검색
@@ -277,17 +345,18 @@ def get_nearby_restaurants():
     - category: 카테고리 필터
     """
     try:
-        lat = request.args.get('lat', type=float)
-        lng = request.args.get('lng', type=float)
-        radius = request.args.get('radius', 1000, type=int)
-        limit = min(request.args.get('limit', 20, type=int), 100)
-        category = request.args.get('category', '').strip()
+        params, err = parse_qs(NearbyQuery)
+        if err:
+            return jsonify({"message": err}), 400
+
+        lat, lng, radius = params.lat, params.lng, params.radius
+        limit, category = params.limit, params.category
 
         if lat is None or lng is None:
             return jsonify({"message": "lat, lng 파라미터가 필요합니다."}), 400
 
-        # DB에서 음식점 조회
-        query = RestaurantInfo.query.filter(
+        # DB에서 음식점 조회 (응답에 쓰는 컬럼만 로드)
+        query = RestaurantInfo.query.options(load_only(*RESTAURANT_LIST_COLUMNS)).filter(
             RestaurantInfo.lat.isnot(None),
             RestaurantInfo.lng.isnot(None)
         )
@@ -295,41 +364,42 @@ def get_nearby_restaurants():
         if category:
             query = query.filter(RestaurantInfo.category.ilike(f"%{category}%"))
 
-        restaurants = query.all()
-
-        # 거리 계산 및 필터링
-        from services.restaurantService import _haversine
-        nearby = []
-        
-        for r in restaurants:
-            distance = _haversine(lat, lng, r.lat, r.lng)
-            if distance <= radius:
-                nearby.append({
-                    "res_id": r.res_id,
-                    "res_name": r.res_name,
-                    "address": r.address,
-                    "lat": r.lat,
-                    "lng": r.lng,
-                    "res_phone": r.res_phone,
-                    "category": r.category,
-                    "price": r.price,
-                    "score": r.score,
-                    "price_avg": r.price_avg,
-                    "distance_m": round(distance, 2),
-                })
+        if current_app.debug:
+            query = query.options(raiseload("*"))
 
-        # 거리순 정렬
-        nearby.sort(key=lambda x: x['distance_m'])
-        
-        # limit 적용
-        nearby = nearby[:limit]
+        if postgis_available():
+            # 반경 필터 + KNN 정렬 + limit을 DB에서 처리
+            rows = order_by_distance(
+                filter_within_radius(query, lat, lng, radius), lat, lng
+            ).limit(limit).all()
+        else:
+            # 좌표만 가져와 일괄 거리 계산 후, limit 안쪽 행만 로드
+            rows = load_restaurants_with_distance(
+                distances_within_radius(query, lat, lng, radius)[:limit]
+            )
 
-        return jsonify({
+        nearby = []
+        for r, distance in rows[:limit]:
+            nearby.append({
+                "res_id": r.res_id,
+                "res_name": r.res_name,
+                "address": r.address,
+                "lat": r.lat,
+                "lng": r.lng,
+                "res_phone": r.res_phone,
+                "category": r.category,
+                "price": r.price,
+                "score": r.score,
+                "price_avg": r.price_avg,
+                "distance_m": round(distance, 2),
+            })
+
+        return fast_json({
             "restaurants": nearby,
             "count": len(nearby),
             "search_radius": radius,
             "center": {"lat": lat, "lng": lng}
-        }), 200
+        })
 
     except Exception as e:
         return jsonify({"message": "주변 음식점 검색 실패", "error": str(e)}), 500
@@ -337,32 +407,21 @@ def get_nearby_restaurants():
 
 # ✅ 음식점 통계 조회
 @restaurant_bp.route("/stats", methods=["GET"])
+@cached("restaurants:stats", expire=300)
 def get_restaurant_stats():
     """
     음식점 전체 통계
     """
     try:
-        total = db.session.query(func.count(RestaurantInfo.res_id)).scalar()
-        
-        avg_score = db.session.query(
-            func.avg(RestaurantInfo.score)
-        ).filter(RestaurantInfo.score.isnot(None)).scalar()
-        
-        avg_price = db.session.query(
-            func.avg(RestaurantInfo.price_avg)
-        ).filter(RestaurantInfo.price_avg.isnot(None)).scalar()
-
-        # 카테고리별 개수
-        categories = db.session.query(
-            RestaurantInfo.category,
-            func.count(RestaurantInfo.res_id).label('count')
-        ).filter(
-            RestaurantInfo.category.isnot(None)
-        ).group_by(
-            RestaurantInfo.category
-        ).order_by(
-            func.count(RestaurantInfo.res_id).desc()
-        ).limit(10).all()
+        # 개수/평균을 한 번에 (AVG는 NULL을 제외하므로 별도 필터 불필요)
+        total, avg_score, avg_price = db.session.query(
+            func.count(RestaurantInfo.res_id),
+            func.avg(RestaurantInfo.score),
+            func.avg(RestaurantInfo.price_avg),
+        ).one()
+
+        # 카테고리별 개수 (materialized view, 최대 5분 지연)
+        categories = top_categories(10)
 
         return jsonify({
             "total_restaurants": total,
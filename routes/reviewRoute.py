@@ -8,6 +8,10 @@ from services.reviewService import (
     get_restaurant_review_summary_service
 )
 
+from services.cacheService import cached
+from services.paginationUtil import keyset_enabled
+from routes.querySchemas import parse_qs, OrderedPageQuery
+
 review_bp = Blueprint("review", __name__)
 
 # 리뷰 생성
@@ -22,11 +26,14 @@ def create_review():
 # 특정 식당의 리뷰 목록
 @review_bp.route("/reviews/restaurant/<int:res_id>", methods=["GET"])
 def get_reviews_by_restaurant(res_id):
-    page = request.args.get("page", default=1, type=int)
-    per_page = request.args.get("per_page", default=20, type=int)
-    order = request.args.get("order", default="recent", type=str)
+    params, err = parse_qs(OrderedPageQuery)
+    if err:
+        return jsonify({"message": err}), 400
+    cursor = params.cursor if keyset_enabled() else None
 
-    result, msg, status = get_reviews_by_restaurant_service(res_id, page, per_page, order)
+    result, msg, status = get_reviews_by_restaurant_service(
+        res_id, params.page, params.per_page, params.order, cursor
+    )
     if status != 200:
         return jsonify({"message": msg}), status
     return jsonify(result), status
@@ -73,6 +80,7 @@ def delete_review(review_id):
 
 # 리뷰 요약(평균/개수/분포)
 @review_bp.route("/reviews/restaurant/<int:res_id>/summary", methods=["GET"])
+@cached("restaurants:review_summary", expire=60)
 def get_restaurant_review_summary(res_id):
     result, msg, status = get_restaurant_review_summary_service(res_id)
     if status != 200:
@@ -8,6 +8,7 @@ from services.suggestionService import (
     update_suggestion_service,
     delete_suggestion_service,
 )
+from routes.querySchemas import parse_qs, PageQuery
 
 # 이후 사용자 인증이 필요한 API에는 @login_required를 붙여 사용 가능
 
@@ -25,10 +26,11 @@ def create_suggestion():
 # 제보 목록(최근순)
 @suggestion_bp.route("/suggestions", methods=["GET"])
 def list_suggestions_recent():
-    page = request.args.get("page", default=1, type=int)
-    per_page = request.args.get("per_page", default=20, type=int)
+    params, err = parse_qs(PageQuery)
+    if err:
+        return jsonify({"message": err}), 400
 
-    result, msg, status = get_suggestions_recent_service(page, per_page)
+    result, msg, status = get_suggestions_recent_service(params.page, params.per_page)
     if status != 200:
         return jsonify({"message": msg}), status
     return jsonify(result), status
@@ -36,10 +38,11 @@ def list_suggestions_recent():
 # 특정 사용자 제보 목록
 @suggestion_bp.route("/suggestions/user/<int:user_id>", methods=["GET"])
 def list_suggestions_by_user(user_id):
-    page = request.args.get("page", default=1, type=int)
-    per_page = request.args.get("per_page", default=20, type=int)
+    params, err = parse_qs(PageQuery)
+    if err:
+        return jsonify({"message": err}), 400
 
-    result, msg, status = get_suggestions_by_user_service(user_id, page, per_page)
+    result, msg, status = get_suggestions_by_user_service(user_id, params.page, params.per_page)
     if status != 200:
         return jsonify({"message": msg}), status
     return jsonify(result), status
@@ -48,10 +51,11 @@ def list_suggestions_by_user(user_id):
 @suggestion_bp.route("/suggestions/search", methods=["GET"])
 def search_suggestions():
     q = request.args.get("q", type=str)
-    page = request.args.get("page", default=1, type=int)
-    per_page = request.args.get("per_page", default=20, type=int)
+    params, err = parse_qs(PageQuery)
+    if err:
+        return jsonify({"message": err}), 400
 
-    result, msg, status = search_suggestions_service(q, page, per_page)
+    result, msg, status = search_suggestions_service(q, params.page, params.per_page)
     if status != 200:
         return jsonify({"message": msg}), status
     return jsonify(result), status
@@ -8,6 +8,7 @@ from services.visitService import (
     delete_visit_service,
     get_visit_counts_by_day_service,
 )
+from routes.querySchemas import parse_qs, OrderedPageQuery
 
 # 이후 사용자 인증이 필요한 API에는 @login_required를 붙여 사용 가능
 
@@ -25,11 +26,13 @@ def create_visit():
 # 특정 식당의 방문 목록(최근 방문순 / oldest 지원)
 @visit_bp.route("/visits/restaurant/<int:res_id>", methods=["GET"])
 def list_visits_by_restaurant(res_id):
-    page = request.args.get("page", default=1, type=int)
-    per_page = request.args.get("per_page", default=20, type=int)
-    order = request.args.get("order", default="recent", type=str)
+    params, err = parse_qs(OrderedPageQuery)
+    if err:
+        return jsonify({"message": err}), 400
 
-    result, msg, status = get_visits_by_restaurant_service(res_id, page, per_page, order)
+    result, msg, status = get_visits_by_restaurant_service(
+        res_id, params.page, params.per_page, params.order
+    )
     if status != 200:
         return jsonify({"message": msg}), status
     return jsonify(result), status
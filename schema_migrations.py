@@ -0,0 +1,180 @@
+# schema_migrations.py
+# db.create_all()은 이미 있는 테이블을 변경하지 않으므로,
+# 운영 DB에 필요한 인덱스/제약은 여기서 멱등하게(IF NOT EXISTS) 적용한다.
+
+from sqlalchemy import text
+
+from models import db
+
+# (이름, DDL) - 위에서부터 순서대로 실행
+# CONCURRENTLY는 트랜잭션 밖에서만 가능하므로 AUTOCOMMIT 연결로 실행
+MIGRATIONS = [
+    (
+        "uq_name_addr",
+        "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_name_addr "
+        "ON restaurant_info (res_name, address)",
+    ),
+    # 위치 기반 조회: lat/lng에서 자동 계산되는 geography 컬럼 + SP-GiST 인덱스
+    # (PostGIS 확장이 없거나 권한이 없으면 실패 로그만 남고 Python 거리 계산으로 동작)
+    ("postgis", "CREATE EXTENSION IF NOT EXISTS postgis"),
+    (
+        "restaurant_info.geom",
+        "ALTER TABLE restaurant_info ADD COLUMN IF NOT EXISTS geom geography(Point, 4326) "
+        "GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(lng, lat), 4326)::geography) STORED",
+    ),
+    # 점 데이터는 SP-GiST가 GiST보다 작고 빠름 (ST_DWithin, <-> KNN 모두 지원)
+    (
+        "restaurant_geom_spgix",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS restaurant_geom_spgix "
+        "ON restaurant_info USING spgist (geom)",
+    ),
+    ("restaurant_geom_gix", "DROP INDEX CONCURRENTLY IF EXISTS restaurant_geom_gix"),
+    # 목록 검색: ILIKE '%검색어%'는 btree를 못 타므로 pg_trgm GIN 인덱스로 처리
+    ("pg_trgm", "CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+    (
+        "restaurant_name_trgm",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS restaurant_name_trgm "
+        "ON restaurant_info USING gin (res_name gin_trgm_ops)",
+    ),
+    (
+        "restaurant_addr_trgm",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS restaurant_addr_trgm "
+        "ON restaurant_info USING gin (address gin_trgm_ops)",
+    ),
+    (
+        "restaurant_category_trgm",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS restaurant_category_trgm "
+        "ON restaurant_info USING gin (category gin_trgm_ops)",
+    ),
+    # 목록 정렬/필터 (score_desc, price_asc/desc, min_score, max_price) - NULLS LAST까지 맞춰 정렬 생략
+    (
+        "restaurant_score_idx",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS restaurant_score_idx "
+        "ON restaurant_info (score DESC NULLS LAST)",
+    ),
+    (
+        "restaurant_price_avg_idx",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS restaurant_price_avg_idx "
+        "ON restaurant_info (price_avg ASC NULLS LAST)",
+    ),
+    # name_asc 목록 keyset 커서: WHERE (res_name, res_id) > ? ORDER BY res_name, res_id
+    (
+        "restaurant_name_id_idx",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS restaurant_name_id_idx "
+        "ON restaurant_info (res_name, res_id)",
+    ),
+    # 좌표 범위 조회 (근처 식당 바운딩 박스, 마커 클릭 상세): lat BETWEEN ? AND lng BETWEEN ?
+    (
+        "ix_restaurant_lat_lng",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_restaurant_lat_lng "
+        "ON restaurant_info (lat, lng)",
+    ),
+    # 식당별 뱃지 목록: WHERE res_id = ? ORDER BY issued_at DESC
+    (
+        "badge_res_issued_idx",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS badge_res_issued_idx "
+        "ON badges (res_id, issued_at DESC)",
+    ),
+    # 식당별 리뷰 최신순 keyset: WHERE res_id = ? AND (created_at, id) < ? ORDER BY created_at DESC, id DESC
+    (
+        "review_res_created_idx",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS review_res_created_idx "
+        "ON reviews (res_id, created_at DESC, id DESC)",
+    ),
+    # 리뷰 요약(avg/count/별점 분포): (res_id, rating)만으로 index-only scan
+    (
+        "review_res_rating_idx",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS review_res_rating_idx "
+        "ON reviews (res_id, rating)",
+    ),
+    # 방문 일자별 집계: WHERE res_id = ? AND visit_date BETWEEN ? GROUP BY visit_date
+    (
+        "visit_res_day_idx",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS visit_res_day_idx "
+        "ON visits (res_id, visit_date DESC)",
+    ),
+    # 이메일 인증 코드: 평문 code → sha256 code_hash (기존 행은 3분짜리 코드라 버림)
+    (
+        "email_verifications.code_hash",
+        "ALTER TABLE email_verifications ADD COLUMN IF NOT EXISTS code_hash bytea",
+    ),
+    (
+        "email_verifications plaintext rows",
+        "DELETE FROM email_verifications WHERE code_hash IS NULL",
+    ),
+    (
+        "email_verifications.code",
+        "ALTER TABLE email_verifications DROP COLUMN IF EXISTS code",
+    ),
+    (
+        "email_verifications.code_hash not null",
+        "ALTER TABLE email_verifications ALTER COLUMN code_hash SET NOT NULL",
+    ),
+    # 만료 코드 정리 작업(DELETE ... WHERE created_at < ?)용
+    # (now() 기준 부분 인덱스는 now()가 IMMUTABLE이 아니라 만들 수 없음)
+    (
+        "ix_email_verifications_created_at",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_email_verifications_created_at "
+        "ON email_verifications (created_at)",
+    ),
+    # 통계 API 상위 카테고리: 전체 GROUP BY 대신 5분마다 갱신되는 materialized view
+    (
+        "restaurant_category_counts",
+        "CREATE MATERIALIZED VIEW IF NOT EXISTS restaurant_category_counts AS "
+        "SELECT category, COUNT(*) AS c FROM restaurant_info "
+        "WHERE category IS NOT NULL GROUP BY category",
+    ),
+    # REFRESH ... CONCURRENTLY에 필요한 유니크 인덱스
+    (
+        "restaurant_category_counts_uidx",
+        "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS restaurant_category_counts_uidx "
+        "ON restaurant_category_counts (category)",
+    ),
+    # 생성 컬럼 백필/인덱스 추가 후 통계 갱신 → 플래너가 새 인덱스를 고르도록
+    ("analyze restaurant_info", "ANALYZE restaurant_info"),
+]
+
+
+def _drop_invalid_index(conn, name: str) -> None:
+    """CONCURRENTLY 빌드가 중간에 실패하면 INVALID 인덱스가 남아 IF NOT EXISTS에 걸리므로 정리"""
+    invalid = conn.execute(
+        text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {"name": name},
+    ).first()
+    if invalid:
+        conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+
+
+# 테이블에 의존하는 materialized view (db.drop_all() 전에 먼저 지워야 DROP TABLE이 거부되지 않음)
+DEPENDENT_VIEWS = ("restaurant_category_counts",)
+
+
+def drop_dependent_views() -> None:
+    """RESET_DB 경로에서 db.drop_all() 직전에 호출"""
+    if db.engine.dialect.name != "postgresql":
+        return
+
+    with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for name in DEPENDENT_VIEWS:
+            conn.execute(text(f'DROP MATERIALIZED VIEW IF EXISTS "{name}"'))
+            print(f"[DB] ✓ dropped view {name}")
+
+
+def apply_schema_migrations() -> None:
+    """앱 컨텍스트 안에서 db.create_all() 다음에 호출"""
+    if db.engine.dialect.name != "postgresql":
+        print("[DB] schema migrations skipped (not PostgreSQL)")
+        return
+
+    with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for name, ddl in MIGRATIONS:
+            try:
+                _drop_invalid_index(conn, name)
+                conn.execute(text(ddl))
+                print(f"[DB] ✓ migration {name}")
+            except Exception as e:
+                # 예: 기존 중복 데이터 때문에 유니크 인덱스 생성 실패 → 앱은 계속 기동
+                print(f"[DB] ✗ migration {name} failed: {e}")
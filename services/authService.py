@@ -1,12 +1,52 @@
 from models import db, User, EmailVerification
+from services.mailService import hash_code
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask_login import login_user
 import datetime
+import hmac
+
+try:
+    from argon2 import PasswordHasher  # argon2id 해시 (없으면 werkzeug pbkdf2)
+    from argon2.exceptions import VerificationError, InvalidHashError
+except ImportError:
+    PasswordHasher = None
+
+_ph = PasswordHasher() if PasswordHasher is not None else None
+
+
+# 비밀번호 해시/검증
+# - 신규 해시는 argon2id, 기존 werkzeug(pbkdf2/scrypt) 해시도 그대로 검증
+def hash_password(password):
+    if _ph is not None:
+        return _ph.hash(password)
+    return generate_password_hash(password)
+
+def verify_password(stored, password):
+    if stored.startswith("$argon2"):
+        if _ph is None:
+            return False
+        try:
+            return _ph.verify(stored, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return check_password_hash(stored, password)
+
+def _password_needs_rehash(stored):
+    if _ph is None:
+        return False
+    if not stored.startswith("$argon2"):
+        return True
+    return _ph.check_needs_rehash(stored)
 
 # 인증 코드 검증
 def verify_email_code(email, input_code):
-    record = EmailVerification.query.filter_by(email=email, code=input_code).first()
-    if not record:
+    # email(유니크 인덱스)로만 찾고, 코드는 해시를 상수 시간 비교
+    record = EmailVerification.query.filter_by(email=email).order_by(
+        EmailVerification.created_at.desc()
+    ).first()
+    if not record or input_code is None or not hmac.compare_digest(
+        record.code_hash, hash_code(input_code)
+    ):
         return False, "코드가 틀렸거나 존재하지 않습니다."
 
     if (datetime.datetime.utcnow() - record.created_at).total_seconds() > 180:
@@ -27,7 +67,7 @@ def register_user(data):
         user_id=data["user_id"],
         user_name=data["user_name"],
         user_nickname=data["user_nickname"],
-        password=generate_password_hash(data["password"]),
+        password=hash_password(data["password"]),
         email=data["email"]
     )
     db.session.add(user)
@@ -41,9 +81,17 @@ def login_user_by_credentials(user_id, password):
     if not user:
         return None, "아이디가 존재하지 않습니다.", 404
 
-    if not check_password_hash(user.password, password):
+    if not verify_password(user.password, password):
         return None, "비밀번호가 일치하지 않습니다.", 401
 
+    # 로그인 성공 시점에만 평문이 있으므로, 옛 해시(pbkdf2 등)는 여기서 argon2로 교체
+    if _password_needs_rehash(user.password):
+        try:
+            user.password = hash_password(password)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+
     login_user(user)
     return user, "로그인 성공!", 200
 
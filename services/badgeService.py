@@ -1,11 +1,30 @@
-from flask import session
+from flask import session, current_app
 import requests
-from sqlalchemy import func, literal
+from sqlalchemy import delete, func, insert, lambda_stmt, literal, select, tuple_, update
+from sqlalchemy.orm import raiseload
 from models import db, Badge, RestaurantInfo
+from services.cacheService import invalidate_restaurant_cache
+from services.restaurantService import restaurant_exists
+from services.paginationUtil import paginate_stmt, keyset_page, decode_datetime_cursor
 import os
 import math
 
 
+# RETURNING으로 돌려받을 컬럼 (issued_at은 server_default라 INSERT 후 재조회 없이 받음)
+_BADGE_RETURNING = (Badge.id, Badge.res_id, Badge.badge_type, Badge.description, Badge.issued_at)
+
+
+# 공통: 뱃지 직렬화 (ORM 객체, RETURNING Row 모두 가능)
+def _serialize_badge(b):
+    return {
+        "id": b.id,
+        "res_id": b.res_id,
+        "badge_type": b.badge_type,
+        "description": b.description,
+        "issued_at": b.issued_at.isoformat() if b.issued_at else None
+    }
+
+
 # 뱃지 생성
 def create_badge_service(data):
     res_id = data.get("res_id")
@@ -18,54 +37,67 @@ def create_badge_service(data):
         return None, "badge_type은 비어 있을 수 없습니다.", 400
 
     # FK 존재 확인
-    if RestaurantInfo.query.get(res_id) is None:
+    if not restaurant_exists(res_id):
         return None, "해당 res_id 식당이 존재하지 않습니다.", 404
 
     try:
-        b = Badge(
-            res_id=res_id,
-            badge_type=badge_type,
-            description=description
-        )
-        db.session.add(b)
+        row = db.session.execute(
+            insert(Badge)
+            .values(res_id=res_id, badge_type=badge_type, description=description)
+            .returning(*_BADGE_RETURNING)
+        ).one()
         db.session.commit()
+        invalidate_restaurant_cache()
 
-        return {
-            "id": b.id,
-            "res_id": b.res_id,
-            "badge_type": b.badge_type,
-            "description": b.description,
-            "issued_at": b.issued_at.isoformat() if b.issued_at else None
-        }, "뱃지가 발급되었습니다.", 201
+        return _serialize_badge(row), "뱃지가 발급되었습니다.", 201
     except Exception as e:
         db.session.rollback()
         return None, f"뱃지 생성 중 오류: {str(e)}", 500
 
 
 # 특정 식당의 뱃지 목록(최근 발급순)
-def get_badges_by_restaurant_service(res_id, page=1, per_page=20):
-    if RestaurantInfo.query.get(res_id) is None:
+# cursor가 주어지면 (issued_at, id) keyset 페이징 ("" = 첫 페이지, total 없음)
+def get_badges_by_restaurant_service(res_id, page=1, per_page=20, cursor=None):
+    if not restaurant_exists(res_id):
         return None, "해당 res_id 식당이 존재하지 않습니다.", 404
 
-    q = Badge.query.filter(Badge.res_id == res_id).order_by(Badge.issued_at.desc())
-    p = q.paginate(page=page, per_page=per_page, error_out=False)
-
-    items = []
-    for b in p.items:
-        items.append({
-            "id": b.id,
-            "res_id": b.res_id,
-            "badge_type": b.badge_type,
-            "description": b.description,
-            "issued_at": b.issued_at.isoformat() if b.issued_at else None
-        })
+    # lambda_stmt: SQL 컴파일은 최초 1회, 이후 res_id/limit/offset만 바인드
+    stmt = lambda_stmt(lambda: select(Badge).where(Badge.res_id == res_id))
+    if current_app.debug:
+        # 개발 모드: 목록에서 관계 lazy load(N+1)가 일어나면 바로 에러
+        stmt += lambda s: s.options(raiseload("*"))
+
+    if cursor is not None:
+        if cursor:
+            try:
+                after_ts, after_id = decode_datetime_cursor(cursor)
+            except ValueError as e:
+                return None, str(e), 400
+            stmt += lambda s: s.where(
+                tuple_(Badge.issued_at, Badge.id) < tuple_(after_ts, after_id)
+            )
+        stmt += lambda s: s.order_by(Badge.issued_at.desc(), Badge.id.desc())
+        rows, p = keyset_page(stmt, per_page, key=lambda b: (b.issued_at, b.id))
+    else:
+        stmt += lambda s: s.order_by(Badge.issued_at.desc())
+        rows, p = paginate_stmt(stmt, page, per_page)
+
+    items = [_serialize_badge(b) for b in rows]
+
+    if cursor is not None:
+        return {
+            "items": items,
+            "per_page": p["per_page"],
+            "next_cursor": p["next_cursor"],
+            "has_next": p["has_next"]
+        }, "뱃지 목록", 200
 
     return {
         "items": items,
         "page": page,
         "per_page": per_page,
-        "total": p.total,
-        "pages": p.pages
+        "total": p["total"],
+        "pages": p["pages"]
     }, "뱃지 목록", 200
 
 
@@ -74,75 +106,67 @@ def get_badge_detail_service(badge_id):
     b = Badge.query.get(badge_id)
     if not b:
         return None, "해당 뱃지가 존재하지 않습니다.", 404
-    return {
-        "id": b.id,
-        "res_id": b.res_id,
-        "badge_type": b.badge_type,
-        "description": b.description,
-        "issued_at": b.issued_at.isoformat() if b.issued_at else None
-    }, "뱃지 상세", 200
+    return _serialize_badge(b), "뱃지 상세", 200
 
 
 # 뱃지 수정(관리자 전용 가정)
+# 조회 없이 UPDATE ... RETURNING 한 번 (대상 행이 없으면 404)
 def update_badge_service(badge_id, data, is_admin=False):
-    b = Badge.query.get(badge_id)
-    if not b:
-        return None, "해당 뱃지가 존재하지 않습니다.", 404
-
     if not is_admin:
         return None, "관리자만 수정할 수 있습니다.", 403
 
-    changed = False
+    changes = {}
 
     if "badge_type" in data:
         new_type = (data.get("badge_type") or "").strip()
         if not new_type:
             return None, "badge_type은 비어 있을 수 없습니다.", 400
-        b.badge_type = new_type
-        changed = True
+        changes["badge_type"] = new_type
 
     if "description" in data:
-        b.description = data.get("description")
-        changed = True
+        changes["description"] = data.get("description")
 
     if "res_id" in data:
         new_res_id = data.get("res_id")
         if not new_res_id:
             return None, "res_id는 비어 있을 수 없습니다.", 400
-        if RestaurantInfo.query.get(new_res_id) is None:
+        if not restaurant_exists(new_res_id):
             return None, "해당 res_id 식당이 존재하지 않습니다.", 404
-        b.res_id = new_res_id
-        changed = True
+        changes["res_id"] = new_res_id
 
-    if not changed:
+    if not changes:
         return None, "변경할 필드가 없습니다.", 400
 
     try:
-        db.session.add(b)
+        row = db.session.execute(
+            update(Badge)
+            .where(Badge.id == badge_id)
+            .values(**changes)
+            .returning(*_BADGE_RETURNING)
+        ).first()
+        if row is None:
+            db.session.rollback()
+            return None, "해당 뱃지가 존재하지 않습니다.", 404
         db.session.commit()
-        return {
-            "id": b.id,
-            "res_id": b.res_id,
-            "badge_type": b.badge_type,
-            "description": b.description,
-            "issued_at": b.issued_at.isoformat() if b.issued_at else None
-        }, "뱃지가 수정되었습니다.", 200
+        return _serialize_badge(row), "뱃지가 수정되었습니다.", 200
     except Exception as e:
         db.session.rollback()
         return None, f"뱃지 수정 중 오류: {str(e)}", 500
 
 
 # 뱃지 삭제(관리자 전용 가정)
+# 조회 없이 DELETE ... RETURNING id 한 번 (대상 행이 없으면 404)
 def delete_badge_service(badge_id, is_admin=False):
-    b = Badge.query.get(badge_id)
-    if not b:
-        return None, "해당 뱃지가 존재하지 않습니다.", 404
-
     if not is_admin:
         return None, "관리자만 삭제할 수 있습니다.", 403
 
     try:
-        db.session.delete(b)
+        deleted_id = db.session.execute(
+            delete(Badge).where(Badge.id == badge_id).returning(Badge.id)
+        ).scalar()
+        if deleted_id is None:
+            db.session.rollback()
+            return None, "해당 뱃지가 존재하지 않습니다.", 404
         db.session.commit()
         return None, "뱃지가 삭제되었습니다.", 200
     except Exception as e:
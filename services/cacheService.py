@@ -0,0 +1,107 @@
+# services/cacheService.py
+# GET 응답 캐시 (Redis cache-aside)
+# - REDIS_URL이 없거나 redis 패키지가 없으면 캐시 없이 그대로 동작
+# - Redis 장애도 요청 실패로 이어지지 않도록 모든 호출을 삼킴
+
+import os
+import json
+import hashlib
+import functools
+
+from flask import request, current_app
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+_client = None
+
+
+def get_redis():
+    """REDIS_URL 기반 공용 클라이언트 (.env가 import 이후에 로드되므로 첫 호출 때 생성)"""
+    global _client
+    if _client is None and redis is not None:
+        url = os.environ.get("REDIS_URL")
+        if url:
+            _client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+    return _client
+
+
+def delete_pattern(pattern: str) -> int:
+    """pattern에 맞는 키 삭제 (SCAN 기반이라 KEYS처럼 서버를 막지 않음)"""
+    client = get_redis()
+    if client is None:
+        return 0
+    deleted = 0
+    try:
+        batch = []
+        for key in client.scan_iter(match=pattern, count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                deleted += client.delete(*batch)
+                batch = []
+        if batch:
+            deleted += client.delete(*batch)
+    except Exception as e:
+        current_app.logger.warning(f"[cache] delete_pattern({pattern}) failed: {e}")
+    return deleted
+
+
+def cache_get_json(key: str):
+    """JSON 값 조회 (없거나 Redis 미사용/장애면 None)"""
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        raw = client.get(key)
+    except Exception:
+        return None
+    return json.loads(raw) if raw is not None else None
+
+
+def cache_set_json(key: str, value, expire: int) -> None:
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.setex(key, expire, json.dumps(value, ensure_ascii=False))
+    except Exception:
+        pass
+
+
+def invalidate_restaurant_cache() -> None:
+    """음식점/리뷰/방문/뱃지 쓰기 후 호출 → restaurants:* 응답 캐시 전부 무효화"""
+    delete_pattern("restaurants:*")
+
+
+def cached(prefix: str, expire: int):
+    """
+    라우트 응답 캐시 데코레이터 (@bp.route 아래에 붙임)
+    - 키: {prefix}:{md5(request.full_path)} → 쿼리스트링별로 분리
+    - 200 응답 본문만 저장, 히트 시 SQL/직렬화 없이 바로 반환
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            client = get_redis()
+            if client is None:
+                return view(*args, **kwargs)
+
+            key = f"{prefix}:{hashlib.md5(request.full_path.encode('utf-8')).hexdigest()}"
+            try:
+                hit = client.get(key)
+            except Exception:
+                hit = None
+            if hit is not None:
+                return current_app.response_class(hit, status=200, mimetype="application/json")
+
+            resp = current_app.make_response(view(*args, **kwargs))
+            if resp.status_code == 200 and not resp.direct_passthrough:
+                try:
+                    client.setex(key, expire, resp.get_data())
+                except Exception:
+                    pass
+            return resp
+        return wrapper
+    return decorator
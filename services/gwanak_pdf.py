@@ -1,12 +1,37 @@
 from __future__ import annotations
-import os, re, time, random
+import os, re, time, random, shutil, threading
 from typing import Callable, Optional, Tuple, List, Dict
-from urllib.parse import urljoin, urlparse, urlunparse, unquote, parse_qs, urlunparse
+from urllib.parse import urljoin, urlsplit, urlunsplit, unquote, parse_qs, parse_qsl, SplitResult
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser  # 없으면 BeautifulSoup
+except ImportError:
+    HTMLParser = None
+
+try:
+    import lxml  # noqa: F401  (BeautifulSoup 백엔드로 html.parser보다 빠름)
+    _BS4_PARSER = "lxml"
+except ImportError:
+    _BS4_PARSER = "html.parser"
+
+try:
+    import ahocorasick  # pyahocorasick: 참석자 명단 키워드 다중 검색
+except ImportError:
+    ahocorasick = None
+
+try:
+    import aiohttp  # 있으면 게시글/첨부 다운로드를 단일 이벤트 루프에서 동시 처리
+except ImportError:
+    aiohttp = None
+
 BASE_LIST_URL = "https://www.ga21c.seoul.kr/kr/costBBS.do"
 DEFAULT_SAVE_DIR = os.path.join(os.getcwd(), "pdf_data", "관악구")
 
@@ -15,7 +40,9 @@ CONNECT_TIMEOUT = 15
 READ_TIMEOUT = 45
 
 ALLOWED_EXTS = {".xlsx", ".xls", ".pdf", ".hwp", ".hwpx", ".zip"}
+_ALLOWED_EXT_SUFFIXES = tuple(ALLOWED_EXTS)  # str.endswith용
 PDF_MAGIC = b"%PDF-"
+_COPY_CHUNK = 1 << 20  # 다운로드 본문 복사 블록 (1 MiB)
 ZIP_MAGIC = b"PK\x03\x04"
 
 ATTENDANCE_PAT = re.compile(
@@ -29,27 +56,58 @@ _ONCLICK_RE = re.compile(
     re.I
 )
 
+# 파일명/날짜/첨부 판별용 패턴 (호출마다 re 캐시 조회하지 않도록 모듈에서 한 번만 컴파일)
+_UNSAFE_CHARS_RE = re.compile(r"[\\/:*?\"<>|]+")
+_WS_RE = re.compile(r"\s+")
+_DATE_RE = re.compile(r"(\d{4})[-./](\d{1,2})[-./](\d{1,2})")
+_FILENAME_STAR_RE = re.compile(r"filename\*=\s*(?:UTF-8''|UTF-8'ko-kr')?([^;]+)", re.I)
+_FILENAME_QUOTED_RE = re.compile(r'filename\s*=\s*"([^"]+)"', re.I)
+_FILENAME_BARE_RE = re.compile(r'filename\s*=\s*([^;]+)', re.I)
+
 def _safe_name(s: str) -> str:
-    s = re.sub(r"[\\/:*?\"<>|]+", "_", (s or "").strip())
-    s = re.sub(r"\s+", " ", s)
+    s = _UNSAFE_CHARS_RE.sub("_", (s or "").strip())
+    s = _WS_RE.sub(" ", s)
     return s[:180] if s else "파일"
 
+# _unique_path 캐시: 디렉터리별 파일명 집합(scandir 1회) + (dir, stem, ext)별 다음 번호
+# 같은 제목 첨부가 K개면 exists()를 O(K²)번 하던 것을 O(1)로, 락 안에서 이름을 예약해 스레드 간 충돌도 방지
+_name_lock = threading.Lock()
+_dir_names: Dict[str, set] = {}
+_name_counter: Dict[Tuple[str, str, str], int] = {}
+
+def _reset_name_cache() -> None:
+    """실행 사이에 파일이 지워졌을 수 있으므로 run_gwanak 시작 시 비움"""
+    with _name_lock:
+        _dir_names.clear()
+        _name_counter.clear()
+
 def _unique_path(dirpath: str, filename: str) -> str:
     os.makedirs(dirpath, exist_ok=True)
     base = _safe_name(filename)
-    out  = os.path.join(dirpath, base)
-    if not os.path.exists(out):
-        return out
-    stem, ext = os.path.splitext(base)
-    i = 2
-    while True:
-        cand = os.path.join(dirpath, f"{stem}({i}){ext}")
-        if not os.path.exists(cand):
-            return cand
-        i += 1
+    with _name_lock:
+        names = _dir_names.get(dirpath)
+        if names is None:
+            with os.scandir(dirpath) as it:
+                names = {e.name for e in it}
+            _dir_names[dirpath] = names
+        if base not in names:
+            names.add(base)
+            return os.path.join(dirpath, base)
+        stem, ext = os.path.splitext(base)
+        key = (dirpath, stem, ext)
+        i = _name_counter.get(key, 2)
+        while f"{stem}({i}){ext}" in names:
+            i += 1
+        cand = f"{stem}({i}){ext}"
+        names.add(cand)
+        _name_counter[key] = i + 1
+        return os.path.join(dirpath, cand)
 
 def _parse_date_in_text(text: str) -> Optional[date]:
-    m = re.search(r"(\d{4})[-./](\d{1,2})[-./](\d{1,2})", text or "")
+    # 게시 날짜는 20xx년 → "20"이 없으면 정규식 없이 바로 None (날짜 없는 공지 행 등)
+    if not text or "20" not in text:
+        return None
+    m = _DATE_RE.search(text)
     if not m:
         return None
     yy, mo, dd = int(m.group(1)), int(m.group(2)), int(m.group(3))
@@ -67,21 +125,71 @@ def _cutoff_month_start(months: int) -> date:
         m += 12
     return date(y, m, 1)
 
-def _looks_like_attendance(s: Optional[str]) -> bool:
-    return bool(s and ATTENDANCE_PAT.search(s))
-
+# ATTENDANCE_PAT의 고정 문자열 버전: 앞부분 → \s* 뒤에 와야 하는 뒷부분 ("" = 앞부분만으로 일치)
+# (공백은 정규식이 \s*를 허용하는 자리에서만 건너뜀 → 두 경로의 판별 결과가 같음)
+_ATTENDANCE_WORDS = {
+    "참석자": "명단", "참가자": "명단", "참여자": "명단",
+    "출석": "현황", "참석": "현황",
+    "출석부": "", "attendee": "", "attendance": "",
+}
+_WS_RUN_RE = re.compile(r"\s*")
+
+if ahocorasick is not None:
+    _ATTENDANCE_AC = ahocorasick.Automaton()
+    for _kw, _rest in _ATTENDANCE_WORDS.items():
+        _ATTENDANCE_AC.add_word(_kw, _rest)
+    _ATTENDANCE_AC.make_automaton()
+
+    def _looks_like_attendance(s: Optional[str]) -> bool:
+        if not s:
+            return False
+        low = s.lower()
+        for end, rest in _ATTENDANCE_AC.iter(low):
+            if not rest or low.startswith(rest, _WS_RUN_RE.match(low, end + 1).end()):
+                return True
+        return False
+else:
+    def _looks_like_attendance(s: Optional[str]) -> bool:
+        return bool(s and ATTENDANCE_PAT.search(s))
+
+# 같은 URL(게시글 주소, referer 등)을 반복 파싱하므로 결과를 캐시 (params는 쓰지 않아 urlsplit)
+@lru_cache(maxsize=1024)
+def _cached_urlsplit(u: str) -> SplitResult:
+    return urlsplit(u)
+
+def _fast_urljoin(base_url: str, base_parts: SplitResult, href: str) -> str:
+    """게시판 링크 대부분인 '/경로' 형태는 문자열 결합, 나머지(상대/'..' 포함 등)는 urljoin"""
+    if href.startswith("/") and not href.startswith("//") and "/." not in href:
+        return f"{base_parts.scheme}://{base_parts.netloc}{href}"
+    return urljoin(base_url, href)
+
+# 목록 페이지를 넘기며 같은 게시글 주소를 반복해서 보므로 결과 캐시
+@lru_cache(maxsize=2048)
 def _normalize_view_url(u: str) -> str:
     try:
-        pu = urlparse(u)
+        pu = _cached_urlsplit(u)
         if ("costBBSview" in pu.path) and (not pu.path.startswith("/kr/")):
             new_path = "/kr" + pu.path if not pu.path.startswith("/kr") else pu.path
-            return urlunparse((pu.scheme, pu.netloc, new_path, pu.params, pu.query, pu.fragment))
+            return urlunsplit((pu.scheme, pu.netloc, new_path, pu.query, pu.fragment))
     except Exception:
         pass
     return u
 
-def _build_session(session: Optional[requests.Session] = None) -> requests.Session:
+# 연결 실패/429/5xx 재시도는 urllib3가 처리 (백오프 0.3s, 0.6s, 1.2s)
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET", "POST"],
+)
+
+def _build_session(session: Optional[requests.Session] = None, threads: int = 6) -> requests.Session:
     s = session or requests.Session()
+    # 기본 풀(pool_maxsize=10)은 스레드 수보다 작으면 연결을 버리고 TLS 핸드셰이크를 반복함
+    adapter = HTTPAdapter(pool_connections=max(1, threads), pool_maxsize=max(10, threads * 2),
+                          max_retries=_RETRY)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
     s.headers.update({
         "User-Agent": UA,
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -90,60 +198,141 @@ def _build_session(session: Optional[requests.Session] = None) -> requests.Sessi
     })
     return s
 
-def _fetch(session: requests.Session, url: str, params=None, referer: Optional[str]=None,
-           stream: bool=False, method: str="GET", data=None) -> Optional[requests.Response]:
+class RateLimiter:
+    """
+    모든 스레드/코루틴이 공유하는 요청 간격 제한 (초당 rps회)
+    - 호출마다 랜덤 sleep을 하는 대신, 다음 요청 가능 시각을 예약해 그때까지만 대기
+    """
+    def __init__(self, rps: float):
+        self.lock = threading.Lock()
+        self.next = 0.0
+        self.set_rate(rps)
+
+    def set_rate(self, rps: float) -> None:
+        self.min_interval = 1.0 / rps if rps and rps > 0 else 0.0
+
+    def _reserve(self) -> float:
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next)
+            self.next = slot + self.min_interval
+            return slot - now
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+DEFAULT_RPS = 10.0
+_rate_limiter = RateLimiter(DEFAULT_RPS)
+
+def _referer_headers(referer: Optional[str]) -> Dict[str, str]:
     headers = {}
     if referer:
         headers["Referer"] = referer
         try:
-            pu = urlparse(referer)
+            pu = _cached_urlsplit(referer)
             headers["Origin"] = f"{pu.scheme}://{pu.netloc}"
         except Exception:
             pass
-    for i in range(1, 4):
-        try:
-            if method.upper() == "POST":
-                r = session.post(url, params=params, data=data, headers=headers,
-                                 stream=stream, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
-            else:
-                r = session.get(url, params=params, headers=headers,
-                                stream=stream, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
-            if r.status_code == 200:
-                return r
-        except Exception:
-            pass
-        time.sleep(0.3 * i + random.random() * 0.3)
+    return headers
+
+def _fetch(session: requests.Session, url: str, params=None, referer: Optional[str]=None,
+           stream: bool=False, method: str="GET", data=None) -> Optional[requests.Response]:
+    """재시도는 세션 어댑터(_RETRY)에 맡기고 200 응답만 반환"""
+    headers = _referer_headers(referer)
+    _rate_limiter.acquire()
+    try:
+        if method.upper() == "POST":
+            r = session.post(url, params=params, data=data, headers=headers,
+                             stream=stream, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+        else:
+            r = session.get(url, params=params, headers=headers,
+                            stream=stream, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+    except Exception:
+        return None
+    if r.status_code == 200:
+        return r
+    r.close()
     return None
 
-def _fetch_list_page(session: requests.Session, page_index: int) -> Optional[str]:
+# 목록/본문 HTML은 bytes 그대로 파서에 넘김
+# (r.text는 charset 미선언 시 charset_normalizer 추측 + 큰 str 할당을 한 번 더 함)
+def _fetch_list_page(session: requests.Session, page_index: int) -> Optional[bytes]:
     r = _fetch(session, BASE_LIST_URL, params={"page": page_index}, referer=BASE_LIST_URL)
-    return r.text if r else None
+    return r.content if r else None
+
+_BASE_LIST_PARTS = urlsplit(BASE_LIST_URL)
+
+# HTML 파서 어댑터: 목록/본문 파싱 코드는 파서 종류와 무관하게 아래 함수만 사용
+if HTMLParser is not None:
+    def _parse_html(html):
+        # lexbor는 bytes를 항상 UTF-8로 읽으므로, UTF-8이 아니면(구형 EUC-KR 페이지) cp949로 풀어서 넘김
+        if isinstance(html, bytes):
+            try:
+                html = html.decode("utf-8")
+            except UnicodeDecodeError:
+                html = html.decode("cp949", errors="replace")
+        return HTMLParser(html)
+
+    def _select(node, css: str):
+        return node.css(css)
 
-def _parse_list(list_html: str) -> List[Dict]:
-    soup = BeautifulSoup(list_html, "html.parser")
+    def _select_one(node, css: str):
+        return node.css_first(css)
+
+    def _attr(node, name: str) -> str:
+        return node.attributes.get(name) or ""
+
+    def _text(node) -> str:
+        return node.text(deep=True, separator=" ", strip=True)
+else:
+    def _parse_html(html):
+        # bytes면 BeautifulSoup이 <meta charset>으로 인코딩 판별
+        return BeautifulSoup(html, _BS4_PARSER)
+
+    def _select(node, css: str):
+        return node.select(css)
+
+    def _select_one(node, css: str):
+        return node.select_one(css)
+
+    def _attr(node, name: str) -> str:
+        return node.get(name) or ""
+
+    def _text(node) -> str:
+        return node.get_text(" ", strip=True)
+
+def _parse_list(list_html: bytes) -> List[Dict]:
+    tree = _parse_html(list_html)
     rows: List[Dict] = []
 
-    for tr in soup.select("table tr"):
-        a = tr.select_one("a[href*='costBBSview']")
+    for tr in _select(tree, "table tr"):
+        a = _select_one(tr, "a[href*='costBBSview']")
         if not a:
             continue
-        href = (a.get("href") or "").strip()
-        title = a.get_text(" ", strip=True)
-        row_text = " ".join(td.get_text(" ", strip=True) for td in tr.find_all("td"))
-        d = _parse_date_in_text(row_text)
-        absu = _normalize_view_url(urljoin(BASE_LIST_URL, href))
+        href = _attr(a, "href").strip()
+        title = _text(a)
+        # 날짜 찾기용이므로 td마다 텍스트를 뽑아 잇지 않고 행 전체를 한 번에 순회
+        d = _parse_date_in_text(_text(tr))
+        absu = _normalize_view_url(_fast_urljoin(BASE_LIST_URL, _BASE_LIST_PARTS, href))
         rows.append({"title": title, "href": absu, "date": d})
 
     if not rows:
-        for li in soup.select("li"):
-            a = li.select_one("a[href*='costBBSview']")
+        for li in _select(tree, "li"):
+            a = _select_one(li, "a[href*='costBBSview']")
             if not a:
                 continue
-            href = (a.get("href") or "").strip()
-            title = a.get_text(" ", strip=True)
-            li_text = li.get_text(" ", strip=True)
+            href = _attr(a, "href").strip()
+            title = _text(a)
+            li_text = _text(li)
             d = _parse_date_in_text(li_text)
-            absu = _normalize_view_url(urljoin(BASE_LIST_URL, href))
+            absu = _normalize_view_url(_fast_urljoin(BASE_LIST_URL, _BASE_LIST_PARTS, href))
             rows.append({"title": title, "href": absu, "date": d})
 
     return rows
@@ -170,14 +359,15 @@ def _collect_recent_posts(session: requests.Session, months: int, max_pages: int
         page += 1
         if page > max_pages:
             break
-        time.sleep(0.12 + random.random() * 0.18)
     return posts
 
-def _fetch_post_html(session: requests.Session, view_url: str) -> Optional[str]:
+def _fetch_post_html(session: requests.Session, view_url: str) -> Optional[bytes]:
     r = _fetch(session, view_url, referer=BASE_LIST_URL)
-    return r.text if r else None
+    return r.content if r else None
 
-def _onclick_to_candidate_urls(base_url: str, atch: str, sn: str, nm: Optional[str]) -> List[str]:
+# 같은 게시글의 첨부는 base_url이 같고 onclick이 중복되는 경우가 많아 캐시 (tuple로 반환해 공유해도 안전)
+@lru_cache(maxsize=1024)
+def _onclick_to_candidate_urls(base_url: str, atch: str, sn: str, nm: Optional[str]) -> Tuple[str, ...]:
     qs_nm = f"&fileNm={nm}" if nm else ""
     base_candidates = [
         f"/kr/cmmn/file/fileDown.do?atchFileId={atch}&fileSn={sn}{qs_nm}",
@@ -185,33 +375,38 @@ def _onclick_to_candidate_urls(base_url: str, atch: str, sn: str, nm: Optional[s
         f"/cmmn/file/fileDown.do?atchFileId={atch}&fileSn={sn}{qs_nm}",
         f"/cmmn/file/download.do?atchFileId={atch}&fileSn={sn}{qs_nm}",
     ]
-    return [urljoin(base_url, c) for c in base_candidates]
+    base_parts = _cached_urlsplit(base_url)
+    return tuple(_fast_urljoin(base_url, base_parts, c) for c in base_candidates)
 
-def _collect_attachment_urls(post_html: str, base_url: str) -> List[Tuple[str, str]]:
-    soup = BeautifulSoup(post_html, "html.parser")
+def _collect_attachment_urls(post_html: bytes, base_url: str) -> List[Tuple[str, str]]:
+    tree = _parse_html(post_html)
     pairs: List[Tuple[str, str]] = []
+    base_parts = _cached_urlsplit(base_url)
 
     # href 직접 링크
-    for a in soup.select("a[href]"):
-        href = (a.get("href") or "").strip()
+    for a in _select(tree, "a[href]"):
+        href = _attr(a, "href").strip()
         if not href:
             continue
-        absu = urljoin(base_url, href)
+        absu = _fast_urljoin(base_url, base_parts, href)
         low = absu.lower()
-        if ("download.do" in low and "bbs_id=cost" in low) or re.search(r"\.(xlsx|xls|pdf|hwp|hwpx|zip)(\?|$)", low):
-            label = a.get_text(" ", strip=True) or os.path.basename(urlparse(absu).path)
+        # 첨부 확장자: 경로 끝 또는 쿼리 값 끝(…?file=a.pdf) - 정규식 대신 endswith(tuple)
+        if ("download.do" in low and "bbs_id=cost" in low) \
+                or low.endswith(_ALLOWED_EXT_SUFFIXES) \
+                or low.split("?", 1)[0].endswith(_ALLOWED_EXT_SUFFIXES):
+            label = _text(a) or os.path.basename(_cached_urlsplit(absu).path)
             if _looks_like_attendance(label) or _looks_like_attendance(absu):
                 continue
             pairs.append((absu, label))
 
     # onclick 패턴
-    for a in soup.select("a[onclick]"):
-        onclick = (a.get("onclick") or "").strip()
+    for a in _select(tree, "a[onclick]"):
+        onclick = _attr(a, "onclick").strip()
         m = _ONCLICK_RE.search(onclick)
         if not m:
             continue
         atch, sn, nm = m.group("atch"), m.group("sn"), m.group("nm")
-        label = a.get_text(" ", strip=True) or (nm or "첨부파일")
+        label = _text(a) or (nm or "첨부파일")
         for url in _onclick_to_candidate_urls(base_url, atch, sn, nm):
             pairs.append((url, label))
 
@@ -226,7 +421,7 @@ def _collect_attachment_urls(post_html: str, base_url: str) -> List[Tuple[str, s
 
 def _decode_disp_filename(headers) -> Optional[str]:
     disp = headers.get("Content-Disposition") or headers.get("content-disposition") or ""
-    m = re.search(r"filename\*=\s*(?:UTF-8''|UTF-8'ko-kr')?([^;]+)", disp, re.I)
+    m = _FILENAME_STAR_RE.search(disp)
     if m:
         raw = m.group(1).strip().strip('"')
         for enc in ("utf-8", "cp949"):
@@ -235,7 +430,7 @@ def _decode_disp_filename(headers) -> Optional[str]:
             except Exception:
                 pass
         return unquote(raw)
-    m = re.search(r'filename\s*=\s*"([^"]+)"', disp, re.I) or re.search(r'filename\s*=\s*([^;]+)', disp, re.I)
+    m = _FILENAME_QUOTED_RE.search(disp) or _FILENAME_BARE_RE.search(disp)
     if m:
         raw = m.group(1).strip().strip('"')
         for enc in ("utf-8", "cp949"):
@@ -246,43 +441,53 @@ def _decode_disp_filename(headers) -> Optional[str]:
         return raw
     return None
 
-def _ensure_allowed_or_guess(resp: requests.Response, url_hint_name: str):
-    ctype = (resp.headers.get("Content-Type") or "").lower()
-    name  = _decode_disp_filename(resp.headers) \
-            or os.path.basename(urlparse(url_hint_name).path) \
+def _classify_download(headers, url_hint_name: str, first: bytes) -> Optional[Tuple[str, str]]:
+    """응답 헤더 + 첫 청크로 (저장 파일명, 확장자) 결정, 허용 형식이 아니면 None"""
+    ctype = (headers.get("Content-Type") or "").lower()
+    name  = _decode_disp_filename(headers) \
+            or os.path.basename(_cached_urlsplit(url_hint_name).path) \
             or "download"
     root, ext = os.path.splitext(name)
     ext = ext.lower()
 
-    stream = resp.iter_content(chunk_size=8192)
-    try:
-        first = next(stream)
-    except StopIteration:
-        first = b""
-
     if ext in ALLOWED_EXTS:
-        return name, ext, first, stream
+        return name, ext
     if first.startswith(ZIP_MAGIC) or "zip" in ctype or "vnd.openxmlformats" in ctype or "excel" in ctype:
         guessed = ".xlsx"
         lname = name.lower()
         if "hwpx" in lname or "hwp.x" in lname:
             guessed = ".hwpx"
-        return (root or "download") + guessed, guessed, first, stream
+        return (root or "download") + guessed, guessed
     if first.startswith(PDF_MAGIC) or "pdf" in ctype:
-        return (root or "download") + ".pdf", ".pdf", first, stream
+        return (root or "download") + ".pdf", ".pdf"
     if "hwp" in ctype:
-        return (root or "download") + ".hwp", ".hwp", first, stream
+        return (root or "download") + ".hwp", ".hwp"
     return None
 
+def _ensure_allowed_or_guess(resp: requests.Response, url_hint_name: str):
+    """
+    매직 바이트 판별용으로 앞 8바이트만 읽고, 본문은 resp.raw(file-like)로 넘김
+    → 호출부에서 shutil.copyfileobj로 큰 블록 단위 복사 (iter_content 8KiB 루프 없음)
+    """
+    raw = resp.raw
+    raw.decode_content = True  # gzip 등 Content-Encoding은 raw.read에서 풀기
+    first = raw.read(8) or b""
+
+    checked = _classify_download(resp.headers, url_hint_name, first)
+    if not checked:
+        return None
+    name, ext = checked
+    return name, ext, first, raw
+
 def _try_get_then_post(session: requests.Session, att_url: str, referer: str, stream: bool=True) -> Optional[requests.Response]:
     r = _fetch(session, att_url, referer=referer, stream=stream, method="GET")
     if r and r.status_code == 200:
         return r
-    pu = urlparse(att_url)
+    pu = _cached_urlsplit(att_url)
     data = parse_qs(pu.query) if pu.query else None
     r2 = _fetch(
         session,
-        url=urlunparse((pu.scheme, pu.netloc, pu.path, "", "", "")),
+        url=urlunsplit((pu.scheme, pu.netloc, pu.path, "", "")),
         referer=referer,
         stream=stream,
         method="POST",
@@ -292,6 +497,35 @@ def _try_get_then_post(session: requests.Session, att_url: str, referer: str, st
         return r2
     return None
 
+def _final_name(prefix_name: str, post_title: str, link_label: str, fname: str) -> str:
+    prefer     = _safe_name(link_label) if link_label else _safe_name(fname)
+    final_name = f"{prefix_name} {_safe_name(post_title)}__{prefer}"
+
+    # prefer에 확장자가 없고 fname에는 있으면 붙여준다
+    if not os.path.splitext(final_name)[1]:
+        _, ext0 = os.path.splitext(fname)
+        if ext0:
+            final_name += ext0
+    return final_name
+
+def _head_filename(session: requests.Session, att_url: str, referer: str) -> Optional[str]:
+    """
+    HEAD로 Content-Disposition 파일명을 먼저 확인 (허용 확장자일 때만 반환)
+    - 405/미지원/파일명 없음이면 None → GET 후 앞 바이트로 판별하는 기존 경로
+    """
+    _rate_limiter.acquire()
+    try:
+        r = session.head(att_url, headers=_referer_headers(referer), allow_redirects=True,
+                         timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+    except Exception:
+        return None
+    if r.status_code != 200:
+        return None
+    name = _decode_disp_filename(r.headers)
+    if name and os.path.splitext(name)[1].lower() in ALLOWED_EXTS:
+        return name
+    return None
+
 def _download_one(
     session: requests.Session,
     att_url: str,
@@ -301,39 +535,39 @@ def _download_one(
     save_dir: str,
     prefix_name: str,
     log_fn: Callable[[str], None],
+    head_probe: bool = False,
 ) -> int:
     try:
-        r = _try_get_then_post(session, att_url, referer=referer, stream=True)
-        if not r:
-            log_fn(f"FAIL {att_url}")
+        if _looks_like_attendance(link_label) or _looks_like_attendance(att_url):
             return 0
 
-        disp_name = _decode_disp_filename(r.headers)
-        if _looks_like_attendance(link_label) or _looks_like_attendance(att_url) or _looks_like_attendance(disp_name):
+        # head_probe: 파일명이 확정되면 참석자 명단은 본문 GET 없이 거르고, 매직 바이트 판별도 생략
+        known = _head_filename(session, att_url, referer) if head_probe else None
+        if known and _looks_like_attendance(known):
             return 0
 
-        checked = _ensure_allowed_or_guess(r, att_url)
-        if not checked:
+        r = _try_get_then_post(session, att_url, referer=referer, stream=True)
+        if not r:
             log_fn(f"FAIL {att_url}")
             return 0
 
-        fname, _, first, stream = checked
-        prefer     = _safe_name(link_label) if link_label else _safe_name(fname)
-        final_name = f"{prefix_name} {_safe_name(post_title)}__{prefer}"
-
-        # prefer에 확장자가 없고 fname에는 있으면 붙여준다
-        if not os.path.splitext(final_name)[1]:
-            _, ext0 = os.path.splitext(fname)
-            if ext0:
-                final_name += ext0
-
-        save_to    = _unique_path(save_dir, final_name)
+        if known:
+            fname, first, stream = known, b"", r.raw
+            stream.decode_content = True
+        else:
+            if _looks_like_attendance(_decode_disp_filename(r.headers)):
+                return 0
+            checked = _ensure_allowed_or_guess(r, att_url)
+            if not checked:
+                log_fn(f"FAIL {att_url}")
+                return 0
+            fname, _, first, stream = checked
+
+        save_to    = _unique_path(save_dir, _final_name(prefix_name, post_title, link_label, fname))
         with open(save_to, "wb") as f:
             if first:
                 f.write(first)
-            for chunk in stream:
-                if chunk:
-                    f.write(chunk)
+            shutil.copyfileobj(stream, f, _COPY_CHUNK)
         log_fn(f"OK {os.path.basename(save_to)}")
         return 1
     except Exception:
@@ -346,6 +580,7 @@ def _process_post(
     save_dir: str,
     prefix_name: str,
     log_fn: Callable[[str], None],
+    head_probe: bool = False,
 ) -> int:
     title = item.get("title") or "제목없음"
     href  = item.get("href")
@@ -358,10 +593,136 @@ def _process_post(
     saved = 0
     for u, label in pairs:
         saved += _download_one(session, u, referer=href, post_title=title, link_label=label,
-                               save_dir=save_dir, prefix_name=prefix_name, log_fn=log_fn)
-        time.sleep(0.03 + random.random() * 0.07)
+                               save_dir=save_dir, prefix_name=prefix_name, log_fn=log_fn,
+                               head_probe=head_probe)
     return saved
 
+# ---- aiohttp 경로: 게시글 처리(본문 + 첨부 다운로드)를 이벤트 루프 하나에서 동시 실행 ----
+_AIO_CHUNK = 65536
+
+async def _afetch(session, url: str, params=None, referer: Optional[str]=None,
+                  method: str="GET", data=None):
+    """_RETRY와 같은 재시도 규칙(3회, 지수 백오프), 200 응답만 반환 (호출부에서 release)"""
+    headers = _referer_headers(referer)
+    for i in range(1, 4):
+        await _rate_limiter.aacquire()
+        try:
+            resp = await session.request(method, url, params=params, data=data, headers=headers)
+            if resp.status == 200:
+                return resp
+            resp.release()
+        except Exception:
+            pass
+        await asyncio.sleep(0.3 * i + random.random() * 0.3)
+    return None
+
+async def _atry_get_then_post(session, att_url: str, referer: str):
+    r = await _afetch(session, att_url, referer=referer, method="GET")
+    if r:
+        return r
+    pu = _cached_urlsplit(att_url)
+    data = parse_qsl(pu.query) if pu.query else None  # aiohttp 폼은 (key, value) 목록
+    return await _afetch(
+        session,
+        urlunsplit((pu.scheme, pu.netloc, pu.path, "", "")),
+        referer=referer,
+        method="POST",
+        data=data,
+    )
+
+async def _adownload_one(
+    session,
+    att_url: str,
+    referer: str,
+    post_title: str,
+    link_label: str,
+    save_dir: str,
+    prefix_name: str,
+    log_fn: Callable[[str], None],
+) -> int:
+    r = None
+    try:
+        r = await _atry_get_then_post(session, att_url, referer=referer)
+        if not r:
+            log_fn(f"FAIL {att_url}")
+            return 0
+
+        disp_name = _decode_disp_filename(r.headers)
+        if _looks_like_attendance(link_label) or _looks_like_attendance(att_url) or _looks_like_attendance(disp_name):
+            return 0
+
+        first = await r.content.read(8192)
+        checked = _classify_download(r.headers, att_url, first)
+        if not checked:
+            log_fn(f"FAIL {att_url}")
+            return 0
+
+        fname, _ = checked
+        save_to = _unique_path(save_dir, _final_name(prefix_name, post_title, link_label, fname))
+        # 로컬 디스크 쓰기는 청크당 짧으므로 루프에서 바로 씀 (네트워크 대기만 비동기)
+        with open(save_to, "wb") as f:
+            if first:
+                f.write(first)
+            async for chunk in r.content.iter_chunked(_AIO_CHUNK):
+                f.write(chunk)
+        log_fn(f"OK {os.path.basename(save_to)}")
+        return 1
+    except Exception:
+        log_fn(f"FAIL {att_url}")
+        return 0
+    finally:
+        if r is not None:
+            r.release()
+
+async def _aprocess_post(
+    session,
+    sem: asyncio.Semaphore,
+    item: Dict,
+    save_dir: str,
+    prefix_name: str,
+    log_fn: Callable[[str], None],
+) -> int:
+    title = item.get("title") or "제목없음"
+    href  = item.get("href")
+    async with sem:
+        r = await _afetch(session, href, referer=BASE_LIST_URL)
+        if not r:
+            return 0
+        try:
+            html = await r.read()
+        finally:
+            r.release()
+        pairs = _collect_attachment_urls(html, href)
+        saved = 0
+        for u, label in pairs:
+            saved += await _adownload_one(session, u, referer=href, post_title=title, link_label=label,
+                                          save_dir=save_dir, prefix_name=prefix_name, log_fn=log_fn)
+        return saved
+
+async def _process_posts_async(
+    sess: requests.Session,
+    posts: List[Dict],
+    save_dir: str,
+    threads: int,
+    prefix_name: str,
+    log_fn: Callable[[str], None],
+) -> int:
+    # 목록 수집에 쓴 requests 세션의 헤더/쿠키를 그대로 이어받음
+    connector = aiohttp.TCPConnector(limit=threads, limit_per_host=threads)
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers=dict(sess.headers),
+        cookies=sess.cookies.get_dict(),
+    ) as session:
+        sem = asyncio.Semaphore(threads)
+        results = await asyncio.gather(
+            *[_aprocess_post(session, sem, it, save_dir, prefix_name, log_fn) for it in posts],
+            return_exceptions=True,
+        )
+    return sum(int(r) for r in results if isinstance(r, int))
+
 def run_gwanak(
     months: int = 2,
     save_dir: Optional[str] = None,
@@ -369,23 +730,33 @@ def run_gwanak(
     prefix_name: str = "관악구의회",
     session: Optional[requests.Session] = None,
     logger: Optional[Callable[[str], None]] = None,
+    rps: float = DEFAULT_RPS,
+    head_probe: bool = False,
 ) -> Dict[str, int]:
     """
     관악구의회 업무추진비 게시판에서 최근 N개월 첨부 다운로드.
+    - aiohttp가 있으면 게시글 처리를 asyncio로 동시 실행 (threads = 동시 연결 수)
+    - 없으면 ThreadPoolExecutor(threads)
+    - rps: 사이트 전체 요청 상한(초당), 스레드 수와 무관하게 공유
+    - head_probe: 첨부마다 HEAD로 파일명 선확인 (requests 경로만, 요청 수가 늘어 기본 꺼짐)
     return: {"posts": 수집글수, "files": 저장파일수}
     """
     save_dir = save_dir or DEFAULT_SAVE_DIR
     os.makedirs(save_dir, exist_ok=True)
+    _reset_name_cache()
+    _rate_limiter.set_rate(rps)
 
-    sess = _build_session(session)
+    sess = _build_session(session, threads)
     log_fn = logger if logger else (lambda msg: print(msg, flush=True))
 
     posts = _collect_recent_posts(sess, months)
     ok = 0
     if posts:
-        if threads and threads > 1:
+        if aiohttp is not None and threads and threads > 1:
+            ok = asyncio.run(_process_posts_async(sess, posts, save_dir, threads, prefix_name, log_fn))
+        elif threads and threads > 1:
             with ThreadPoolExecutor(max_workers=threads) as ex:
-                futs = [ex.submit(_process_post, sess, it, save_dir, prefix_name, log_fn) for it in posts]
+                futs = [ex.submit(_process_post, sess, it, save_dir, prefix_name, log_fn, head_probe) for it in posts]
                 for fu in as_completed(futs):
                     try:
                         ok += int(fu.result() or 0)
@@ -393,7 +764,7 @@ def run_gwanak(
                         pass
         else:
             for it in posts:
-                ok += _process_post(sess, it, save_dir, prefix_name, log_fn)
+                ok += _process_post(sess, it, save_dir, prefix_name, log_fn, head_probe)
 
     return {"posts": len(posts), "files": ok}
 
@@ -410,5 +781,10 @@ if __name__ == "__main__":
     months  = _env_int("MONTHS", 2)
     threads = _env_int("THREADS", 6)
     save    = os.getenv("GWANAK_SAVE_DIR", DEFAULT_SAVE_DIR)
-    res = run_gwanak(months=months, save_dir=save, threads=threads)
+    try:
+        rps = float(os.getenv("GWANAK_RPS", "") or DEFAULT_RPS)
+    except ValueError:
+        rps = DEFAULT_RPS
+    head_probe = os.getenv("GWANAK_HEAD_PROBE", "0") == "1"
+    res = run_gwanak(months=months, save_dir=save, threads=threads, rps=rps, head_probe=head_probe)
     print(f"SUMMARY posts={res['posts']} files={res['files']}", flush=True)
@@ -0,0 +1,24 @@
+# services/jsonUtil.py
+# 큰 목록 응답용 JSON 직렬화 (orjson이 있으면 C 구현, 없으면 Flask 기본 JSON)
+
+from flask import current_app
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def fast_json(payload, status: int = 200, option: int = 0):
+    """
+    jsonify 대체: dict/list → Response
+    - orjson 출력은 UTF-8 그대로라 앱의 ensure_ascii=False 설정과 같은 결과
+    - option: orjson.OPT_* 플래그 (orjson 미설치 시 무시)
+    """
+    if orjson is None:
+        return current_app.json.response(payload), status
+    return current_app.response_class(
+        orjson.dumps(payload, option=option),
+        status=status,
+        mimetype="application/json",
+    )
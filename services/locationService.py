@@ -1,7 +1,8 @@
 from flask import session
 import requests
-from sqlalchemy import func, literal
+from sqlalchemy import func, literal, select
 from models import db, RestaurantInfo
+from services.restaurantService import postgis_available, filter_within_radius, order_by_distance
 import os
 import math
 
@@ -56,22 +57,22 @@ def geocode_address_service(address: str):
     except Exception as e:
         return None, f"에러 발생: {str(e)}", 500
 
+# 마커/좌표 상세는 필요한 컬럼만 SELECT → ORM 객체(identity map) 생성 없이 Row로 바로 직렬화
+_MARKER_COLUMNS = (
+    RestaurantInfo.res_id, RestaurantInfo.res_name, RestaurantInfo.lat, RestaurantInfo.lng,
+    RestaurantInfo.address, RestaurantInfo.category, RestaurantInfo.score,
+)
+_DETAIL_COLUMNS = (
+    RestaurantInfo.res_id, RestaurantInfo.res_name, RestaurantInfo.address,
+    RestaurantInfo.lat, RestaurantInfo.lng, RestaurantInfo.category,
+    RestaurantInfo.price, RestaurantInfo.score, RestaurantInfo.res_phone,
+)
+
 def get_restaurant_markers_service(limit=None):
-    q = RestaurantInfo.query
+    stmt = select(*_MARKER_COLUMNS)
     if limit:
-        q = q.limit(limit)
-    result = [
-        {
-            "res_id": r.res_id,
-            "res_name": r.res_name,
-            "lat": r.lat,
-            "lng": r.lng,
-            "address": r.address,
-            "category": r.category,
-            "score": r.score,
-        }
-        for r in q.all()
-    ]
+        stmt = stmt.limit(limit)
+    result = [row._asdict() for row in db.session.execute(stmt)]
     return result, 200
 
 def get_restaurant_detail_by_coords_service(lat, lng, tolerance=0.00005):
@@ -82,37 +83,26 @@ def get_restaurant_detail_by_coords_service(lat, lng, tolerance=0.00005):
         lng = float(lng)
     except:
         return None, "숫자여야 함", 400
-    r = (
-        RestaurantInfo.query
-        .filter(RestaurantInfo.lat.between(lat - tolerance, lat + tolerance))
-        .filter(RestaurantInfo.lng.between(lng - tolerance, lng + tolerance))
-        .first()
-    )
+    r = db.session.execute(
+        select(*_DETAIL_COLUMNS)
+        .where(RestaurantInfo.lat.between(lat - tolerance, lat + tolerance))
+        .where(RestaurantInfo.lng.between(lng - tolerance, lng + tolerance))
+        .limit(1)
+    ).first()
     if not r:
         return None, "해당 위치의 식당 없음", 404
-    return {
-        "res_id": r.res_id,
-        "res_name": r.res_name,
-        "address": r.address,
-        "lat": r.lat,
-        "lng": r.lng,
-        "category": r.category,
-        "price": r.price,
-        "score": r.score,
-        "res_phone": r.res_phone,
-    }, "식당 정보 조회 성공", 200
-
-
-# 하버사인 거리(km)
-def _haversine_km(lat1, lng1, lat2, lng2):
-    R = 6371.0
-    dlat = math.radians(lat2 - lat1)
-    dlng = math.radians(lng2 - lng1)
-    a = (math.sin(dlat/2)**2
-         + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2))
-         * math.sin(dlng/2)**2)
-    c = 2 * math.asin(math.sqrt(a))
-    return R * c
+    return r._asdict(), "식당 정보 조회 성공", 200
+
+
+# 하버사인 거리(km) - SQL 식 (DB에서 계산·정렬, Python으로 후보를 끌어오지 않음)
+# acos 인자는 부동소수 오차로 1을 살짝 넘을 수 있어 LEAST로 자름
+def _haversine_km_expr(lat, lng):
+    return (6371.0 * func.acos(func.least(1.0,
+        func.cos(func.radians(lat)) * func.cos(func.radians(RestaurantInfo.lat))
+        * func.cos(func.radians(RestaurantInfo.lng) - func.radians(lng))
+        + func.sin(func.radians(lat)) * func.sin(func.radians(RestaurantInfo.lat))
+    ))).label("distance_km")
+
 
 def get_restaurants_nearby_service(radius_km=3.0, limit=200):
     # 세션에서 위치 가져오기
@@ -131,35 +121,38 @@ def get_restaurants_nearby_service(radius_km=3.0, limit=200):
     if radius_km <= 0:
         return None, "반경(km)은 0보다 커야 합니다.", 400
 
-    # 1차: 바운딩 박스
-    lat_delta = radius_km / 111.0
-    lng_delta = radius_km / (111.0 * max(1e-6, math.cos(math.radians(lat))))
-
-    candidates = (RestaurantInfo.query
-                  .filter(RestaurantInfo.lat.between(lat - lat_delta, lat + lat_delta))
-                  .filter(RestaurantInfo.lng.between(lng - lng_delta, lng + lng_delta))
-                  .limit(limit * 5)
-                  .all())
+    if postgis_available():
+        # PostGIS: ST_DWithin(GiST 인덱스) + <-> KNN 정렬, 거리는 m 단위로 받음
+        q = db.session.query(RestaurantInfo)
+        q = filter_within_radius(q, lat, lng, radius_km * 1000)
+        rows = [(r, d / 1000.0) for r, d in order_by_distance(q, lat, lng).limit(limit).all()]
+    else:
+        # 1차: 바운딩 박스, 2차: SQL 하버사인 거리로 필터 + 정렬
+        lat_delta = radius_km / 111.0
+        lng_delta = radius_km / (111.0 * max(1e-6, math.cos(math.radians(lat))))
+        distance = _haversine_km_expr(lat, lng)
+        rows = (db.session.query(RestaurantInfo)
+                .add_columns(distance)
+                .filter(RestaurantInfo.lat.between(lat - lat_delta, lat + lat_delta))
+                .filter(RestaurantInfo.lng.between(lng - lng_delta, lng + lng_delta))
+                .filter(distance <= radius_km)
+                .order_by(distance)
+                .limit(limit)
+                .all())
 
-    # 2차: 하버사인 거리 계산 + 필터링
     results = []
-    for r in candidates:
-        d = _haversine_km(lat, lng, r.lat, r.lng)
-        if d <= radius_km:
-            results.append({
-                "res_id": r.res_id,
-                "res_name": r.res_name,
-                "address": r.address,
-                "lat": r.lat,
-                "lng": r.lng,
-                "category": r.category,
-                "price": r.price,
-                "score": r.score,
-                "res_phone": r.res_phone,
-                "distance_km": round(d, 3),
-            })
-
-    results.sort(key=lambda x: x["distance_km"])
-    results = results[:limit]
-
-    return results, 200
\ No newline at end of file
+    for r, d in rows:
+        results.append({
+            "res_id": r.res_id,
+            "res_name": r.res_name,
+            "address": r.address,
+            "lat": r.lat,
+            "lng": r.lng,
+            "category": r.category,
+            "price": r.price,
+            "score": r.score,
+            "res_phone": r.res_phone,
+            "distance_km": round(d, 3),
+        })
+
+    return results, 200
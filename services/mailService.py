@@ -1,24 +1,37 @@
 import random
+import hashlib
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app
 from flask_mail import Message, Mail
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from models import db, EmailVerification
 
 mail = Mail()
 
+# SMTP 전송(DNS/TLS/AUTH/DATA, 수백 ms~수 초)은 요청 스레드 밖에서
+_mail_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mail")
+
 def generate_code():
     return str(random.randint(1000, 9999))
 
+def hash_code(code) -> bytes:
+    """인증 코드 → sha256 digest (DB에는 이 값만 저장)"""
+    return hashlib.sha256(str(code).encode("utf-8")).digest()
+
 def send_verification_code(email):
     code = generate_code()
 
-    # 기존 기록 있으면 삭제
-    existing = EmailVerification.query.filter_by(email=email).first()
-    if existing:
-        db.session.delete(existing)
-        db.session.commit()
-
-    new_code = EmailVerification(email=email, code=code)
-    db.session.add(new_code)
+    # 기존 기록 삭제 + 새 코드 저장을 UPSERT 한 번으로 (email 유니크 제약 기준)
+    # created_at은 만료 검사와 같은 기준(UTC naive)으로 앱에서 채움
+    now = datetime.datetime.utcnow()
+    stmt = pg_insert(EmailVerification).values(
+        email=email, code_hash=hash_code(code), created_at=now
+    )
+    db.session.execute(stmt.on_conflict_do_update(
+        index_elements=[EmailVerification.email],
+        set_={"code_hash": stmt.excluded.code_hash, "created_at": stmt.excluded.created_at},
+    ))
     db.session.commit()
 
     # 이메일 전송
@@ -32,4 +45,14 @@ def send_verification_code(email):
         <p>이 코드는 3분간 유효합니다.</p>
         """
     )
-    mail.send(msg)
+    # 응답은 DB 저장까지만 기다리고 메일은 백그라운드 전송
+    _mail_executor.submit(_send_email_blocking, current_app._get_current_object(), msg)
+
+
+def _send_email_blocking(app, msg):
+    """워커 스레드: Flask-Mail은 current_app 설정을 읽으므로 앱 컨텍스트 안에서 전송"""
+    with app.app_context():
+        try:
+            mail.send(msg)
+        except Exception as e:
+            app.logger.error(f"[mail] 인증 메일 전송 실패 ({msg.recipients}): {e}")
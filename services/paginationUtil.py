@@ -0,0 +1,106 @@
+# services/paginationUtil.py
+# lambda_stmt 기반 목록 쿼리 페이징 (Query.paginate 대체)
+# - page/per_page: OFFSET + COUNT(*) (기존 응답 형식)
+# - cursor: 정렬 컬럼 + PK 기준 keyset 페이징 (KEYSET_PAGINATION=1 일 때만)
+
+import os
+import json
+import math
+import base64
+from datetime import datetime
+
+from sqlalchemy import func
+
+from models import db
+
+
+def count_stmt(stmt):
+    """목록 lambda_stmt → 같은 WHERE의 COUNT(*) lambda_stmt (ORDER BY 제거)"""
+    return stmt + (
+        lambda s: s.with_only_columns(func.count(), maintain_column_froms=True).order_by(None)
+    )
+
+
+def paginate_stmt(stmt, page: int, per_page: int):
+    """
+    Flask-SQLAlchemy paginate(error_out=False)와 같은 규칙으로 페이징
+    - page < 1 → 1, per_page < 1 → 20
+    Returns: (items, {"page", "per_page", "total", "pages", "has_next", "has_prev"})
+    """
+    page = page if page and page > 0 else 1
+    per_page = per_page if per_page and per_page > 0 else 20
+    offset = (page - 1) * per_page
+
+    total = db.session.execute(count_stmt(stmt)).scalar() or 0
+    items = db.session.execute(
+        stmt + (lambda s: s.limit(per_page).offset(offset))
+    ).scalars().all()
+
+    pages = math.ceil(total / per_page) if total else 0
+    return items, {
+        "page": page,
+        "per_page": per_page,
+        "total": total,
+        "pages": pages,
+        "has_next": page < pages,
+        "has_prev": page > 1,
+    }
+
+
+# ============================================
+# keyset(cursor) 페이징
+# ============================================
+def keyset_enabled() -> bool:
+    """기능 플래그 (.env가 import 이후에 로드되므로 호출 시점에 읽음)"""
+    return os.environ.get("KEYSET_PAGINATION", "0") == "1"
+
+
+def encode_cursor(*values) -> str:
+    """마지막 행의 (정렬값, PK) → URL-safe 문자열"""
+    raw = json.dumps(
+        [v.isoformat() if isinstance(v, datetime) else v for v in values],
+        ensure_ascii=False,
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """encode_cursor의 역변환 (형식이 틀리면 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception:
+        raise ValueError("잘못된 cursor입니다.")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("잘못된 cursor입니다.")
+    return values
+
+
+def decode_datetime_cursor(cursor: str) -> tuple:
+    """(datetime, id) 커서 (뱃지 issued_at, 리뷰 created_at 최신순용)"""
+    ts, pk = decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(ts), int(pk)
+    except (TypeError, ValueError):
+        raise ValueError("잘못된 cursor입니다.")
+
+
+def keyset_page(stmt, per_page: int, key):
+    """
+    stmt는 커서 조건(WHERE (정렬값, PK) > 커서)과 ORDER BY가 이미 붙은 lambda_stmt
+    - per_page + 1행을 읽어 다음 페이지 유무 판단 → COUNT(*)/OFFSET 없음
+    - key(row) → 다음 커서에 넣을 (정렬값, PK)
+    Returns: (items, {"per_page", "next_cursor", "has_next"})
+    """
+    per_page = per_page if per_page and per_page > 0 else 20
+    limit = per_page + 1
+
+    rows = db.session.execute(stmt + (lambda s: s.limit(limit))).scalars().all()
+    has_next = len(rows) > per_page
+    items = rows[:per_page]
+
+    return items, {
+        "per_page": per_page,
+        "next_cursor": encode_cursor(*key(items[-1])) if has_next else None,
+        "has_next": has_next,
+    }
@@ -17,72 +17,115 @@ import time
 import json
 import logging
 import hashlib
+import importlib.util
 import random
+import threading
+import asyncio
 import concurrent.futures
+from functools import lru_cache
+from types import MappingProxyType
+from itertools import islice
+from bisect import bisect_right
 from datetime import datetime, timedelta
+from email.message import Message
+from email.utils import collapse_rfc2231_value
 from urllib.parse import urljoin, urlparse, unquote, parse_qs, urlencode, quote
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING as URLLIB3_ACCEPT_ENCODING
 from bs4 import BeautifulSoup
-from typing import Dict, List, Tuple, Optional, Set, Any, Union
+from typing import Dict, List, Mapping, Tuple, Optional, Set, Any, Union
 import warnings
 warnings.filterwarnings('ignore')
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 
-EXECUTOR_KIND_DEFAULT = os.getenv("DOWNLOADER_EXECUTOR", "process").lower()
-RUNNING_IN_FLASK_DEFAULT = os.getenv("RUN_FROM_FLASK", "0").lower() in ("1", "true", "yes", "y")
+try:
+    import aiohttp  # 있으면 사이트/상세 페이지 조회를 이벤트 루프 하나에서 동시 처리
+except ImportError:
+    aiohttp = None
+
+# 사이트 처리는 네트워크 대기가 대부분 → aiohttp가 있으면 asyncio, 없으면 스레드 풀이 기본
+# (DOWNLOADER_EXECUTOR=async/thread/process로 선택, process는 CLI 전용)
+# 환경변수는 app.py가 import 직전에 설정하는 경우가 있어 다운로더 생성 시점에 읽음
+EXECUTOR_KIND_DEFAULT = "async" if aiohttp is not None else "thread"
+DETAIL_PAGE_CONCURRENCY = 4  # aiohttp 사용 시: 사이트 하나당 동시에 여는 상세 페이지 수
+THREAD_WORKERS_DEFAULT = 32
+PROCESS_WORKERS_DEFAULT = 4
+SITE_DOWNLOAD_WORKERS_DEFAULT = 4  # 사이트 하나에서 동시에 받는 파일 수
+HOST_INTERVAL_DEFAULT = 0.25  # 같은 호스트(netloc)에 보내는 요청 사이 최소 간격(초)
+
+def _executor_kind_from_env() -> str:
+    return os.getenv("DOWNLOADER_EXECUTOR", EXECUTOR_KIND_DEFAULT).lower()
+
+def _site_download_workers_from_env() -> int:
+    try:
+        return max(1, int(os.getenv("DOWNLOADER_SITE_WORKERS", SITE_DOWNLOAD_WORKERS_DEFAULT)))
+    except ValueError:
+        return SITE_DOWNLOAD_WORKERS_DEFAULT
 
-def process_sites_parallel(self, urls: List[str]) -> List[Dict]:
-    all_stats = []
+def _host_interval_from_env() -> float:
+    try:
+        return max(0.0, float(os.getenv("DOWNLOADER_HOST_INTERVAL", HOST_INTERVAL_DEFAULT)))
+    except ValueError:
+        return HOST_INTERVAL_DEFAULT
+
+def _running_in_flask_from_env() -> bool:
+    return os.getenv("RUN_FROM_FLASK", "0").lower() in ("1", "true", "yes", "y")
+
+# ---- 프로세스 모드: 워커 프로세스를 실행 간에 재사용 ----
+# 워커마다 다운로더(세션/매핑)를 initializer에서 한 번만 만들고, 작업은 URL만 넘김
+# (바운드 메서드를 넘기면 다운로더 전체를 매 작업 피클링해야 함)
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_KEY: Optional[Tuple[int, bool, str]] = None
+_WORKER_DL = None
+
+def _init_worker(use_selenium: bool, base_download_dir: str) -> None:
+    global _WORKER_DL
+    # 각 프로세스는 독립 다운로더(내부에서 다시 멀티 안씀), 저장 폴더는 부모와 동일하게
+    _WORKER_DL = CouncilFileDownloader(use_selenium=use_selenium, max_workers=1,
+                                       base_download_dir=base_download_dir)
+
+def _worker_process_site(url: str) -> dict:
+    return _WORKER_DL.process_site(url)
+
+def get_pool(max_workers: int, use_selenium: bool, base_download_dir: str) -> ProcessPoolExecutor:
+    """설정이 같으면 기존 풀 재사용, 바뀌면 새로 생성 (워커 기동 비용은 최초 1회)"""
+    global _POOL, _POOL_KEY
+    key = (max_workers, use_selenium, base_download_dir)
+    if _POOL is None or _POOL_KEY != key:
+        if _POOL is not None:
+            _POOL.shutdown(wait=True)
+        _POOL = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(use_selenium, base_download_dir),
+        )
+        _POOL_KEY = key
+    return _POOL
+
+# BeautifulSoup 백엔드: lxml(C 구현)이 있으면 사용, 없으면 html.parser
+try:
+    import lxml  # noqa: F401
+    _BS4_PARSER = "lxml"
+except ImportError:
+    _BS4_PARSER = "html.parser"
 
-    # 순차
-    if self.max_workers <= 1:
-        for i, url in enumerate(urls, 1):
-            logger.info(f"\n{'▶'*3} 진행: {i}/{len(urls)} ({i/len(urls)*100:.1f}%)")
-            stats = self.process_site(url)
-            all_stats.append(stats)
-            self.stats[stats['site_name']] = stats
-            if i < len(urls):
-                time.sleep(random.uniform(1.0, 2.0))
-        return all_stats
+# 파일 내용 해시 (xxh3_128이 MD5보다 수 배 빠름, 중복 판별용이라 암호학적 강도 불필요)
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
-    # ★ Flask 내부에서는 프로세스 풀 금지 → 스레드 풀 사용
-    if self.running_in_flask or self.executor_kind == "thread":
-        logger.info(f"🧵 ThreadPoolExecutor 사용 (workers={self.max_workers})")
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            if TQDM_AVAILABLE:
-                for stats in tqdm(executor.map(self.process_site, urls),
-                                  total=len(urls), desc="사이트 처리 중", unit="site"):
-                    all_stats.append(stats)
-            else:
-                for stats in executor.map(self.process_site, urls):
-                    all_stats.append(stats)
-        for st in all_stats:
-            self.stats[st['site_name']] = st
-        return all_stats
+def _new_content_hasher():
+    """내용 중복 판별용 해시 객체 (xxhash 없으면 blake2b-128, MD5보다 빠름)"""
+    return xxhash.xxh3_128() if xxhash is not None else hashlib.blake2b(digest_size=16)
 
-    # (옵션) 독립 프로세스 모드 — CLI에서만 (Flask X)
-    # 바운드 메서드 피클링을 피하기 위해 모듈 최상위 함수 사용
-    def _worker_payload(url):
-        return {"url": url, "use_selenium": self.use_selenium}
-
-    logger.info(f"⚙️ ProcessPoolExecutor 사용 (workers={self.max_workers})")
-    with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-        # tqdm 분기
-        it = executor.map(_worker_process_site, map(_worker_payload, urls))
-        results = list(tqdm(it, total=len(urls), desc="사이트 처리 중", unit="site")) if TQDM_AVAILABLE else list(it)
-        all_stats.extend(results)
-    for st in all_stats:
-        self.stats[st['site_name']] = st
-    return all_stats
-
-# 모듈 최상위(클래스 밖)에 추가 — 프로세스용 워커
-def _worker_process_site(payload: dict) -> dict:
-    url = payload["url"]
-    use_selenium = payload.get("use_selenium", False)
-    # 각 프로세스는 독립 다운로더(내부에서 다시 멀티 안씀)
-    dl = CouncilFileDownloader(use_selenium=use_selenium, max_workers=1)
-    return dl.process_site(url)
+# URL 중복 체크용 Bloom filter (없으면 set 사용)
+try:
+    from pybloomfilter import BloomFilter
+except ImportError:
+    BloomFilter = None
 
 # 진행 표시 도구
 try:
@@ -91,17 +134,23 @@ try:
 except ImportError:
     TQDM_AVAILABLE = False
 
-# Selenium 옵션
-try:
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.chrome.options import Options
-    from selenium.common.exceptions import TimeoutException, NoSuchElementException
-    SELENIUM_AVAILABLE = True
-except ImportError:
-    SELENIUM_AVAILABLE = False
+# Selenium 옵션: 설치 여부만 확인하고 실제 import는 _import_selenium()에서
+# (--selenium 없이 도는 워커 프로세스가 selenium import 비용을 치르지 않도록)
+SELENIUM_AVAILABLE = importlib.util.find_spec("selenium") is not None
+webdriver = By = WebDriverWait = EC = Options = None
+
+def _import_selenium() -> None:
+    """selenium 모듈을 최초 사용 시점에 한 번만 import"""
+    global webdriver, By, WebDriverWait, EC, Options
+    if webdriver is not None:
+        return
+    from selenium import webdriver as _webdriver
+    from selenium.webdriver.common.by import By as _By
+    from selenium.webdriver.support.ui import WebDriverWait as _WebDriverWait
+    from selenium.webdriver.support import expected_conditions as _EC
+    from selenium.webdriver.chrome.options import Options as _Options
+    By, WebDriverWait, EC, Options = _By, _WebDriverWait, _EC, _Options
+    webdriver = _webdriver
 
 # 로깅 설정
 logging.basicConfig(
@@ -124,126 +173,361 @@ class ProcessNameFilter(logging.Filter):
 for handler in logger.handlers:
     handler.addFilter(ProcessNameFilter())
 
+# ---- 정규식: 호출마다 re 캐시 조회/컴파일 확인을 하지 않도록 모듈 로드 시 한 번만 컴파일 ----
+_RE_CTRL_WS = re.compile(r'[\r\n\t]')
+_RE_WS = re.compile(r'\s+')
+_RE_DRIVE = re.compile(r'^[A-Za-z]:[/\\]')
+_RE_YEAR = re.compile(r'(\d{4})년?')
+_RE_YEAR_MONTH_KO = re.compile(r'(\d{4})년\s*(\d{1,2})월')
+_RE_HANGUL = re.compile(r'[\uAC00-\uD7A3]')
+_RE_CHARSET = re.compile(r'charset=([^\s;]+)')
+_RE_META_CHARSET = re.compile(rb'<meta.*?charset=["\']*([^\s"\'/>]+)', re.I)
+_RE_VIEWER_FILE = re.compile(r'\?file=([^&]+)')
+_RE_UNSAFE_FILENAME = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+_RE_PREVIEW_WORDS = re.compile(r'바로보기|미리보기')
+_RE_MULTI_UNDERSCORE = re.compile(r'__+')
+_RE_FILE_EXT = re.compile(r'\.[A-Za-z0-9]+$')
+
+# is_target_date: 날짜 형식 3종(full / compact / short)을 한 번의 finditer로
+_DATE_COMBINED = re.compile(
+    r'(?P<y4>\d{4})[\s\-\.년/](?P<m>\d{1,2})[\s\-\.월]?'
+    r'|(?P<y4c>\d{4})(?P<mc>\d{2})'
+    r'|(?P<y2>\d{2})[\s\-\.년](?P<m2>\d{1,2})[\s\-\.월]'
+)
+
+# is_target_date: 한글 월 이름 (순서 유지: '1월'이 '11월'보다 먼저 검사됨)
+_KOREAN_MONTHS = (
+    ('1월', 1), ('2월', 2), ('3월', 3), ('4월', 4), ('5월', 5), ('6월', 6),
+    ('7월', 7), ('8월', 8), ('9월', 9), ('10월', 10), ('11월', 11), ('12월', 12),
+    ('일월', 1), ('이월', 2), ('삼월', 3), ('사월', 4), ('오월', 5), ('유월', 6),
+    ('칠월', 7), ('팔월', 8), ('구월', 9), ('시월', 10), ('십일월', 11), ('십이월', 12),
+)
+
+# 바로보기/미리보기 onclick에서 URL 추출
+_PREVIEW_JS_PATTERNS = tuple(re.compile(p) for p in (
+    r"window\.open\(['\"]([^'\"]+)['\"]",
+    r"download\(['\"]?([^'\"]+)['\"]?",
+    r"fileDown\(['\"]?([^'\"]+)['\"]?",
+))
+
+# 다운로드 onclick JavaScript 함수 패턴들 (파일 ID, 파일명)
+_JS_ARGS = r"\(['\"]?([^'\"]+)['\"]?(?:,\s*['\"]?([^'\"]+)['\"]?)?\)"
+_JS_PATTERNS = tuple(re.compile(fn + _JS_ARGS) for fn in (
+    r"fn_download", r"fileDownload", r"download", r"attachDown", r"fn_fileDown",
+    r"jsFileDownload", r"getFile", r"file_down", r"fnFileDown", r"boardFileDown",
+    r"filePreview", r"viewer",
+))
+
+# extract_all_download_urls: 링크 판별 기준
+# 확장자: 문자열 어디든 포함되면 파일 링크 (.xls는 .xlsx, .doc는 .docx, .hwp는 .hwpx 포함)
+_FILE_EXT_RE = re.compile(r'\.(?:pdf|xls|hwp|doc|zip|csv)', re.IGNORECASE)
+# 다운로드 키워드: fileDown/getFile/atchFile/boardFile/bbsFile/attachDown 등은 모두 file/attach에 포함됨
+_DOWNLOAD_KW_RE = re.compile(r'download|file|attach', re.IGNORECASE)
+_DATA_ATTRS = ('data-file', 'data-url', 'data-href', 'data-link', 'data-download', 'data-attach')
+
+WRITE_CHUNK_SIZE = 1 << 18  # 다운로드 본문 저장 단위 (256KiB)
+SNIFF_SIZE = 4096  # HTML/파일 판별용으로 먼저 읽는 본문 크기
+URL_BLOOM_CAPACITY = 1_000_000  # 1e6개 / 오탐률 1e-5 → 약 3MB 고정
+URL_BLOOM_ERROR_RATE = 1e-5
+RETRY_VARIANTS = 4  # onclick 링크: 재시도에 쓸 대체 URL 개수
+IFRAME_MAX_DEPTH = 1  # iframe 안의 iframe은 따라가지 않음 (iframe 순환 방지)
+IFRAME_FETCH_WORKERS = 8
+
+# normalize_url에서 빼는 캐시 무력화용 파라미터
+_REMOVE_QUERY_PARAMS = ('timestamp', 'ts', '_', 'random', 'cache')
+
+@lru_cache(maxsize=65536)
+def _normalize_url(url: str) -> str:
+    """
+    URL 정규화 - 같은 후보 URL이 URL/파일명 중복 체크에서 반복 호출되므로 캐시
+    파라미터 정렬 + 불필요한 파라미터 제거를 urlparse/parse_qs 한 번으로 처리
+    """
+    if not url:
+        return ""
+    
+    # 개행문자, 불필요한 공백 제거
+    url = _RE_CTRL_WS.sub('', url)
+    url = _RE_WS.sub(' ', url)
+    
+    parsed = urlparse(url)
+    if parsed.query:
+        params = parse_qs(parsed.query)
+        for param in _REMOVE_QUERY_PARAMS:
+            params.pop(param, None)
+        if params:
+            query = urlencode(sorted(params.items()), doseq=True)
+            url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{query}"
+        else:
+            url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+    
+    return url.lower().strip()
+
+@lru_cache(maxsize=4096)
+def _url_origin(url: str) -> Tuple[str, str]:
+    """(scheme://netloc, netloc) - 같은 페이지 URL로 변형 URL을 여러 번 만들 때 urlparse 재사용"""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}", parsed.netloc
+
+@lru_cache(maxsize=65536)
+def _absolute_url(url: str, base_url: str) -> Optional[str]:
+    """build_absolute_url 본체: 정리 → 절대 URL (흔한 형태는 문자열 연산, 상대 경로만 urljoin)"""
+    # URL 정리 - 개행문자 및 공백 제거 (연속 공백이 있을 때만 split/join)
+    url = _RE_CTRL_WS.sub('', url).strip()
+    if '  ' in url:
+        url = ' '.join(url.split())
+    
+    # 로컬 파일 경로 체크 (D:/, C:/ 등)
+    if _RE_DRIVE.match(url):
+        logger.debug(f"로컬 파일 경로 무시: {url}")
+        return None
+    
+    if url.startswith('http'):
+        return url
+    
+    origin, _ = _url_origin(base_url)
+    
+    if url.startswith('//'):
+        return f"{origin[:origin.index(':')]}:{url}"
+    
+    if url.startswith('/'):
+        return f"{origin}{url}"
+    
+    # URL 결합 후 정규화
+    joined_url = urljoin(base_url, url)
+    parsed = urlparse(joined_url)
+    normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+    if parsed.query:
+        normalized += f"?{parsed.query}"
+    if parsed.fragment:
+        normalized += f"#{parsed.fragment}"
+    
+    return normalized
+
+def _decode_filename(text: str) -> str:
+    """decode_filename 본체 (입력 문자열에만 의존)"""
+    # 이미 한글이 정상적으로 포함된 경우
+    if _RE_HANGUL.search(text):
+        return text
+
+    # ASCII면 남은 인코딩 문제는 URL 인코딩뿐
+    if text.isascii():
+        return unquote(text) if '%' in text else text
+
+    # latin-1로 잘못 디코드된 헤더 값 복구: 바이트로 되돌려 utf-8 → cp949(euc-kr 포함) 순으로
+    try:
+        raw = text.encode('latin-1')
+    except UnicodeEncodeError:
+        return text  # 이미 정상적인 유니코드
+    for encoding in ('utf-8', 'cp949'):
+        try:
+            decoded = raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+        if _RE_HANGUL.search(decoded):
+            return decoded
+
+    return text
+
+# 같은 헤더/링크 텍스트가 사이트 안에서 반복되므로 캐시 (URL 같은 긴 문자열은 캐시하지 않음)
+_decode_filename_cached = lru_cache(maxsize=4096)(_decode_filename)
+
+@lru_cache(maxsize=1024)
+def _parse_content_disposition(cd: str) -> Optional[str]:
+    """Content-Disposition의 파일명 (filename*(RFC 5987) 우선, 없으면 filename, 둘 다 없으면 None)"""
+    msg = Message()
+    msg['Content-Disposition'] = cd
+    plain = None
+    # filename*는 (charset, language, 값) 튜플로 풀려 나옴
+    for key, value in msg.get_params(header='content-disposition', failobj=[]):
+        if key != 'filename':
+            continue
+        if isinstance(value, tuple):
+            return collapse_rfc2231_value(value)
+        if plain is None:
+            plain = value.strip('"\'')
+    return plain
+DECODE_CACHE_MAX_LEN = 512
+
 class FileDeduplicator:
     """파일 중복 제거 관리자"""
     
     def __init__(self):
-        self.seen_urls = set()
+        # 본 URL은 정확할 필요가 없어 Bloom filter로 메모리 고정 (오탐 시 변형 URL 하나를 건너뛸 뿐)
+        self.seen_urls = (BloomFilter(URL_BLOOM_CAPACITY, URL_BLOOM_ERROR_RATE)
+                          if BloomFilter is not None else set())
+        self.url_count = 0
         self.seen_filenames = set()
         self.seen_hashes = set()
         self.url_to_filename = {}
+        # 내용 중복: 저장하면서 계산한 전체 해시로 판별 (is_duplicate_hash)
+        self.unique_contents = 0
+        self._content_lock = threading.Lock()
+        # URL/파일명 체크는 "확인 후 추가"라 사이트 내 병렬 다운로드 시 잠금 필요
+        self._name_lock = threading.Lock()
         
     def normalize_url(self, url: str) -> str:
-        """URL 정규화"""
-        if not url:
-            return ""
-        
-        # 개행문자, 불필요한 공백 제거
-        url = re.sub(r'[\r\n\t]', '', url)
-        url = re.sub(r'\s+', ' ', url)
-        
-        # 파라미터 정렬
-        parsed = urlparse(url)
-        if parsed.query:
-            params = parse_qs(parsed.query)
-            sorted_params = sorted(params.items())
-            query = urlencode(sorted_params, doseq=True)
-            url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{query}"
-        
-        # 불필요한 파라미터 제거
-        remove_params = ['timestamp', 'ts', '_', 'random', 'cache']
-        parsed = urlparse(url)
-        if parsed.query:
-            params = parse_qs(parsed.query)
-            for param in remove_params:
-                params.pop(param, None)
-            if params:
-                query = urlencode(params, doseq=True)
-                url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{query}"
-            else:
-                url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-        
-        return url.lower().strip()
+        """URL 정규화 (상태가 없으므로 모듈 함수 _normalize_url 캐시 사용)"""
+        return _normalize_url(url)
     
     def is_duplicate_url(self, url: str) -> bool:
         """URL 중복 체크"""
         normalized = self.normalize_url(url)
-        if normalized in self.seen_urls:
-            return True
-        self.seen_urls.add(normalized)
-        return False
+        with self._name_lock:
+            if normalized in self.seen_urls:
+                return True
+            self.seen_urls.add(normalized)
+            self.url_count += 1
+            return False
     
     def is_duplicate_filename(self, filename: str, url: str = None) -> bool:
         """파일명 중복 체크"""
         key = filename.lower().strip()
+        normalized_url = self.normalize_url(url) if url else None
         
-        # 동일 URL에서 온 파일은 허용
-        if url:
-            normalized_url = self.normalize_url(url)
-            if normalized_url in self.url_to_filename:
-                if self.url_to_filename[normalized_url] == key:
-                    return False
-            self.url_to_filename[normalized_url] = key
-        
-        if key in self.seen_filenames:
-            return True
-        self.seen_filenames.add(key)
-        return False
-    
-    def get_file_hash(self, filepath: str) -> str:
-        """파일 해시 계산"""
-        hasher = hashlib.md5()
-        try:
-            with open(filepath, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
-        except Exception:
-            return None
+        with self._name_lock:
+            # 동일 URL에서 온 파일은 허용
+            if normalized_url:
+                if normalized_url in self.url_to_filename:
+                    if self.url_to_filename[normalized_url] == key:
+                        return False
+                self.url_to_filename[normalized_url] = key
+            
+            if key in self.seen_filenames:
+                return True
+            self.seen_filenames.add(key)
+            return False
     
-    def is_duplicate_content(self, filepath: str) -> bool:
-        """파일 내용 중복 체크"""
-        file_hash = self.get_file_hash(filepath)
-        if not file_hash:
+    def is_duplicate_hash(self, digest: str) -> bool:
+        """저장하면서 계산한 전체 해시로 내용 중복 체크 (파일을 다시 읽지 않음)"""
+        with self._content_lock:
+            if digest in self.seen_hashes:
+                return True
+            self.seen_hashes.add(digest)
+            self.unique_contents += 1
             return False
-        
-        if file_hash in self.seen_hashes:
-            return True
-        self.seen_hashes.add(file_hash)
-        return False
     
     def get_stats(self) -> Dict:
         """중복 제거 통계"""
         return {
-            'unique_urls': len(self.seen_urls),
+            'unique_urls': self.url_count,
             'unique_filenames': len(self.seen_filenames),
-            'unique_contents': len(self.seen_hashes)
+            'unique_contents': self.unique_contents
         }
 
+# 사이트-지자체명 매핑 (import 시 한 번 생성, 읽기 전용)
+SITE_NAME_MAPPING = MappingProxyType({
+    # 서울시 자치구
+    'ydp.go.kr': '영등포구',
+    'dongjak.go.kr': '동작구',
+    'assembly.dongjak.go.kr': '동작구',
+    'yscl.go.kr': '용산구',
+    'gwangjin.go.kr': '광진구',
+    'council.gwangjin.go.kr': '광진구',
+    'seocho.go.kr': '서초구',
+    'gangdong.go.kr': '강동구',
+    'mapo.seoul.kr': '마포구',
+    'council.mapo.seoul.kr': '마포구',
+    'ddm.go.kr': '동대문구',
+    'sb.go.kr': '성북구',
+    'dobong.go.kr': '도봉구',
+    'nowon.kr': '노원구',
+    'gangseo.seoul.kr': '강서구',
+    'ycc.go.kr': '양천구',
+    'guro.go.kr': '구로구',
+    'geumcheon.go.kr': '금천구',
+    'songpa.go.kr': '송파구',
+    'gangnam.go.kr': '강남구',
+    'ep.go.kr': '은평구',
+    'council.ep.go.kr': '은평구',
+    'jongno.go.kr': '종로구',
+    'sd.go.kr': '성동구',
+    'jungnang.go.kr': '중랑구',
+    'gangbuk.go.kr': '강북구',
+    'council.gangbuk.go.kr': '강북구',
+    'junggu.seoul.kr': '중구',
+    
+    # 경기도
+    'suwon.go.kr': '수원시',
+    'council.suwon.go.kr': '수원시',
+    'goyang.go.kr': '고양시',
+    'yongin.go.kr': '용인시',
+    'seongnam.go.kr': '성남시',
+    'bucheon.go.kr': '부천시',
+    'ansan.go.kr': '안산시',
+    'anyang.go.kr': '안양시',
+    'namyangju.go.kr': '남양주시',
+    'hwaseong.go.kr': '화성시',
+    'pyeongtaek.go.kr': '평택시',
+    'uijeongbu.go.kr': '의정부시',
+    'siheung.go.kr': '시흥시',
+    'gimpo.go.kr': '김포시',
+    'gwangju.go.kr': '광주시',
+    'gwangmyeong.go.kr': '광명시',
+    'gunpo.go.kr': '군포시',
+    'osan.go.kr': '오산시',
+    'icheon.go.kr': '이천시',
+    'yangju.go.kr': '양주시',
+    'anseong.go.kr': '안성시',
+    'guri.go.kr': '구리시',
+    'pocheon.go.kr': '포천시',
+    'uiwang.go.kr': '의왕시',
+    'hanam.go.kr': '하남시',
+    'paju.go.kr': '파주시',
+    'yangpyeong.go.kr': '양평군',
+    'yeoju.go.kr': '여주시',
+    'dongducheon.go.kr': '동두천시',
+    'gapyeong.go.kr': '가평군',
+    'yeoncheon.go.kr': '연천군',
+    
+    # 특수 사이트
+    'sscf2016.or.kr': '서초구재단',
+})
+
+USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Edge/120.0.0.0',
+)
+
+# 세션 기본 헤더 (User-Agent는 세션마다 USER_AGENTS에서 무작위 선택)
+_DEFAULT_HEADERS = MappingProxyType({
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Encoding': URLLIB3_ACCEPT_ENCODING,  # 디코드 가능한 것만 (brotli 미설치 시 br 제외)
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0',
+})
+
 class CouncilFileDownloader:
-    def __init__(self, use_selenium=False, max_workers=4):
+    def __init__(self, use_selenium=False, max_workers=4, base_download_dir=None):
+        
+        # User-Agent 목록 (self.session 생성보다 먼저 정의되어야 함)
+        self.user_agents = USER_AGENTS
         
-        # User-Agent 목록 확장 (self.session 생성보다 먼저 정의되어야 함)
-        self.user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Edge/120.0.0.0'
-        ]
+        # 병렬 처리 설정
+        self.max_workers = max_workers
+        self.per_site_workers = _site_download_workers_from_env()
+        self.min_host_interval = _host_interval_from_env()
+        self.executor_kind = _executor_kind_from_env()
+        self.running_in_flask = _running_in_flask_from_env()
         
+        # 스레드 모드에서는 이 세션 하나를 모든 워커가 공유
         self.session = self._create_session()
         
         # 중복 제거 관리자
         self.deduplicator = FileDeduplicator()
         
-        # 병렬 처리 설정
-        self.max_workers = max_workers
-        
-        # Selenium 드라이버
+        # Selenium 드라이버 (스레드 모드에서는 사이트 스레드들이 하나를 공유 → 사용 시 잠금)
         self.driver = None
+        self._driver_lock = threading.Lock()
         self.use_selenium = use_selenium
         if use_selenium and SELENIUM_AVAILABLE:
             try:
@@ -254,37 +538,72 @@ class CouncilFileDownloader:
         
         self.current_date = datetime.now()
         self.target_months = self.get_target_months()
+        self._target_month_set = frozenset(self.target_months)
         
-        self.base_download_dir = f"downloads_{self.current_date.strftime('%Y%m%d_%H%M')}"
-        if not os.path.exists(self.base_download_dir):
-            os.makedirs(self.base_download_dir)
+        # 저장 폴더: 인자 > DOWNLOADER_BASE_DIR > downloads_<시각>
+        # (프로세스 워커는 부모 경로를 인자로 받으므로 분 경계에서 기동돼도 폴더가 갈리지 않음)
+        self.base_download_dir = (base_download_dir
+                                  or os.getenv("DOWNLOADER_BASE_DIR")
+                                  or f"downloads_{self.current_date.strftime('%Y%m%d_%H%M')}")
+        os.makedirs(self.base_download_dir, exist_ok=True)
         
         # 사이트-지자체명 매핑 로드
         self.site_name_mapping = self._load_site_name_mapping()
+        self._site_label_map = self._build_site_label_map()
+        self._site_name_cache: Dict[str, str] = {}
+        
+        # onclick 다운로드: 호스트(netloc) → 응답하는 URL 패턴 순번 (None = 못 찾음, 기존 방식)
+        self._site_pattern_cache: Dict[str, Optional[int]] = {}
+        
+        # 호스트(netloc) → 다음 요청 가능 시각(monotonic), 요청 사이 sleep 대신 필요한 만큼만 대기
+        self._host_limiter: Dict[str, float] = {}
+        self._host_lock = threading.Lock()
         
         self.stats = {}
         
     def _create_session(self) -> requests.Session:
         """세션 생성 및 기본 설정"""
         session = requests.Session()
-        session.headers.update({
-            'User-Agent': random.choice(self.user_agents),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'max-age=0'
-        })
+        session.headers.update(_DEFAULT_HEADERS)
+        # User-Agent는 세션 단위로 고정 (요청마다 바꾸면 서버 keep-alive 판단을 흐림)
+        session.headers['User-Agent'] = random.choice(self.user_agents)
+        # 기본 풀(10개)보다 워커가 많으면 연결을 버리고 TLS 핸드셰이크를 반복하므로 워커 수에 맞춤
+        workers = max(1, self.max_workers)
+        # 재시도는 download_file_with_retry / explore_detail_page가 직접 하므로 어댑터 재시도는 끔
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=max(10, workers * 2), max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
         return session
     
+    def _host_wait(self, url: str) -> float:
+        """url 호스트의 다음 요청 슬롯을 예약하고 그때까지 기다려야 할 시간(초)을 반환"""
+        host = _url_origin(url)[1]
+        with self._host_lock:
+            now = time.monotonic()
+            slot = max(now, self._host_limiter.get(host, 0.0))
+            # 같은 간격으로 몰리지 않도록 약간의 지터
+            self._host_limiter[host] = slot + self.min_host_interval * random.uniform(1.0, 1.5)
+        return slot - now
+
+    def _throttle_host(self, url: str) -> None:
+        """같은 호스트 요청 간격 유지 (다른 호스트 요청은 기다리지 않음)"""
+        wait = self._host_wait(url)
+        if wait > 0:
+            time.sleep(wait)
+
+    def _defer_host(self, url: str, seconds: float) -> None:
+        """429/5xx 응답 후: 해당 호스트의 다음 요청을 seconds 뒤로 미룸"""
+        host = _url_origin(url)[1]
+        with self._host_lock:
+            until = time.monotonic() + seconds
+            if until > self._host_limiter.get(host, 0.0):
+                self._host_limiter[host] = until
+
     def _init_selenium(self):
         """Selenium 초기화"""
         if not SELENIUM_AVAILABLE:
             return
+        _import_selenium()
             
         chrome_options = Options()
         chrome_options.add_argument('--headless')
@@ -297,75 +616,9 @@ class CouncilFileDownloader:
         chrome_options.add_experimental_option('useAutomationExtension', False)
         self.driver = webdriver.Chrome(options=chrome_options)
     
-    def _load_site_name_mapping(self) -> Dict[str, str]:
-        """사이트-지자체명 매핑"""
-        return {
-            # 서울시 자치구
-            'ydp.go.kr': '영등포구',
-            'dongjak.go.kr': '동작구',
-            'assembly.dongjak.go.kr': '동작구',
-            'yscl.go.kr': '용산구',
-            'gwangjin.go.kr': '광진구',
-            'council.gwangjin.go.kr': '광진구',
-            'seocho.go.kr': '서초구',
-            'gangdong.go.kr': '강동구',
-            'mapo.seoul.kr': '마포구',
-            'council.mapo.seoul.kr': '마포구',
-            'ddm.go.kr': '동대문구',
-            'sb.go.kr': '성북구',
-            'dobong.go.kr': '도봉구',
-            'nowon.kr': '노원구',
-            'gangseo.seoul.kr': '강서구',
-            'ycc.go.kr': '양천구',
-            'guro.go.kr': '구로구',
-            'geumcheon.go.kr': '금천구',
-            'songpa.go.kr': '송파구',
-            'gangnam.go.kr': '강남구',
-            'ep.go.kr': '은평구',
-            'council.ep.go.kr': '은평구',
-            'jongno.go.kr': '종로구',
-            'sd.go.kr': '성동구',
-            'jungnang.go.kr': '중랑구',
-            'gangbuk.go.kr': '강북구',
-            'council.gangbuk.go.kr': '강북구',
-            'junggu.seoul.kr': '중구',
-            
-            # 경기도
-            'suwon.go.kr': '수원시',
-            'council.suwon.go.kr': '수원시',
-            'goyang.go.kr': '고양시',
-            'yongin.go.kr': '용인시',
-            'seongnam.go.kr': '성남시',
-            'bucheon.go.kr': '부천시',
-            'ansan.go.kr': '안산시',
-            'anyang.go.kr': '안양시',
-            'namyangju.go.kr': '남양주시',
-            'hwaseong.go.kr': '화성시',
-            'pyeongtaek.go.kr': '평택시',
-            'uijeongbu.go.kr': '의정부시',
-            'siheung.go.kr': '시흥시',
-            'gimpo.go.kr': '김포시',
-            'gwangju.go.kr': '광주시',
-            'gwangmyeong.go.kr': '광명시',
-            'gunpo.go.kr': '군포시',
-            'osan.go.kr': '오산시',
-            'icheon.go.kr': '이천시',
-            'yangju.go.kr': '양주시',
-            'anseong.go.kr': '안성시',
-            'guri.go.kr': '구리시',
-            'pocheon.go.kr': '포천시',
-            'uiwang.go.kr': '의왕시',
-            'hanam.go.kr': '하남시',
-            'paju.go.kr': '파주시',
-            'yangpyeong.go.kr': '양평군',
-            'yeoju.go.kr': '여주시',
-            'dongducheon.go.kr': '동두천시',
-            'gapyeong.go.kr': '가평군',
-            'yeoncheon.go.kr': '연천군',
-            
-            # 특수 사이트
-            'sscf2016.or.kr': '서초구재단',
-        }
+    def _load_site_name_mapping(self) -> Mapping[str, str]:
+        """사이트-지자체명 매핑 (모듈 상수 공유)"""
+        return SITE_NAME_MAPPING
     
     def get_target_months(self) -> List[Tuple[int, int]]:
         """대상 월 계산"""
@@ -390,95 +643,121 @@ class CouncilFileDownloader:
         # 공백 정규화
         text = ' '.join(text.split())
         
-        patterns = [
-            (r'(\d{4})[\s\-\.년/](\d{1,2})[\s\-\.월]?', 'full'),
-            (r'(\d{4})(\d{2})', 'compact'),
-            (r'(\d{2})[\s\-\.년](\d{1,2})[\s\-\.월]', 'short'),
-        ]
+        target = self._target_month_set
+        for m in _DATE_COMBINED.finditer(text):
+            date_str = self._target_date_of_match(m, target)
+            if date_str:
+                return True, date_str
         
-        for pattern, format_type in patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                try:
-                    if format_type == 'short':
-                        year = 2000 + int(match[0])
-                    else:
-                        year = int(match[0])
-                    month = int(match[1])
-                    
-                    if 1 <= month <= 12 and (year, month) in self.target_months:
-                        return True, f"{year}년 {month}월"
-                except:
-                    continue
+        date_str = self._korean_month_target(text)
+        return (True, date_str) if date_str else (False, None)
+    
+    def match_target_dates(self, texts: List[str]) -> List[Optional[str]]:
+        """
+        is_target_date 일괄 버전 (항목별 결과는 동일, 대상이 아니면 None)
+        정규화한 텍스트를 '\x00'(어떤 날짜 패턴에도 안 걸림)으로 이어 finditer 한 번, 매치 위치로 항목을 찾음
+        """
+        texts = [' '.join(t.split()) if t else '' for t in texts]
+        starts, pos = [], 0
+        for t in texts:
+            starts.append(pos)
+            pos += len(t) + 1
         
-        # 한글 월 이름
-        month_map = {
-            '1월': 1, '2월': 2, '3월': 3, '4월': 4, '5월': 5, '6월': 6,
-            '7월': 7, '8월': 8, '9월': 9, '10월': 10, '11월': 11, '12월': 12,
-            '일월': 1, '이월': 2, '삼월': 3, '사월': 4, '오월': 5, '유월': 6,
-            '칠월': 7, '팔월': 8, '구월': 9, '시월': 10, '십일월': 11, '십이월': 12
-        }
+        results: List[Optional[str]] = [None] * len(texts)
+        target = self._target_month_set
+        for m in _DATE_COMBINED.finditer('\x00'.join(texts)):
+            i = bisect_right(starts, m.start()) - 1
+            if results[i] is None:
+                results[i] = self._target_date_of_match(m, target)
         
-        for month_name, month_num in month_map.items():
+        for i, t in enumerate(texts):
+            if results[i] is None:
+                results[i] = self._korean_month_target(t)
+        return results
+    
+    @staticmethod
+    def _target_date_of_match(m: re.Match, target: frozenset) -> Optional[str]:
+        """_DATE_COMBINED 매치 → 대상 월이면 'YYYY년 M월'"""
+        if m.group('y4') is not None:
+            year, month = int(m.group('y4')), int(m.group('m'))
+        elif m.group('y4c') is not None:
+            year, month = int(m.group('y4c')), int(m.group('mc'))
+        else:
+            year, month = 2000 + int(m.group('y2')), int(m.group('m2'))
+        
+        if 1 <= month <= 12 and (year, month) in target:
+            return f"{year}년 {month}월"
+        return None
+    
+    def _korean_month_target(self, text: str) -> Optional[str]:
+        """한글 월 이름으로 대상 월 찾기 (공백 정규화된 텍스트)"""
+        # 모두 '월'로 끝나므로 없으면 바로 종료
+        if '월' not in text:
+            return None
+        
+        target = self._target_month_set
+        year = None
+        for month_name, month_num in _KOREAN_MONTHS:
             if month_name in text:
-                year_match = re.search(r'(\d{4})년?', text)
-                year = int(year_match.group(1)) if year_match else self.current_date.year
+                if year is None:
+                    year_match = _RE_YEAR.search(text)
+                    year = int(year_match.group(1)) if year_match else self.current_date.year
                 
-                if (year, month_num) in self.target_months:
-                    return True, f"{year}년 {month_num}월"
-                if (year - 1, month_num) in self.target_months:
-                    return True, f"{year - 1}년 {month_num}월"
-        
-        return False, None
+                if (year, month_num) in target:
+                    return f"{year}년 {month_num}월"
+                if (year - 1, month_num) in target:
+                    return f"{year - 1}년 {month_num}월"
+        return None
+    
+    def _build_site_label_map(self) -> Dict[str, str]:
+        """매핑 키의 지자체 라벨 → 이름 (예: 'gwangjin' → '광진구', council./assembly./www. 제외)"""
+        label_map = {}
+        for key, name in self.site_name_mapping.items():
+            for label in key.split('.'):
+                if label in ('council', 'assembly', 'www'):
+                    continue
+                label_map.setdefault(label, name)
+                break
+        return label_map
+    
+    def _site_name_by_suffix(self, domain: str) -> Optional[str]:
+        """도메인 앞 라벨을 하나씩 떼며 매핑 조회 (council.gwangjin.go.kr → gwangjin.go.kr → go.kr)"""
+        labels = domain.split('.')
+        for i in range(len(labels) - 1):
+            name = self.site_name_mapping.get('.'.join(labels[i:]))
+            if name:
+                return name
+        return None
     
     def get_site_name(self, url: str) -> str:
-        """사이트 이름 추출 - 강화된 버전"""
+        """사이트 이름 추출 - 강화된 버전 (결과는 도메인에만 의존하므로 도메인별 캐시)"""
         domain = urlparse(url).netloc.lower()
-        path = urlparse(url).path.lower()
-        
-        # 직접 매핑 시도 (전체 도메인)
-        if domain in self.site_name_mapping:
-            return self.site_name_mapping[domain]
+        hit = self._site_name_cache.get(domain)
+        if hit is not None:
+            return hit
+        name = self._resolve_site_name(domain)
+        self._site_name_cache[domain] = name
+        return name
+    
+    def _resolve_site_name(self, domain: str) -> str:
+        """도메인 → 사이트 이름"""
+        # 직접 매핑 / 상위 도메인 매핑 (www., council. 등 하위 도메인 포함)
+        name = self._site_name_by_suffix(domain)
+        if name:
+            return name
         
-        # 도메인 부분 매칭
-        for key, name in self.site_name_mapping.items():
-            if key in domain:
-                return name
+        domain_parts = domain.split('.')
         
         # council 특수 처리 (의회 사이트)
         if 'council' in domain:
-            domain_parts = domain.split('.')
             if len(domain_parts) >= 3:
-                council_site = '.'.join(domain_parts[1:])
-                if council_site in self.site_name_mapping:
-                    return f"{self.site_name_mapping[council_site]}의회"
-                
                 # council.XXX.go.kr 패턴
-                middle_domain = domain_parts[1]
-                for key, name in self.site_name_mapping.items():
-                    if middle_domain in key:
-                        return f"{name}의회"
-                        
-            return '의회'
-        
-        # www 특수 처리
-        if domain.startswith('www.'):
-            domain_without_www = domain[4:]
-            if domain_without_www in self.site_name_mapping:
-                return self.site_name_mapping[domain_without_www]
-            
-            for key, name in self.site_name_mapping.items():
-                if key in domain_without_www:
-                    return name
-        
-        # 패스에서 힌트 찾기
-        if 'council' in path or 'assembly' in path:
-            for key, name in self.site_name_mapping.items():
-                if key in domain:
+                name = self._site_label_map.get(domain_parts[1])
+                if name:
                     return f"{name}의회"
+            return '의회'
         
         # 최후의 수단: 도메인 첫 부분
-        domain_parts = domain.split('.')
         if len(domain_parts) > 0 and domain_parts[0] != 'www' and len(domain_parts[0]) > 2:
             return domain_parts[0]
         
@@ -489,79 +768,134 @@ class CouncilFileDownloader:
         return domain
     
     def build_download_url_variants(self, base_url: str, file_id: str, file_name: str = '') -> List[str]:
-        """다양한 다운로드 URL 패턴 생성"""
-        parsed = urlparse(base_url)
-        base = f"{parsed.scheme}://{parsed.netloc}"
+        """다양한 다운로드 URL 패턴 생성 (전체 목록)"""
+        return list(self.iter_download_url_variants(base_url, file_id, file_name))
+    
+    def iter_download_url_variants(self, base_url: str, file_id: str, file_name: str = ''):
+        """다운로드 URL 패턴을 필요한 만큼만 하나씩 생성"""
+        base, _ = _url_origin(base_url)
         
         # 가능한 모든 다운로드 URL 패턴
-        patterns = [
-            f"{base}/common/download.do?fileId={file_id}",
-            f"{base}/common/fileDown.do?fileId={file_id}",
-            f"{base}/web/board/BD_fileDownload.do?fileNo={file_id}",
-            f"{base}/file/download.do?atchFileId={file_id}",
-            f"{base}/attach/download.do?fileSeq={file_id}",
-            f"{base}/common/fileDown.do?file_id={file_id}",
-            f"{base}/board/file_download.do?idx={file_id}",
-            f"{base}/board/download.do?file_seq={file_id}",
-            f"{base}/bbs/download.do?atchFileId={file_id}",
-            f"{base}/cmm/fms/FileDown.do?atchFileId={file_id}",
-            f"{base}/file.do?method=download&fileId={file_id}",
-            f"{base}/common/downloadFile.do?fileId={file_id}",
-            f"{base}/board/fileDownload.do?fileId={file_id}",
-            f"{base}/cmm/fms/getFile.do?atchFileId={file_id}",
-            f"{base}/cop/bbs/selectBoardArticleFile.do?atchFileId={file_id}",
-            f"{base}/bbs/getBoardFile.do?fileId={file_id}",
-            # 바로보기 관련 패턴
-            f"{base}/common/viewer.do?fileId={file_id}",
-            f"{base}/viewer.do?fileId={file_id}",
-            f"{base}/fileViewer.do?fileId={file_id}",
-            f"{base}/pdfjs/web/viewer.html?file={file_id}",
-        ]
+        yield f"{base}/common/download.do?fileId={file_id}"
+        yield f"{base}/common/fileDown.do?fileId={file_id}"
+        yield f"{base}/web/board/BD_fileDownload.do?fileNo={file_id}"
+        yield f"{base}/file/download.do?atchFileId={file_id}"
+        yield f"{base}/attach/download.do?fileSeq={file_id}"
+        yield f"{base}/common/fileDown.do?file_id={file_id}"
+        yield f"{base}/board/file_download.do?idx={file_id}"
+        yield f"{base}/board/download.do?file_seq={file_id}"
+        yield f"{base}/bbs/download.do?atchFileId={file_id}"
+        yield f"{base}/cmm/fms/FileDown.do?atchFileId={file_id}"
+        yield f"{base}/file.do?method=download&fileId={file_id}"
+        yield f"{base}/common/downloadFile.do?fileId={file_id}"
+        yield f"{base}/board/fileDownload.do?fileId={file_id}"
+        yield f"{base}/cmm/fms/getFile.do?atchFileId={file_id}"
+        yield f"{base}/cop/bbs/selectBoardArticleFile.do?atchFileId={file_id}"
+        yield f"{base}/bbs/getBoardFile.do?fileId={file_id}"
+        # 바로보기 관련 패턴
+        yield f"{base}/common/viewer.do?fileId={file_id}"
+        yield f"{base}/viewer.do?fileId={file_id}"
+        yield f"{base}/fileViewer.do?fileId={file_id}"
+        yield f"{base}/pdfjs/web/viewer.html?file={file_id}"
         
         # 파일명이 있으면 추가 패턴
         if file_name:
             encoded_name = quote(file_name)
-            patterns.extend([
-                f"{base}/download/{encoded_name}",
-                f"{base}/files/{encoded_name}",
-                f"{base}/attach/{encoded_name}",
-                f"{base}/upload/{encoded_name}",
-                f"{base}/data/download/{encoded_name}",
-            ])
+            yield f"{base}/download/{encoded_name}"
+            yield f"{base}/files/{encoded_name}"
+            yield f"{base}/attach/{encoded_name}"
+            yield f"{base}/upload/{encoded_name}"
+            yield f"{base}/data/download/{encoded_name}"
             
             # 바로보기 링크 처리
             if "바로보기" in file_name:
                 file_name_cleaned = file_name.replace("바로보기", "").strip()
                 if file_name_cleaned:
                     encoded_cleaned = quote(file_name_cleaned)
-                    patterns.extend([
-                        f"{base}/download/{encoded_cleaned}",
-                        f"{base}/files/{encoded_cleaned}",
-                        f"{base}/attach/{encoded_cleaned}",
-                        f"{base}/upload/{encoded_cleaned}",
-                    ])
+                    yield f"{base}/download/{encoded_cleaned}"
+                    yield f"{base}/files/{encoded_cleaned}"
+                    yield f"{base}/attach/{encoded_cleaned}"
+                    yield f"{base}/upload/{encoded_cleaned}"
+    
+    def _probe_download_url(self, url: str) -> bool:
+        """HEAD(안 되면 헤더만 받는 GET)로 실제 파일 응답인지 확인"""
+        try:
+            self._throttle_host(url)
+            resp = self.session.head(url, timeout=10, verify=False, allow_redirects=True)
+            if resp.status_code in (405, 501):
+                resp = self.session.get(url, timeout=10, verify=False, allow_redirects=True, stream=True)
+                resp.close()
+        except Exception:
+            return False
+        if resp.status_code != 200:
+            return False
+        disposition = resp.headers.get('Content-Disposition', '').lower()
+        content_type = resp.headers.get('Content-Type', '').lower()
+        # 없는 파일도 200 + HTML 오류 페이지로 응답하는 사이트가 많음
+        return 'attachment' in disposition or (bool(content_type) and 'text/html' not in content_type)
+    
+    def _resolve_variant_pattern(self, base_url: str, file_id: str, file_name: str = '') -> Optional[int]:
+        """호스트별로 응답하는 다운로드 URL 패턴 순번 (호스트당 최초 1회만 탐색, 못 찾으면 None)"""
+        _, netloc = _url_origin(base_url)
+        if netloc in self._site_pattern_cache:
+            return self._site_pattern_cache[netloc]
         
-        return patterns
+        idx = None
+        for i, url in enumerate(self.iter_download_url_variants(base_url, file_id, file_name)):
+            if self._probe_download_url(url):
+                idx = i
+                break
+        self._site_pattern_cache[netloc] = idx
+        if idx is not None:
+            logger.debug(f"[{netloc}] 다운로드 URL 패턴 확정: #{idx}")
+        return idx
     
     def clean_url(self, url: str) -> str:
         """URL 정리 - 개행문자 및 공백 제거"""
         if not url:
             return url
         
-        # 개행문자, 탭, 공백 제거
-        url = re.sub(r'[\r\n\t]', '', url)
-        url = ' '.join(url.split())  # 중복 공백 제거
-        url = url.strip()
+        # 개행문자, 탭, 공백 제거 (연속 공백이 있을 때만 split/join)
+        url = _RE_CTRL_WS.sub('', url).strip()
+        if '  ' in url:
+            url = ' '.join(url.split())  # 중복 공백 제거
         
         return url
     
-    def extract_all_download_urls(self, soup: BeautifulSoup, base_url: str) -> List[Dict]:
+    def extract_all_download_urls(self, soup: BeautifulSoup, base_url: str, _depth: int = 0) -> List[Dict]:
         """모든 다운로드 URL 추출 - 강화 버전"""
         download_urls = []
         
+        # DOM은 한 번만 순회해 종류별로 나눠 담고, 처리 순서(1~6)는 그대로 유지
+        # (URL 중복 제거가 먼저 본 쪽을 남기므로 순서가 바뀌면 결과 type이 달라짐)
+        preview_candidates, href_links, onclick_links = [], [], []
+        forms, data_elements, iframes = [], [], []
+        for el in soup.find_all(True):
+            name = el.name
+            if name in ('a', 'button', 'div'):
+                preview_candidates.append(el)
+            if name == 'a' and el.get('href'):
+                href_links.append(el)
+            if name in ('a', 'button', 'span', 'div') and el.get('onclick'):
+                onclick_links.append(el)
+            if name == 'form':
+                forms.append(el)
+            elif name == 'iframe':
+                iframes.append(el)
+            if any(attr in el.attrs for attr in _DATA_ATTRS):
+                data_elements.append(el)
+        
+        # 요소 텍스트는 여러 단계에서 쓰므로 한 번만 추출
+        text_cache: Dict[int, str] = {}
+        def text_of(el) -> str:
+            key = id(el)
+            if key not in text_cache:
+                text_cache[key] = el.get_text().strip()
+            return text_cache[key]
+        
         # 1. 바로보기/미리보기 링크 (최우선)
-        for link in soup.find_all(['a', 'button', 'div']):
-            text = link.get_text().strip()
+        for link in preview_candidates:
+            text = text_of(link)
             if '바로보기' in text or '미리보기' in text:
                 href = link.get('href', '')
                 onclick = link.get('onclick', '')
@@ -586,14 +920,8 @@ class CouncilFileDownloader:
                 
                 # onclick 처리
                 if onclick and ('window.open' in onclick or 'download' in onclick.lower()):
-                    js_patterns = [
-                        r"window\.open\(['\"]([^'\"]+)['\"]",
-                        r"download\(['\"]?([^'\"]+)['\"]?",
-                        r"fileDown\(['\"]?([^'\"]+)['\"]?",
-                    ]
-                    
-                    for pattern in js_patterns:
-                        matches = re.findall(pattern, onclick)
+                    for pattern in _PREVIEW_JS_PATTERNS:
+                        matches = pattern.findall(onclick)
                         for match in matches:
                             preview_url = self.build_absolute_url(match, base_url)
                             if preview_url and not self.deduplicator.is_duplicate_url(preview_url):
@@ -605,21 +933,17 @@ class CouncilFileDownloader:
                                 })
         
         # 2. href 기반 링크
-        for link in soup.find_all('a', href=True):
+        for link in href_links:
             href = link.get('href', '')
             onclick = link.get('onclick', '')
-            text = link.get_text().strip()
+            text = text_of(link)
             title = link.get('title', '')
             
             # 파일 확장자 체크
-            file_extensions = ['.pdf', '.xlsx', '.xls', '.hwp', '.doc', '.docx', '.zip', '.csv', '.hwpx']
-            is_file_link = any(ext in href.lower() for ext in file_extensions)
+            is_file_link = _FILE_EXT_RE.search(href) is not None
             
             # 다운로드 키워드 체크
-            download_keywords = ['download', 'fileDown', 'attachDown', 'file', 'attach',  
-                                 'getFile', 'atchFile', 'boardFile', 'bbsFile', 'FileDown']
-            is_download_link = any(kw in href.lower() or kw in onclick.lower()  
-                                   for kw in download_keywords)
+            is_download_link = bool(_DOWNLOAD_KW_RE.search(href) or _DOWNLOAD_KW_RE.search(onclick))
             
             if is_file_link or is_download_link:
                 url = self.build_absolute_url(href, base_url)
@@ -633,34 +957,41 @@ class CouncilFileDownloader:
                     })
         
         # 3. onclick 기반 링크 - 확장된 패턴
-        for link in soup.find_all(['a', 'button', 'span', 'div'], onclick=True):
+        for link in onclick_links:
             onclick = link.get('onclick', '')
-            text = link.get_text().strip()
+            text = text_of(link)
             
-            # JavaScript 함수 패턴들
-            js_patterns = [
-                r"fn_download\(['\"]?([^'\"]+)['\"]?(?:,\s*['\"]?([^'\"]+)['\"]?)?\)",
-                r"fileDownload\(['\"]?([^'\"]+)['\"]?(?:,\s*['\"]?([^'\"]+)['\"]?)?\)",
-                r"download\(['\"]?([^'\"]+)['\"]?(?:,\s*['\"]?([^'\"]+)['\"]?)?\)",
-                r"attachDown\(['\"]?([^'\"]+)['\"]?(?:,\s*['\"]?([^'\"]+)['\"]?)?\)",
-                r"fn_fileDown\(['\"]?([^'\"]+)['\"]?(?:,\s*['\"]?([^'\"]+)['\"]?)?\)",
-                r"jsFileDownload\(['\"]?([^'\"]+)['\"]?(?:,\s*['\"]?([^'\"]+)['\"]?)?\)",
-                r"getFile\(['\"]?([^'\"]+)['\"]?(?:,\s*['\"]?([^'\"]+)['\"]?)?\)",
-                r"file_down\(['\"]?([^'\"]+)['\"]?(?:,\s*['\"]?([^'\"]+)['\"]?)?\)",
-                r"fnFileDown\(['\"]?([^'\"]+)['\"]?(?:,\s*['\"]?([^'\"]+)['\"]?)?\)",
-                r"boardFileDown\(['\"]?([^'\"]+)['\"]?(?:,\s*['\"]?([^'\"]+)['\"]?)?\)",
-                r"filePreview\(['\"]?([^'\"]+)['\"]?(?:,\s*['\"]?([^'\"]+)['\"]?)?\)",
-                r"viewer\(['\"]?([^'\"]+)['\"]?(?:,\s*['\"]?([^'\"]+)['\"]?)?\)",
-            ]
-            
-            for pattern in js_patterns:
-                matches = re.findall(pattern, onclick)
+            # JavaScript 함수 패턴들 (_JS_PATTERNS)
+            for pattern in _JS_PATTERNS:
+                matches = pattern.findall(onclick)
                 for match in matches:
                     file_id = match[0] if isinstance(match, tuple) else match
                     file_name = match[1] if isinstance(match, tuple) and len(match) > 1 else ''
                     
-                    # 다중 URL 시도
-                    url_variants = self.build_download_url_variants(base_url, file_id, file_name)
+                    # 이 호스트에서 실제로 응답하는 패턴을 이미 알면 그 URL을 먼저 시도
+                    # (첫 파일 기준으로 고른 패턴이라 이 파일엔 안 맞을 수 있어 앞쪽 RETRY_VARIANTS개는 재시도용으로 보관,
+                    #  파일명/바로보기 기반 패턴이라 이 링크로는 만들 수 없으면 아래 다중 URL 시도로)
+                    idx = self._resolve_variant_pattern(base_url, file_id, file_name)
+                    url = None
+                    if idx is not None:
+                        url = next(islice(self.iter_download_url_variants(base_url, file_id, file_name), idx, None), None)
+                    if url is not None:
+                        if not self.deduplicator.is_duplicate_url(url):
+                            fallbacks = islice(self.iter_download_url_variants(base_url, file_id, file_name),
+                                               RETRY_VARIANTS + 1)
+                            download_urls.append({
+                                'url': url,
+                                'type': 'onclick',
+                                'text': text or file_name,
+                                'file_id': file_id,
+                                'file_name': file_name,
+                                'variants': [v for v in fallbacks if v != url][:RETRY_VARIANTS]
+                            })
+                        continue
+                    
+                    # 다중 URL 시도: 중복이 아닌 첫 URL까지만 생성,
+                    # 재시도용으로는 그 뒤 RETRY_VARIANTS개만 보관
+                    url_variants = self.iter_download_url_variants(base_url, file_id, file_name)
                     
                     for url in url_variants:
                         if not self.deduplicator.is_duplicate_url(url):
@@ -670,12 +1001,12 @@ class CouncilFileDownloader:
                                 'text': text or file_name,
                                 'file_id': file_id,
                                 'file_name': file_name,
-                                'variants': url_variants
+                                'variants': list(islice(url_variants, RETRY_VARIANTS))
                             })
                             break
         
         # 4. form 기반 다운로드
-        for form in soup.find_all('form'):
+        for form in forms:
             action = form.get('action', '')
             if 'download' in action.lower() or 'file' in action.lower():
                 inputs = form.find_all('input')
@@ -697,9 +1028,8 @@ class CouncilFileDownloader:
                         })
         
         # 5. data-* 속성 체크
-        data_attrs = ['data-file', 'data-url', 'data-href', 'data-link', 'data-download', 'data-attach']
-        for element in soup.find_all():
-            for attr in data_attrs:
+        for element in data_elements:
+            for attr in _DATA_ATTRS:
                 if element.has_attr(attr):
                     file_url = element.get(attr)
                     if file_url:
@@ -708,60 +1038,45 @@ class CouncilFileDownloader:
                             download_urls.append({
                                 'url': url,
                                 'type': 'data-attr',
-                                'text': element.get_text().strip()
+                                'text': text_of(element)
                             })
                         break  # 첫 번째 일치하는 data-* 속성만 처리
         
-        # 6. iframe 내부 탐색
-        for iframe in soup.find_all('iframe'):
-            src = iframe.get('src')
-            if src:
-                iframe_url = self.build_absolute_url(src, base_url)
-                if iframe_url:
-                    try:
-                        iframe_response = self.session.get(iframe_url, timeout=10, verify=False)
-                        iframe_soup = BeautifulSoup(iframe_response.text, 'html.parser')
-                        iframe_links = self.extract_all_download_urls(iframe_soup, iframe_url)
-                        download_urls.extend(iframe_links)
-                    except:
-                        pass
+        # 6. iframe 내부 탐색 (가져오기는 병렬, 추출은 순서대로 / iframe 안의 iframe은 따라가지 않음)
+        if _depth < IFRAME_MAX_DEPTH:
+            iframe_urls = [u for u in (self.build_absolute_url(f.get('src'), base_url)
+                                       for f in iframes if f.get('src')) if u]
+            if len(iframe_urls) > 1:
+                with ThreadPoolExecutor(max_workers=min(IFRAME_FETCH_WORKERS, len(iframe_urls))) as ex:
+                    pages = list(ex.map(self._fetch_iframe, iframe_urls))
+            else:
+                pages = [self._fetch_iframe(u) for u in iframe_urls]
+            
+            for iframe_url, resp in zip(iframe_urls, pages):
+                if resp is None:
+                    continue
+                try:
+                    iframe_soup = self._parse_html_bytes(resp.content, resp.headers.get('Content-Type', ''))
+                    iframe_links = self.extract_all_download_urls(iframe_soup, iframe_url, _depth + 1)
+                    download_urls.extend(iframe_links)
+                except:
+                    pass
         
         return download_urls
     
+    def _fetch_iframe(self, iframe_url: str) -> Optional[requests.Response]:
+        """iframe 페이지 응답 (실패 시 None)"""
+        try:
+            self._throttle_host(iframe_url)
+            return self.session.get(iframe_url, timeout=10, verify=False)
+        except Exception:
+            return None
+    
     def build_absolute_url(self, url: str, base_url: str) -> Optional[str]:
-        """절대 URL 생성 - 개선된 버전"""
+        """절대 URL 생성 - 개선된 버전 (같은 (href, 페이지) 조합은 캐시)"""
         if not url or url.startswith('#') or url.startswith('javascript'):
             return None
-        
-        # URL 정리
-        url = self.clean_url(url)
-        
-        # 로컬 파일 경로 체크 (D:/, C:/ 등)
-        if re.match(r'^[A-Za-z]:[/\\]', url):
-            logger.debug(f"로컬 파일 경로 무시: {url}")
-            return None
-        
-        if url.startswith('http'):
-            return url
-        
-        parsed_base = urlparse(base_url)
-        
-        if url.startswith('//'):
-            return f"{parsed_base.scheme}:{url}"
-        
-        if url.startswith('/'):
-            return f"{parsed_base.scheme}://{parsed_base.netloc}{url}"
-        
-        # URL 결합 후 정규화
-        joined_url = urljoin(base_url, url)
-        parsed = urlparse(joined_url)
-        normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-        if parsed.query:
-            normalized += f"?{parsed.query}"
-        if parsed.fragment:
-            normalized += f"#{parsed.fragment}"
-            
-        return normalized
+        return _absolute_url(url, base_url)
     
     def explore_detail_page(self, detail_url: str, base_url: str) -> List[Dict]:
         """상세 페이지 탐색 - 재시도 포함"""
@@ -769,10 +1084,9 @@ class CouncilFileDownloader:
         
         for attempt in range(3):  # 재시도 횟수 증가
             try:
-                headers = {'User-Agent': random.choice(self.user_agents)}
-                response = self.session.get(detail_url, timeout=15, verify=False, headers=headers)
-                response.encoding = self._detect_encoding(response)
-                soup = BeautifulSoup(response.text, 'html.parser')
+                self._throttle_host(detail_url)
+                response = self.session.get(detail_url, timeout=15, verify=False)
+                soup = self._parse_html_bytes(response.content, response.headers.get('Content-Type', ''))
                 
                 detail_downloads = self.extract_all_download_urls(soup, detail_url)
                 download_urls.extend(detail_downloads)
@@ -787,30 +1101,40 @@ class CouncilFileDownloader:
         
         return download_urls
     
-    def _detect_encoding(self, response: requests.Response) -> str:
-        """응답 인코딩 감지"""
+    def _declared_encoding(self, content_type: str, content: bytes) -> Optional[str]:
+        """응답에 선언된 인코딩 (없으면 None)"""
         # 1. Content-Type 헤더 확인
-        content_type = response.headers.get('Content-Type', '').lower()
-        charset_match = re.search(r'charset=([^\s;]+)', content_type)
+        charset_match = _RE_CHARSET.search(content_type.lower())
         if charset_match:
             return charset_match.group(1)
             
         # 2. HTML 메타 태그 확인
-        charset_pattern = re.compile(rb'<meta.*?charset=["\']*([^\s"\'/>]+)', re.I)
-        match = charset_pattern.search(response.content)
+        match = _RE_META_CHARSET.search(content)
         if match:
             return match.group(1).decode()
             
         # 3. BOM 확인
-        if response.content.startswith(b'\xef\xbb\xbf'):
+        if content.startswith(b'\xef\xbb\xbf'):
             return 'utf-8-sig'
-            
-        # 4. 자동 감지
-        return response.apparent_encoding or 'utf-8'
+        return None
+    
+    def _parse_html_bytes(self, content: bytes, content_type: str) -> BeautifulSoup:
+        """
+        응답 바이트 파싱: 선언된 인코딩(헤더/메타/BOM)으로 디코드, 없거나 잘못되면 파서에 바이트 그대로
+        (requests의 apparent_encoding은 본문 전체를 파이썬으로 추정해 느림 → lxml/UnicodeDammit에 맡김)
+        """
+        encoding = self._declared_encoding(content_type, content)
+        if encoding:
+            try:
+                return BeautifulSoup(content.decode(encoding, errors='replace'), _BS4_PARSER)
+            except LookupError:
+                pass
+        return BeautifulSoup(content, _BS4_PARSER)
     
     def find_detail_page_links(self, soup: BeautifulSoup, base_url: str) -> List[Tuple[str, str]]:
         """상세 페이지 링크 찾기"""
         detail_links: List[Tuple[str, str]] = []
+        seen: Set[Tuple[str, str]] = set()  # detail_links 중복 체크용 (리스트 검색은 O(n))
 
         detail_keywords = ['view', 'detail', 'read', 'content', 'article', 'show', 'View', 'Detail', '상세']
 
@@ -838,14 +1162,15 @@ class CouncilFileDownloader:
                     url = self.build_absolute_url(href, base_url)
                     if url:
                         item = (url, date_str or '')
-                        if item not in detail_links:
+                        if item not in seen:
+                            seen.add(item)
                             detail_links.append(item)
 
         return detail_links
 
     def download_file_with_retry(self, file_info: Dict, save_dir: str, max_retries: int = 3) -> bool:
         """재시도 로직이 포함된 파일 다운로드 (v5.0: 바로보기 링크 처리 개선)"""
-        backoffs = [0, 2, 4, 8]  # 첫 시도는 0초
+        backoffs = [0, 2, 4, 8]  # 429/5xx 응답 후 다음 시도까지 (호스트 리미터로 적용)
         variants = file_info.get('variants', [])
         tried_urls: Set[str] = set()
 
@@ -857,14 +1182,14 @@ class CouncilFileDownloader:
 
         if variants:
             # 중복 제거 및 정리
-            uniq_variants = [u for u in variants if u and u not in tried_urls]
-            candidate_rounds.extend([[u] for u in uniq_variants[:4]])  # 과도 시도 방지
+            uniq_variants = [u for u in variants if u and u != primary and u not in tried_urls]
+            candidate_rounds.extend([[u] for u in uniq_variants[:RETRY_VARIANTS]])  # 과도 시도 방지
 
         # "바로보기" 또는 "미리보기" 관련 특별 처리
         original_text = file_info.get('text', '')
         if '바로보기' in original_text or '미리보기' in original_text:
             # 파일명에서 날짜 추출 시도
-            date_part = re.search(r'(\d{4})년\s*(\d{1,2})월', original_text)
+            date_part = _RE_YEAR_MONTH_KO.search(original_text)
             if date_part:
                 year, month = date_part.groups()
                 # 파일명 구성
@@ -873,10 +1198,6 @@ class CouncilFileDownloader:
 
         tries = 0
         for attempt in range(min(max_retries, len(backoffs))):
-            wait = backoffs[attempt] if attempt < len(backoffs) else backoffs[-1]
-            if wait:
-                time.sleep(wait)
-
             url_batch = candidate_rounds[attempt] if attempt < len(candidate_rounds) else []
             if not url_batch and primary and primary not in tried_urls:
                 url_batch = [primary]
@@ -897,7 +1218,9 @@ class CouncilFileDownloader:
                         logger.debug(f"HTTP {code}로 중단: {url}")
                         # 4xx (429 제외)는 즉시 다음 변형 시도
                         continue
-                    # 5xx 또는 429는 다음 attempt로 백오프
+                    # 5xx 또는 429만 백오프: 해당 호스트의 다음 요청을 뒤로 미룸 (다른 호스트는 영향 없음)
+                    if attempt + 1 < len(backoffs):
+                        self._defer_host(url, backoffs[attempt + 1])
                 except (requests.exceptions.Timeout,
                         requests.exceptions.SSLError,
                         requests.exceptions.ConnectionError) as e:
@@ -914,47 +1237,9 @@ class CouncilFileDownloader:
         """파일명 디코딩 - 다양한 인코딩 시도 (v5.0: 개선)"""
         if not text:
             return text
-
-        # 이미 한글/유니코드로 정상일 수 있음
-        try:
-            if re.search(r'[\uAC00-\uD7A3]', text):  # 한글 포함 확인
-                return text  # 이미 한글이 정상적으로 포함된 경우
-            
-            text.encode('ascii')  # ASCII로 인코딩 시도
-            # ASCII로 인코딩 가능하면 이것은 인코딩 문제가 있을 수 있음
-        except UnicodeEncodeError:
-            # 이미 유니코드로 정상적인 경우
-            return text
-
-        # URL 인코딩 확인
-        if '%' in text:
-            try:
-                decoded = unquote(text)
-                if decoded != text:
-                    return decoded
-            except Exception:
-                pass
-
-        # 다양한 인코딩 시도
-        encodings = ['utf-8', 'euc-kr', 'cp949', 'iso-8859-1', 'latin-1']
-        for encoding in encodings:
-            try:
-                # latin-1로 바이트로 변환 후 다시 목표 인코딩으로 디코딩
-                decoded = text.encode('latin-1').decode(encoding)
-                
-                # 성공적인 디코딩 확인 (한글 포함 여부)
-                if re.search(r'[\uAC00-\uD7A3]', decoded):
-                    return decoded
-            except Exception:
-                continue
-
-        # 마지막 시도: 단순 URL 디코딩
-        try:
-            return unquote(text)
-        except:
-            pass
-
-        return text
+        if len(text) > DECODE_CACHE_MAX_LEN:
+            return _decode_filename(text)
+        return _decode_filename_cached(text)
 
     def download_file(self, file_info: Dict, save_dir: str) -> bool:
         """파일 다운로드"""
@@ -965,11 +1250,12 @@ class CouncilFileDownloader:
         headers = {
             'Referer': url,
             'Accept': '*/*',
-            'User-Agent': random.choice(self.user_agents)
         }
 
         # 실제 요청
+        resp = None
         try:
+            self._throttle_host(url)
             if method == 'post' and data:
                 resp = self.session.post(url, data=data, headers=headers,
                                          timeout=30, stream=True, verify=False, allow_redirects=True)
@@ -979,16 +1265,31 @@ class CouncilFileDownloader:
 
             resp.raise_for_status()
         except Exception as e:
+            if resp is not None:
+                resp.close()
             logger.debug(f"다운로드 요청 실패: {url} - {e}")
+            # 429/5xx는 download_file_with_retry가 호스트 단위로 백오프하도록 전달
+            if resp is not None and (resp.status_code == 429 or resp.status_code >= 500):
+                raise
             return False
 
-        # 콘텐츠 타입 검사
+        # 콘텐츠 타입 검사 (본문은 앞부분만 읽어 판단, 파일이 아니면 나머지는 받지 않고 연결 종료)
+        resp.raw.decode_content = True
+        try:
+            head = resp.raw.read(SNIFF_SIZE)
+        except Exception as e:
+            resp.close()
+            logger.debug(f"다운로드 본문 읽기 실패: {url} - {e}")
+            return False
         content_type = resp.headers.get('Content-Type', '').lower()
-        if 'text/html' in content_type and 'attachment' not in resp.headers.get('Content-Disposition', ''):
+        if ('text/html' in content_type and not head.startswith(b'%PDF')
+                and 'attachment' not in resp.headers.get('Content-Disposition', '')):
+            resp.close()
             # HTML 응답이지만 바로보기 링크인 경우 PDF 변환 시도
             if '바로보기' in file_info.get('text', '') or '미리보기' in file_info.get('text', ''):
                 if self.use_selenium and SELENIUM_AVAILABLE and self.driver:
-                    return self._download_preview_with_selenium(url, file_info, save_dir)
+                    with self._driver_lock:
+                        return self._download_preview_with_selenium(url, file_info, save_dir)
             logger.debug(f"HTML 응답(파일 아님) 건너뜀: {url}")
             return False
 
@@ -996,20 +1297,17 @@ class CouncilFileDownloader:
 
         # 파일명 중복 체크
         if self.deduplicator.is_duplicate_filename(filename, url):
+            resp.close()
             logger.debug(f"중복 파일명 건너뜀: {filename}")
             return False
 
-        save_path = os.path.join(save_dir, filename)
-        save_path = self.get_unique_filepath(save_path)
+        save_path, fd = self._reserve_filepath(os.path.join(save_dir, filename))
 
-        # 저장
-        with open(save_path, 'wb') as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+        # 저장 (해시는 쓰는 동안 같이 계산, 판별용으로 먼저 읽은 앞부분 포함)
+        digest = self._write_response(resp, save_path, _new_content_hasher(), fd=fd, head=head)
 
         # 내용 중복 체크(해시)
-        if self.deduplicator.is_duplicate_content(save_path):
+        if self.deduplicator.is_duplicate_hash(digest):
             logger.info(f"중복 내용 삭제: {filename}")
             os.remove(save_path)
             return False
@@ -1023,6 +1321,35 @@ class CouncilFileDownloader:
         logger.info(f"✓ 다운로드 성공: {filename} ({size:,} bytes)")
         return True
     
+    def _write_response(self, resp: requests.Response, save_path: str, hasher=None,
+                        fd: Optional[int] = None, head: bytes = b'') -> Optional[str]:
+        """
+        스트리밍 응답 본문을 파일로 (gzip 등은 raw에서 풀고, 256KiB 버퍼 하나를 재사용해 readinto)
+        hasher를 주면 쓰는 동안 같이 해시해 hexdigest 반환, fd를 주면 다시 열지 않고 그 fd에 씀
+        head: 이미 raw에서 읽은 본문 앞부분
+        """
+        resp.raw.decode_content = True
+        buf = bytearray(WRITE_CHUNK_SIZE)
+        view = memoryview(buf)
+        # 청크마다 새 bytes를 만들지 않고, 버퍼링 없는 파일에 버퍼를 그대로 씀
+        with (os.fdopen(fd, 'wb', buffering=0) if fd is not None else open(save_path, 'wb', buffering=0)) as f:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            if head:
+                f.write(head)
+                if hasher is not None:
+                    hasher.update(head)
+            readinto, write = resp.raw.readinto, f.write
+            update = hasher.update if hasher is not None else None
+            while n := readinto(buf):
+                chunk = view[:n]
+                if update is not None:
+                    update(chunk)
+                # 버퍼링 없는 파일은 일부만 쓰고 돌아올 수 있음
+                while chunk:
+                    chunk = chunk[write(chunk):]
+        return hasher.hexdigest() if hasher is not None else None
+    
     def _download_preview_with_selenium(self, url: str, file_info: Dict, save_dir: str) -> bool:
         """Selenium으로 바로보기/미리보기 다운로드"""
         if not self.driver:
@@ -1053,7 +1380,7 @@ class CouncilFileDownloader:
             # PDF URL 추출
             pdf_url = pdf_src
             if '?file=' in pdf_src:
-                pdf_url = re.search(r'\?file=([^&]+)', pdf_src).group(1)
+                pdf_url = _RE_VIEWER_FILE.search(pdf_src).group(1)
                 
             if not pdf_url:
                 return False
@@ -1062,7 +1389,7 @@ class CouncilFileDownloader:
             date_str = file_info.get('date', '')
             if not date_str:
                 text = file_info.get('text', '')
-                date_match = re.search(r'(\d{4})년\s*(\d{1,2})월', text)
+                date_match = _RE_YEAR_MONTH_KO.search(text)
                 if date_match:
                     date_str = f"{date_match.group(1)}년 {date_match.group(2)}월"
                     
@@ -1074,16 +1401,12 @@ class CouncilFileDownloader:
                 'User-Agent': self.driver.execute_script("return navigator.userAgent"),
             }
             
+            self._throttle_host(pdf_url)
             resp = self.session.get(pdf_url, headers=headers, timeout=30, 
                                   stream=True, verify=False, allow_redirects=True)
                                   
-            save_path = os.path.join(save_dir, filename)
-            save_path = self.get_unique_filepath(save_path)
-            
-            with open(save_path, 'wb') as f:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            save_path, fd = self._reserve_filepath(os.path.join(save_dir, filename))
+            self._write_response(resp, save_path, fd=fd)
                         
             size = os.path.getsize(save_path)
             if size < 100:
@@ -1105,33 +1428,10 @@ class CouncilFileDownloader:
         # 1) Content-Disposition
         cd = response.headers.get('Content-Disposition', '')
         if cd:
-            # RFC 5987
-            m = re.findall(r"filename\*=UTF-8''([^;]+)", cd)
-            if m:
-                filename = unquote(m[0])
-
-            if not filename:
-                m = re.findall(r"filename\*=([^']+)''([^;]+)", cd)
-                if m:
-                    _, enc_name = m[0]
-                    try:
-                        filename = unquote(enc_name)
-                    except Exception:
-                        filename = enc_name
-
-            if not filename:
-                m = re.findall(r'filename[^;=\n]*=(([\'"]).*?\2|[^;\n]*)', cd)
-                if m:
-                    raw = m[0][0].strip('"\'')
-
-                    # URL 디코딩 + 인코딩 교정
-                    try:
-                        decoded = unquote(raw)
-                        filename = decoded if decoded else raw
-                    except Exception:
-                        filename = raw
-
-                    filename = self.decode_filename(filename)
+            filename = _parse_content_disposition(cd)
+            # 퍼센트 인코딩이나 latin-1로 깨진 한글이 남아 있을 때만 교정
+            if filename and (not filename.isascii() or '%' in filename):
+                filename = self.decode_filename(filename)
 
         # 2) file_info 힌트 - 날짜 정보 활용
         if not filename or len(filename) < 2:
@@ -1169,16 +1469,16 @@ class CouncilFileDownloader:
                 filename = f"file_{int(time.time())}_{random.randint(1000, 9999)}"
 
         # 파일명 정리
-        filename = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', filename).strip()
+        filename = _RE_UNSAFE_FILENAME.sub('_', filename).strip()
         
         # '바로보기' 또는 '미리보기' 텍스트 제거
-        filename = re.sub(r'바로보기|미리보기', '', filename).strip()
-        filename = re.sub(r'__+', '_', filename)  # 중복 언더스코어 제거
+        filename = _RE_PREVIEW_WORDS.sub('', filename).strip()
+        filename = _RE_MULTI_UNDERSCORE.sub('_', filename)  # 중복 언더스코어 제거
         
         # 너무 긴 파일명 처리 (확장자 보존 시도)
         if len(filename) > 200:
             name_part = filename[:190]
-            ext_match = re.search(r'\.[A-Za-z0-9]+$', filename)
+            ext_match = _RE_FILE_EXT.search(filename)
             if ext_match:
                 filename = name_part + ext_match.group()
             else:
@@ -1222,16 +1522,23 @@ class CouncilFileDownloader:
         return filename
 
     def get_unique_filepath(self, filepath: str) -> str:
-        """고유한 파일 경로 생성"""
-        if not os.path.exists(filepath):
-            return filepath
+        """고유한 파일 경로 생성 (빈 파일로 선점해 병렬 다운로드 간 같은 경로 배정 방지)"""
+        path, fd = self._reserve_filepath(filepath)
+        os.close(fd)
+        return path
+    
+    def _reserve_filepath(self, filepath: str) -> Tuple[str, int]:
+        """O_CREAT|O_EXCL로 고유 경로를 선점하고 (경로, 쓰기용 fd) 반환 - 존재 확인과 생성이 syscall 하나"""
         base, ext = os.path.splitext(filepath)
-        i = 1
+        i = 0
         candidate = filepath
-        while os.path.exists(candidate):
-            candidate = f"{base}_{i}{ext}"
-            i += 1
-        return candidate
+        while True:
+            try:
+                fd = os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0), 0o644)
+                return candidate, fd
+            except FileExistsError:
+                i += 1
+                candidate = f"{base}_{i}{ext}"
 
     def process_site_with_selenium(self, url: str) -> List[Dict]:
         """Selenium으로 동적 페이지에서 다운로드 링크 수집"""
@@ -1274,15 +1581,15 @@ class CouncilFileDownloader:
                 except:
                     continue
 
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            soup = BeautifulSoup(self.driver.page_source, _BS4_PARSER)
             results = self.extract_all_download_urls(soup, url)
         except Exception as e:
             logger.debug(f"Selenium 처리 오류: {e}")
 
         return results
 
-    def process_site(self, url: str) -> Dict:
-        """사이트 처리"""
+    def _start_site(self, url: str) -> Tuple[str, Dict, str]:
+        """사이트 처리 시작: (사이트명, 통계, 저장 폴더)"""
         site_name = self.get_site_name(url)
         logger.info(f"\n{'='*60}")
         logger.info(f"📍 처리 중: {site_name}")
@@ -1304,12 +1611,16 @@ class CouncilFileDownloader:
 
         site_dir = os.path.join(self.base_download_dir, site_name)
         os.makedirs(site_dir, exist_ok=True)
+        return site_name, stats, site_dir
+
+    def process_site(self, url: str) -> Dict:
+        """사이트 처리"""
+        site_name, stats, site_dir = self._start_site(url)
 
         try:
-            headers = {'User-Agent': random.choice(self.user_agents)}
-            resp = self.session.get(url, timeout=30, verify=False, headers=headers)
-            resp.encoding = self._detect_encoding(resp)
-            soup = BeautifulSoup(resp.text, 'html.parser')
+            self._throttle_host(url)
+            resp = self.session.get(url, timeout=30, verify=False)
+            soup = self._parse_html_bytes(resp.content, resp.headers.get('Content-Type', ''))
 
             all_links = soup.find_all('a')
             stats['total_links'] = len(all_links)
@@ -1320,10 +1631,13 @@ class CouncilFileDownloader:
             # Selenium 보조
             if self.use_selenium and SELENIUM_AVAILABLE and self.driver:
                 logger.info("🤖 Selenium으로 동적 콘텐츠 확인 중...")
-                selenium_urls = self.process_site_with_selenium(url)
+                with self._driver_lock:
+                    selenium_urls = self.process_site_with_selenium(url)
                 # URL 중복 제거
+                existing = {du['url'] for du in download_urls}
                 for su in selenium_urls:
-                    if not any(du['url'] == su['url'] for du in download_urls):
+                    if su['url'] not in existing:
+                        existing.add(su['url'])
                         download_urls.append(su)
             
             stats['download_candidates'] = len(download_urls)
@@ -1333,91 +1647,107 @@ class CouncilFileDownloader:
             stats['detail_pages'] = len(detail_links)
             logger.info(f"🔍 상세 페이지: {stats['detail_pages']}개 탐색 중...")
 
-            # 상세 페이지 탐색 (최대 100개)
-            for durl, date_str in detail_links[:100]:
-                for dl in self.explore_detail_page(durl, url):
+            # 상세 페이지 탐색 (최대 100개, aiohttp가 있으면 DETAIL_PAGE_CONCURRENCY개씩 동시에)
+            targets = detail_links[:100]
+            if aiohttp is not None and targets:
+                found = asyncio.run(self._explore_details_async(targets, url))
+            else:
+                found = [self.explore_detail_page(durl, url) for durl, _ in targets]
+            for (_, date_str), dls in zip(targets, found):
+                for dl in dls:
                     dl['date'] = date_str
                     dl['site_name'] = site_name  # 사이트명 추가
                     download_urls.append(dl)
-                time.sleep(random.uniform(0.2, 0.5))
-
-            # 기간 필터링
-            filtered: List[Dict] = []
-            for info in download_urls:
-                if info.get('date'):
-                    info['site_name'] = site_name  # 사이트명 추가
-                    filtered.append(info)
-                    continue
 
-                text_to_check = f"{info.get('text', '')} {info.get('title', '')}"
-                is_target, date_str = self.is_target_date(text_to_check)
-                if is_target:
-                    info['date'] = date_str
-                    info['site_name'] = site_name  # 사이트명 추가
-                    filtered.append(info)
+            self._filter_and_download(download_urls, stats, site_name, site_dir)
 
-            stats['target_files'] = len(filtered)
-            logger.info(f"🎯 대상 파일: {stats['target_files']}개")
+        except requests.exceptions.Timeout:
+            em = "페이지 로딩 타임아웃"
+            stats['errors'].append(em)
+            logger.error(f"❌ {site_name}: {em}")
+        except requests.exceptions.ConnectionError:
+            em = "네트워크 연결 오류"
+            stats['errors'].append(em)
+            logger.error(f"❌ {site_name}: {em}")
+        except Exception as e:
+            em = f"처리 오류: {str(e)[:200]}"
+            stats['errors'].append(em)
+            logger.error(f"❌ {site_name}: {em}")
 
-            if stats['target_files'] == 0:
-                logger.warning(f"⚠️  {site_name}: 대상 기간의 파일을 찾을 수 없습니다.")
+        self._log_site_result(stats)
+        return stats
 
-            # 진행 표시
-            if TQDM_AVAILABLE:
-                pbar = tqdm(total=stats['target_files'], desc=f"{site_name} 다운로드", 
-                            unit="file", leave=False)
-            
-            for idx, info in enumerate(filtered, 1):
+    def _filter_and_download(self, download_urls: List[Dict], stats: Dict, site_name: str, site_dir: str) -> None:
+        """수집한 후보 중 대상 기간 파일만 골라 다운로드 (stats 갱신)"""
+        # 기간 필터링 (날짜가 없는 후보만 한 번에 날짜 판별)
+        undated = [info for info in download_urls if not info.get('date')]
+        found = self.match_target_dates(
+            [f"{info.get('text', '')} {info.get('title', '')}" for info in undated]
+        )
+        for info, date_str in zip(undated, found):
+            if date_str:
+                info['date'] = date_str
+        
+        filtered: List[Dict] = []
+        for info in download_urls:
+            if info.get('date'):
+                info['site_name'] = site_name  # 사이트명 추가
+                filtered.append(info)
+
+        stats['target_files'] = len(filtered)
+        logger.info(f"🎯 대상 파일: {stats['target_files']}개")
+
+        if stats['target_files'] == 0:
+            logger.warning(f"⚠️  {site_name}: 대상 기간의 파일을 찾을 수 없습니다.")
+
+        # 진행 표시
+        if TQDM_AVAILABLE:
+            pbar = tqdm(total=stats['target_files'], desc=f"{site_name} 다운로드", 
+                        unit="file", leave=False)
+        
+        for info in filtered:
+            # 파일명 프리픽스에 날짜 표시
+            if info.get('date'):
+                original_text = info.get('text', '')
+                if original_text and info['date'] not in original_text:
+                    info['text'] = f"{info['date']}_{original_text}"
+        
+        # 사이트 내 파일은 per_site_workers개씩 동시에 (요청 간격은 호스트 리미터가 유지)
+        workers = self.per_site_workers
+        
+        def _download(idx: int, info: Dict) -> bool:
+            logger.info(f"⏬ [{idx}/{stats['target_files']}] 다운로드 시도: {info.get('text', 'unknown')[:60]}")
+            return self.download_file_with_retry(info, site_dir, max_retries=4)
+        
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = {ex.submit(_download, idx, info): info for idx, info in enumerate(filtered, 1)}
+            for fut in concurrent.futures.as_completed(futures):
+                info = futures[fut]
                 try:
-                    # 파일명 프리픽스에 날짜 표시
-                    if info.get('date'):
-                        original_text = info.get('text', '')
-                        if original_text and info['date'] not in original_text:
-                            info['text'] = f"{info['date']}_{original_text}"
-
-                    logger.info(f"⏬ [{idx}/{stats['target_files']}] 다운로드 시도: {info.get('text', 'unknown')[:60]}")
-                    ok = self.download_file_with_retry(info, site_dir, max_retries=4)
-                    if ok:
+                    if fut.result():
                         stats['downloaded'] += 1
                     else:
                         stats['failed'] += 1
                         stats['errors'].append(f"다운로드 실패: {info.get('text', 'unknown')[:60]}")
-
-                    # 진행 표시 업데이트
-                    if TQDM_AVAILABLE:
-                        pbar.update(1)
-                        
-                    time.sleep(random.uniform(0.25, 0.6))
                 except Exception as e:
                     stats['failed'] += 1
                     em = f"파일 처리 오류: {str(e)[:120]}"
                     stats['errors'].append(em)
                     logger.error(f"❌ {em}")
-                    
-                    # 진행 표시 업데이트
-                    if TQDM_AVAILABLE:
-                        pbar.update(1)
-            
-            # 진행 표시 종료
-            if TQDM_AVAILABLE:
-                pbar.close()
-
-            initial_candidates = stats['download_candidates'] + stats['detail_pages']
-            stats['duplicates_removed'] = max(0, initial_candidates - stats['target_files'])
+                
+                # 진행 표시 업데이트
+                if TQDM_AVAILABLE:
+                    pbar.update(1)
+        
+        # 진행 표시 종료
+        if TQDM_AVAILABLE:
+            pbar.close()
 
-        except requests.exceptions.Timeout:
-            em = "페이지 로딩 타임아웃"
-            stats['errors'].append(em)
-            logger.error(f"❌ {site_name}: {em}")
-        except requests.exceptions.ConnectionError:
-            em = "네트워크 연결 오류"
-            stats['errors'].append(em)
-            logger.error(f"❌ {site_name}: {em}")
-        except Exception as e:
-            em = f"처리 오류: {str(e)[:200]}"
-            stats['errors'].append(em)
-            logger.error(f"❌ {site_name}: {em}")
+        initial_candidates = stats['download_candidates'] + stats['detail_pages']
+        stats['duplicates_removed'] = max(0, initial_candidates - stats['target_files'])
 
+    def _log_site_result(self, stats: Dict) -> None:
+        site_name = stats['site_name']
         if stats['downloaded'] > 0:
             logger.info(f"✅ {site_name} 완료: {stats['downloaded']}/{stats['target_files']}개 다운로드 성공")
         elif stats['target_files'] > 0:
@@ -1425,8 +1755,114 @@ class CouncilFileDownloader:
         else:
             logger.info(f"ℹ️  {site_name}: 대상 파일 없음")
 
-        return stats
-        
+    # ---- async 모드: 페이지 조회는 aiohttp, HTML 파싱/파일 다운로드는 스레드 풀 ----
+    async def _afetch_soup(self, session, url: str, timeout: int) -> BeautifulSoup:
+        async with session.get(url, ssl=False,
+                               timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+            content = await resp.read()
+            content_type = resp.headers.get('Content-Type', '')
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._parse_html_bytes, content, content_type)
+    
+    async def _aexplore_detail_page(self, session, sem: asyncio.Semaphore, detail_url: str, base_url: str) -> List[Dict]:
+        """explore_detail_page의 async 버전 - 재시도 포함 (요청 간격은 호스트 리미터가 유지)"""
+        loop = asyncio.get_running_loop()
+        for attempt in range(3):
+            try:
+                async with sem:
+                    wait = self._host_wait(detail_url)
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    soup = await self._afetch_soup(session, detail_url, 15)
+                return await loop.run_in_executor(None, self.extract_all_download_urls, soup, detail_url)
+            except Exception as e:
+                if attempt < 2:
+                    logger.debug(f"상세 페이지 시도 {attempt+1} 실패: {detail_url}")
+                    await asyncio.sleep(1)
+                else:
+                    logger.debug(f"상세 페이지 최종 실패: {detail_url} - {e}")
+        return []
+    
+    def _aiohttp_headers(self) -> Dict[str, str]:
+        """세션 헤더는 requests 세션과 동일하게 (Accept-Encoding은 aiohttp가 지원하는 값으로)"""
+        return {k: v for k, v in self.session.headers.items() if k.lower() != 'accept-encoding'}
+    
+    async def _explore_details_async(self, targets: List[Tuple[str, str]], base_url: str) -> List[List[Dict]]:
+        """스레드/프로세스 모드의 process_site용: 상세 페이지를 사이트당 DETAIL_PAGE_CONCURRENCY개씩 동시에 조회"""
+        connector = aiohttp.TCPConnector(limit_per_host=DETAIL_PAGE_CONCURRENCY, ssl=False)
+        sem = asyncio.Semaphore(DETAIL_PAGE_CONCURRENCY)
+        # 목록 페이지는 requests 세션으로 받았으므로 그때 받은 쿠키(JSESSIONID 등)를 그대로 넘김
+        async with aiohttp.ClientSession(connector=connector, headers=self._aiohttp_headers(),
+                                         cookies=self.session.cookies.get_dict()) as session:
+            return await asyncio.gather(
+                *[self._aexplore_detail_page(session, sem, durl, base_url) for durl, _ in targets]
+            )
+    
+    async def process_site_async(self, url: str, session, sem: asyncio.Semaphore) -> Dict:
+        """process_site와 같은 흐름, 상세 페이지를 순차+sleep 대신 동시에 조회 (Selenium 미사용)"""
+        async with sem:
+            site_name, stats, site_dir = self._start_site(url)
+            loop = asyncio.get_running_loop()
+            try:
+                soup = await self._afetch_soup(session, url, 30)
+
+                stats['total_links'] = len(soup.find_all('a'))
+                logger.info(f"📊 전체 링크 수: {stats['total_links']:,}개")
+
+                download_urls = await loop.run_in_executor(None, self.extract_all_download_urls, soup, url)
+                stats['download_candidates'] = len(download_urls)
+                logger.info(f"📥 다운로드 후보: {stats['download_candidates']}개")
+
+                detail_links = self.find_detail_page_links(soup, url)
+                stats['detail_pages'] = len(detail_links)
+                logger.info(f"🔍 상세 페이지: {stats['detail_pages']}개 탐색 중...")
+
+                # 상세 페이지 탐색 (최대 100개, 사이트당 DETAIL_PAGE_CONCURRENCY개씩)
+                detail_sem = asyncio.Semaphore(DETAIL_PAGE_CONCURRENCY)
+                targets = detail_links[:100]
+                found = await asyncio.gather(
+                    *[self._aexplore_detail_page(session, detail_sem, durl, url) for durl, _ in targets]
+                )
+                for (_, date_str), dls in zip(targets, found):
+                    for dl in dls:
+                        dl['date'] = date_str
+                        dl['site_name'] = site_name  # 사이트명 추가
+                        download_urls.append(dl)
+
+                # 다운로드는 기존 재시도/파일명 로직 그대로 (스레드에서 실행)
+                await loop.run_in_executor(None, self._filter_and_download,
+                                           download_urls, stats, site_name, site_dir)
+
+            except asyncio.TimeoutError:
+                em = "페이지 로딩 타임아웃"
+                stats['errors'].append(em)
+                logger.error(f"❌ {site_name}: {em}")
+            except aiohttp.ClientConnectionError:
+                em = "네트워크 연결 오류"
+                stats['errors'].append(em)
+                logger.error(f"❌ {site_name}: {em}")
+            except Exception as e:
+                em = f"처리 오류: {str(e)[:200]}"
+                stats['errors'].append(em)
+                logger.error(f"❌ {site_name}: {em}")
+
+            self._log_site_result(stats)
+            return stats
+    
+    async def _gather_sites(self, urls: List[str]) -> List[Dict]:
+        loop = asyncio.get_running_loop()
+        # 파싱/다운로드용 스레드 수를 워커 수에 맞춤 (기본 executor는 CPU 수 기준이라 작음)
+        # 사이트별 다운로드가 스레드를 오래 잡으므로 파싱용 여유분을 더 둠
+        executor = ThreadPoolExecutor(max_workers=self.max_workers + DETAIL_PAGE_CONCURRENCY)
+        loop.set_default_executor(executor)
+        connector = aiohttp.TCPConnector(limit=self.max_workers * 2, ssl=False)
+        async with aiohttp.ClientSession(connector=connector, headers=self._aiohttp_headers()) as session:
+            sem = asyncio.Semaphore(self.max_workers)
+            done = asyncio.as_completed([self.process_site_async(url, session, sem) for url in urls])
+            if TQDM_AVAILABLE:
+                done = tqdm(done, total=len(urls), desc="사이트 처리 중", unit="site")
+            return [await fut for fut in done]
+
     def process_sites_parallel(self, urls: List[str]) -> List[Dict]:
         """병렬 처리로 여러 사이트 동시 처리"""
         all_stats = []
@@ -1438,46 +1874,50 @@ class CouncilFileDownloader:
                 stats = self.process_site(url)
                 all_stats.append(stats)
                 self.stats[stats['site_name']] = stats
-                
-                if i < len(urls):
-                    time.sleep(random.uniform(1.0, 2.0))
             return all_stats
         
-        # 병렬 처리
-        with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            # Selenium을 사용하는 경우 프로세스 풀의 각 워커에게 알림
-            if self.use_selenium:
-                # 각 프로세스마다 독립적인 Selenium 세션을 생성해야 함
-                # 이를 위한 설정 전달 (직접 실행 시에는 처리 필요)
-                pass
-                
-            # 진행 표시
-            if TQDM_AVAILABLE:
-                results = list(tqdm(
-                    executor.map(self.process_site, urls),
-                    total=len(urls),
-                    desc="사이트 처리 중",
-                    unit="site"
-                ))
-            else:
-                # 병렬 처리 실행
-                futures = [executor.submit(self.process_site, url) for url in urls]
-                
-                # 결과 수집
-                results = []
-                for i, future in enumerate(concurrent.futures.as_completed(futures)):
-                    try:
-                        stats = future.result()
-                        results.append(stats)
-                        logger.info(f"완료: {i+1}/{len(urls)} - {stats['site_name']}")
-                    except Exception as e:
-                        logger.error(f"처리 오류: {e}")
-                
-            all_stats = results
-            
-            # 통계 저장
+        # asyncio 모드 (Selenium 드라이버는 사이트 간 공유가 안 되므로 스레드/순차 경로 사용)
+        if self.executor_kind == "async" and aiohttp is not None and not self.use_selenium:
+            logger.info(f"⚡ asyncio + aiohttp 사용 (동시 사이트 {self.max_workers})")
+            all_stats = asyncio.run(self._gather_sites(urls))
+            for stats in all_stats:
+                self.stats[stats['site_name']] = stats
+            return all_stats
+        
+        # Flask 내부에서는 프로세스 풀 금지 → 스레드 풀 사용
+        if self.running_in_flask or self.executor_kind != "process":
+            logger.info(f"🧵 ThreadPoolExecutor 사용 (workers={self.max_workers})")
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                it = executor.map(self.process_site, urls)
+                if TQDM_AVAILABLE:
+                    it = tqdm(it, total=len(urls), desc="사이트 처리 중", unit="site")
+                all_stats.extend(it)
             for stats in all_stats:
                 self.stats[stats['site_name']] = stats
+            return all_stats
+        
+        # (옵션) 프로세스 풀 — CLI에서만, 풀은 모듈 단위로 유지
+        logger.info(f"⚙️ ProcessPoolExecutor 사용 (workers={self.max_workers})")
+        executor = get_pool(self.max_workers, self.use_selenium, self.base_download_dir)
+        futures = {executor.submit(_worker_process_site, url): url for url in urls}
+        
+        # 진행 표시
+        done = concurrent.futures.as_completed(futures)
+        if TQDM_AVAILABLE:
+            done = tqdm(done, total=len(urls), desc="사이트 처리 중", unit="site")
+        
+        # 결과 수집
+        for i, future in enumerate(done):
+            try:
+                stats = future.result()
+                all_stats.append(stats)
+                logger.info(f"완료: {i+1}/{len(urls)} - {stats['site_name']}")
+            except Exception as e:
+                logger.error(f"처리 오류 ({futures[future]}): {e}")
+        
+        # 통계 저장
+        for stats in all_stats:
+            self.stats[stats['site_name']] = stats
                 
         return all_stats
 
@@ -1488,7 +1928,7 @@ class CouncilFileDownloader:
         logger.info(f"{'='*80}")
         logger.info(f"⏰ 실행 시각: {self.current_date.strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info(f"📅 대상 월: {', '.join([f'{y}년 {m}월' for y, m in self.target_months])}")
-        logger.info(f"🧵 병렬 처리: {self.max_workers}개 프로세스 사용")
+        logger.info(f"🧵 병렬 처리: {self.max_workers}개 워커 사용 ({self.executor_kind})")
 
         url_file = 'urls.txt'
         if os.path.exists('urls_test.txt'):
@@ -1527,7 +1967,7 @@ class CouncilFileDownloader:
         report.append(f"⏱️  소요 시간: {int(elapsed_time // 60)}분 {int(elapsed_time % 60)}초")
         report.append(f"📅 대상 기간: {', '.join([f'{y}년 {m}월' for y, m in self.target_months])}")
         report.append(f"🏢 처리 사이트: {len(all_stats)}개")
-        report.append(f"🧵 병렬 처리: {self.max_workers}개 프로세스 사용")
+        report.append(f"🧵 병렬 처리: {self.max_workers}개 워커 사용 ({self.executor_kind})")
         report.append("")
 
         total_links = sum(s['total_links'] for s in all_stats)
@@ -1666,7 +2106,8 @@ def main():
         epilog="""
 💡 사용 예시:
   python %(prog)s                 # 기본 실행 (병렬 처리)
-  python %(prog)s --workers 8       # 8개 프로세스로 병렬 처리
+  python %(prog)s --workers 8       # 8개 워커로 병렬 처리
+  DOWNLOADER_EXECUTOR=process python %(prog)s  # 프로세스 풀 사용 (기본: aiohttp 있으면 async, 없으면 스레드)
   python %(prog)s --selenium        # Selenium 사용 (동적 페이지)
   python %(prog)s --test            # 테스트 모드 
   python %(prog)s --selenium --test # Selenium + 테스트 모드
@@ -1676,7 +2117,8 @@ def main():
     parser.add_argument('--selenium', action='store_true', help='Selenium 사용 (동적 페이지 처리)')
     parser.add_argument('--test', action='store_true', help='테스트 모드: urls_test.txt가 있을 때 우선 사용')
     parser.add_argument('--debug', action='store_true', help='디버그 로그 출력 (DEBUG 레벨)')
-    parser.add_argument('--workers', type=int, default=4, help='병렬 처리 프로세스 수 (기본: 4)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help=f'병렬 워커 수 (기본: 스레드 {THREAD_WORKERS_DEFAULT}, 프로세스 {PROCESS_WORKERS_DEFAULT})')
     parser.add_argument('--outdir', type=str, default='pdf_data', help='결과 저장 루트 디렉토리 (기본: pdf_data)')
 
     args = parser.parse_args()
@@ -1693,21 +2135,24 @@ def main():
         logger.error("❌ 테스트 모드이지만 urls_test.txt 파일이 없습니다.")
         return
 
-    # 병렬 처리 설정
+    # 병렬 처리 설정 (스레드는 I/O 대기라 더 많이, 프로세스는 메모리 부담으로 16까지)
+    use_process = _executor_kind_from_env() == "process" and not _running_in_flask_from_env()
     max_workers = args.workers
+    if max_workers is None:
+        max_workers = PROCESS_WORKERS_DEFAULT if use_process else THREAD_WORKERS_DEFAULT
+    worker_cap = 16 if use_process else 64
     if max_workers < 1:
         max_workers = 1
-    elif max_workers > 16:  # 최대 제한
-        max_workers = 16
+    elif max_workers > worker_cap:  # 최대 제한
+        max_workers = worker_cap
         
-    # 다운로더 초기화
-    downloader = CouncilFileDownloader(use_selenium=args.selenium, max_workers=max_workers)
-
     # 출력 폴더를 pdf_data/<타임스탬프> 형태로 강제
-    ts = downloader.current_date.strftime('%Y%m%d_%H%M')
+    ts = datetime.now().strftime('%Y%m%d_%H%M')
     out_root = os.path.abspath(args.outdir)
-    downloader.base_download_dir = os.path.join(out_root, ts)
-    os.makedirs(downloader.base_download_dir, exist_ok=True)
+
+    # 다운로더 초기화
+    downloader = CouncilFileDownloader(use_selenium=args.selenium, max_workers=max_workers,
+                                       base_download_dir=os.path.join(out_root, ts))
 
     try:
         downloader.run()
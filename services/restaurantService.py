@@ -3,16 +3,33 @@
 import os
 import math
 import re
+import hashlib
 import requests
-from sqlalchemy import func
+from sqlalchemy import exists, func, lambda_stmt, literal_column, or_, select, text, tuple_
+from sqlalchemy.orm import load_only, raiseload
 
 from models import db, RestaurantInfo
+from services.cacheService import invalidate_restaurant_cache, cache_get_json, cache_set_json
+
+try:
+    import numpy as np  # PostGIS 없는 환경의 거리 계산 벡터화
+except ImportError:
+    np = None
+
+try:
+    from numba import njit  # _haversine 네이티브 컴파일 (스칼라 루프용)
+except ImportError:
+    njit = None
 
 # ✅ Naver Local Search API 설정 - 환경변수에서 가져오기
 NAVER_CLIENT_ID = os.environ.get("NAVER_CLIENT_ID", "")
 NAVER_CLIENT_SECRET = os.environ.get("NAVER_CLIENT_SECRET", "")
 NAVER_LOCAL_URL = "https://openapi.naver.com/v1/search/local.json"
 
+# 같은 상호명 재조회는 Naver 호출 없이 캐시 결과 사용
+# (검색 결과는 query/display에만 의존, 좌표 매칭은 호출 뒤에 하므로 키에 좌표 불필요)
+NAVER_LOCAL_CACHE_TTL = 24 * 60 * 60
+
 
 def _strip_html_tags(text: str) -> str:
     if not text:
@@ -24,21 +41,268 @@ def _strip_html_tags(text: str) -> str:
 def _haversine(lat1, lng1, lat2, lng2):
     """
     두 위도/경도 사이 거리(m) 계산 (Haversine formula)
+    - numba가 있으면 njit으로 컴파일되므로 float 위치 인자만 넘길 것
     """
-    R = 6371000  # meters
-    rad = math.radians
+    R = 6371000.0  # meters
 
-    dlat = rad(lat2 - lat1)
-    dlng = rad(lng2 - lng1)
+    dlat = math.radians(lat2 - lat1)
+    dlng = math.radians(lng2 - lng1)
 
     a = (
         math.sin(dlat / 2) ** 2
-        + math.cos(rad(lat1)) * math.cos(rad(lat2)) * math.sin(dlng / 2) ** 2
+        + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlng / 2) ** 2
     )
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
     return R * c
 
 
+if njit is not None:
+    # cache=True: 컴파일 결과를 __pycache__에 저장 → 재기동 시 재컴파일 없음
+    _haversine = njit(cache=True, fastmath=True)(_haversine)
+
+
+def warmup_haversine() -> None:
+    """기동 시 1회 호출: 첫 요청에서 JIT 컴파일(또는 캐시 로드) 지연이 생기지 않도록"""
+    _haversine(0.0, 0.0, 0.0, 0.0)
+
+
+def restaurant_exists(res_id) -> bool:
+    """FK 존재 확인용: 행을 ORM 객체로 로드하지 않고 SELECT EXISTS(...) 한 번 (PK 인덱스 조회)"""
+    return db.session.scalar(
+        select(exists().where(RestaurantInfo.res_id == res_id))
+    ) is True
+
+
+# 목록 API에서 직렬화하는 컬럼만 로드 (people 등 나머지는 hydrate하지 않음)
+RESTAURANT_LIST_COLUMNS = (
+    RestaurantInfo.res_id,
+    RestaurantInfo.res_name,
+    RestaurantInfo.address,
+    RestaurantInfo.lat,
+    RestaurantInfo.lng,
+    RestaurantInfo.res_phone,
+    RestaurantInfo.category,
+    RestaurantInfo.price,
+    RestaurantInfo.score,
+    RestaurantInfo.price_min,
+    RestaurantInfo.price_max,
+    RestaurantInfo.price_avg,
+    RestaurantInfo.price_count,
+)
+
+
+def restaurant_list_stmt(search="", category="", min_score=None, max_price=None,
+                         sort="name_asc", debug=False, after=None):
+    """
+    음식점 목록 select를 lambda_stmt로 구성
+    - 어떤 필터/정렬 분기를 탔는지가 캐시 키 → 조합별로 SQL 컴파일은 최초 1회
+    - search/min_score 등 값은 바인드 파라미터로만 바뀜
+    - after: name_asc keyset 커서 (res_name, res_id) → 그 다음 행부터
+    """
+    stmt = lambda_stmt(
+        lambda: select(RestaurantInfo).options(load_only(*RESTAURANT_LIST_COLUMNS))
+    )
+    if debug:
+        # 개발 모드: 목록에서 관계 lazy load(N+1)가 일어나면 바로 에러
+        stmt += lambda s: s.options(raiseload("*"))
+
+    if search:
+        search_pattern = f"%{search}%"
+        stmt += lambda s: s.where(
+            or_(
+                RestaurantInfo.res_name.ilike(search_pattern),
+                RestaurantInfo.address.ilike(search_pattern),
+            )
+        )
+    if category:
+        category_pattern = f"%{category}%"
+        stmt += lambda s: s.where(RestaurantInfo.category.ilike(category_pattern))
+    if min_score is not None:
+        stmt += lambda s: s.where(RestaurantInfo.score >= min_score)
+    if max_price is not None:
+        stmt += lambda s: s.where(
+            or_(RestaurantInfo.price_avg <= max_price, RestaurantInfo.price_avg.is_(None))
+        )
+
+    if sort == "score_desc":
+        stmt += lambda s: s.order_by(RestaurantInfo.score.desc().nullslast())
+    elif sort == "price_asc":
+        stmt += lambda s: s.order_by(RestaurantInfo.price_avg.asc().nullslast())
+    elif sort == "price_desc":
+        stmt += lambda s: s.order_by(RestaurantInfo.price_avg.desc().nullslast())
+    elif sort == "name_asc":
+        if after is not None:
+            after_name, after_id = after
+            stmt += lambda s: s.where(
+                tuple_(RestaurantInfo.res_name, RestaurantInfo.res_id)
+                > tuple_(after_name, after_id)
+            )
+        # 동명 식당이 있으므로 PK로 순서 고정 (keyset 커서의 전제)
+        stmt += lambda s: s.order_by(RestaurantInfo.res_name.asc(), RestaurantInfo.res_id.asc())
+    elif sort == "name_desc":
+        stmt += lambda s: s.order_by(RestaurantInfo.res_name.desc())
+    else:
+        stmt += lambda s: s.order_by(RestaurantInfo.res_id.desc())
+    return stmt
+
+
+def approximate_restaurant_count() -> int:
+    """
+    pg_class.reltuples 기반 대략적인 전체 행 수 (테이블 스캔 없음)
+    - ANALYZE 전(-1)이거나 PostgreSQL이 아니면 COUNT(*)로 대체
+    """
+    if db.engine.dialect.name == "postgresql":
+        estimate = db.session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'restaurant_info'")
+        ).scalar()
+        if estimate is not None and estimate >= 0:
+            return int(estimate)
+    return db.session.query(func.count(RestaurantInfo.res_id)).scalar()
+
+
+# ============================================
+# 위치 기반 조회 (PostGIS geography 컬럼)
+# ============================================
+# restaurant_info.geom은 schema_migrations에서 lat/lng 기반 생성 컬럼으로 추가됨
+RESTAURANT_GEOM = literal_column("restaurant_info.geom")
+
+_postgis_ready = None
+
+
+def postgis_available() -> bool:
+    """restaurant_info.geom 컬럼이 있는지 (프로세스당 최초 1회 조회 후 캐시)"""
+    global _postgis_ready
+    if _postgis_ready is None:
+        try:
+            _postgis_ready = db.session.execute(
+                text(
+                    "SELECT 1 FROM information_schema.columns "
+                    "WHERE table_name = 'restaurant_info' AND column_name = 'geom'"
+                )
+            ).first() is not None
+        except Exception:
+            db.session.rollback()
+            _postgis_ready = False
+    return _postgis_ready
+
+
+# ============================================
+# 통계: 카테고리별 개수 (materialized view)
+# ============================================
+_category_view_ready = None
+
+
+def category_view_available() -> bool:
+    """restaurant_category_counts 뷰가 있는지 (프로세스당 최초 1회 조회 후 캐시)"""
+    global _category_view_ready
+    if _category_view_ready is None:
+        try:
+            _category_view_ready = db.session.execute(
+                text("SELECT 1 FROM pg_matviews WHERE matviewname = 'restaurant_category_counts'")
+            ).first() is not None
+        except Exception:
+            db.session.rollback()
+            _category_view_ready = False
+    return _category_view_ready
+
+
+def top_categories(limit: int = 10):
+    """[(category, count)] 많은 순 - 뷰가 있으면 뷰에서, 없으면 테이블 GROUP BY"""
+    if category_view_available():
+        return db.session.execute(
+            text("SELECT category, c FROM restaurant_category_counts ORDER BY c DESC LIMIT :limit"),
+            {"limit": limit},
+        ).all()
+
+    return db.session.query(
+        RestaurantInfo.category,
+        func.count(RestaurantInfo.res_id).label('count')
+    ).filter(
+        RestaurantInfo.category.isnot(None)
+    ).group_by(
+        RestaurantInfo.category
+    ).order_by(
+        func.count(RestaurantInfo.res_id).desc()
+    ).limit(limit).all()
+
+
+def refresh_category_counts() -> None:
+    """스케줄러에서 주기 호출 (쓰기 때마다 갱신하지 않음 - Naver 저장이 잦음)"""
+    if not category_view_available():
+        return
+    db.session.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY restaurant_category_counts"))
+    db.session.commit()
+
+
+def _geo_point(lat: float, lng: float):
+    """(lat, lng) → geography(Point, 4326)"""
+    return func.geography(func.ST_SetSRID(func.ST_MakePoint(lng, lat), 4326))
+
+
+def filter_within_radius(query, lat: float, lng: float, radius_m: float):
+    """반경(m) 안의 음식점만 (GiST 인덱스로 범위 검색)"""
+    return query.filter(func.ST_DWithin(RESTAURANT_GEOM, _geo_point(lat, lng), radius_m))
+
+
+def order_by_distance(query, lat: float, lng: float):
+    """(RestaurantInfo, distance_m) 행을 가까운 순(KNN)으로"""
+    point = _geo_point(lat, lng)
+    return query.add_columns(
+        func.ST_Distance(RESTAURANT_GEOM, point).label("distance_m")
+    ).order_by(RESTAURANT_GEOM.op("<->")(point))
+
+
+def distances_within_radius(query, lat: float, lng: float, radius_m: float):
+    """
+    PostGIS 없을 때의 반경 검색: 좌표 컬럼만 가져와 한 번에 거리 계산
+    Returns: [(res_id, distance_m)] 가까운 순
+    """
+    rows = query.with_entities(
+        RestaurantInfo.res_id, RestaurantInfo.lat, RestaurantInfo.lng
+    ).all()
+    if not rows:
+        return []
+
+    if np is None:
+        hits = []
+        for res_id, r_lat, r_lng in rows:
+            distance = _haversine(float(lat), float(lng), float(r_lat), float(r_lng))
+            if distance <= radius_m:
+                hits.append((res_id, distance))
+        hits.sort(key=lambda h: h[1])
+        return hits
+
+    n = len(rows)
+    ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=n)
+    lats = np.fromiter((r[1] for r in rows), dtype=np.float64, count=n)
+    lngs = np.fromiter((r[2] for r in rows), dtype=np.float64, count=n)
+
+    dlat = np.radians(lats - lat)
+    dlng = np.radians(lngs - lng)
+    a = (
+        np.sin(dlat / 2) ** 2
+        + math.cos(math.radians(lat)) * np.cos(np.radians(lats)) * np.sin(dlng / 2) ** 2
+    )
+    d = 2 * 6371000 * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+    idx = np.flatnonzero(d <= radius_m)
+    idx = idx[np.argsort(d[idx], kind="stable")]
+    return list(zip(ids[idx].tolist(), d[idx].tolist()))
+
+
+def load_restaurants_with_distance(hits):
+    """[(res_id, distance_m)] → [(RestaurantInfo, distance_m)] (순서 유지, IN 쿼리 1회)"""
+    if not hits:
+        return []
+    by_id = {
+        r.res_id: r
+        for r in RestaurantInfo.query.options(load_only(*RESTAURANT_LIST_COLUMNS))
+        .filter(RestaurantInfo.res_id.in_([res_id for res_id, _ in hits]))
+        .all()
+    }
+    return [(by_id[res_id], d) for res_id, d in hits if res_id in by_id]
+
+
 def _call_naver_local(res_name: str, display: int = 5):
     """
     네이버 검색 > 지역 API 호출
@@ -47,6 +311,12 @@ def _call_naver_local(res_name: str, display: int = 5):
     if not NAVER_CLIENT_ID or not NAVER_CLIENT_SECRET:
         return None, "NAVER_CLIENT_ID / NAVER_CLIENT_SECRET 환경변수가 필요합니다.", 500
 
+    display = min(max(display, 1), 5)
+    cache_key = f"naver:local:{hashlib.md5(res_name.encode('utf-8')).hexdigest()}:{display}"
+    cached_items = cache_get_json(cache_key)
+    if cached_items:
+        return cached_items, "ok", 200
+
     headers = {
         "X-Naver-Client-Id": NAVER_CLIENT_ID,
         "X-Naver-Client-Secret": NAVER_CLIENT_SECRET,
@@ -54,7 +324,7 @@ def _call_naver_local(res_name: str, display: int = 5):
 
     params = {
         "query": res_name,
-        "display": min(max(display, 1), 5),
+        "display": display,
         "start": 1,
         "sort": "random",  # 정확도순
     }
@@ -74,6 +344,7 @@ def _call_naver_local(res_name: str, display: int = 5):
     if not items:
         return None, "검색 결과가 없습니다.", 404
 
+    cache_set_json(cache_key, items, NAVER_LOCAL_CACHE_TTL)
     return items, "ok", 200
 
 
@@ -227,6 +498,8 @@ def fetch_restaurant_detail_from_naver_service(data: dict):
         db.session.rollback()
         return None, f"DB 저장 중 오류: {e}", 500
 
+    invalidate_restaurant_cache()
+
     result = {
         "res_id": ri.res_id,
         "res_name": ri.res_name,
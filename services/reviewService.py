@@ -1,7 +1,10 @@
 from flask import session
 import requests
-from sqlalchemy import func, literal
+from sqlalchemy import func, lambda_stmt, literal, select, tuple_
 from models import db, Review, RestaurantInfo, User
+from services.cacheService import invalidate_restaurant_cache
+from services.restaurantService import restaurant_exists
+from services.paginationUtil import keyset_page, decode_datetime_cursor
 import os
 import math
 
@@ -17,7 +20,7 @@ def _validate_rating(v):
     return v, None
 
 
-# 공통: 식당 평균 평점 갱신
+# 공통: 식당 평균 평점 갱신 (리뷰 생성/수정/삭제 후 호출)
 def _recalc_restaurant_score(res_id):
     avg = db.session.query(func.avg(Review.rating)).filter(Review.res_id == res_id).scalar()
     r = RestaurantInfo.query.get(res_id)
@@ -25,6 +28,8 @@ def _recalc_restaurant_score(res_id):
         r.score = float(avg) if avg is not None else None
         db.session.add(r)
         db.session.commit()
+    # 평점/리뷰 요약이 바뀌었으므로 목록·통계 캐시 무효화
+    invalidate_restaurant_cache()
 
 
 # 공통: 리뷰 직렬화(닉네임 포함)
@@ -68,8 +73,7 @@ def create_review_service(data):
         return None, err, 400
 
     # FK 존재 확인
-    restaurant = RestaurantInfo.query.get(res_id)
-    if restaurant is None:
+    if not restaurant_exists(res_id):
         return None, "해당 res_id 식당이 존재하지 않습니다.", 404
 
     user = User.query.get(user_id)
@@ -99,10 +103,31 @@ def create_review_service(data):
 
 
 # 리뷰 목록(식당 기준)
-def get_reviews_by_restaurant_service(res_id, page=1, per_page=20, order="recent"):
-    if RestaurantInfo.query.get(res_id) is None:
+# order=recent에서 cursor가 주어지면 (created_at, id) keyset 페이징 ("" = 첫 페이지, total 없음)
+def get_reviews_by_restaurant_service(res_id, page=1, per_page=20, order="recent", cursor=None):
+    if not restaurant_exists(res_id):
         return None, "해당 res_id 식당이 존재하지 않습니다.", 404
 
+    if cursor is not None and order == "recent":
+        stmt = lambda_stmt(lambda: select(Review).where(Review.res_id == res_id))
+        if cursor:
+            try:
+                after_ts, after_id = decode_datetime_cursor(cursor)
+            except ValueError as e:
+                return None, str(e), 400
+            stmt += lambda s: s.where(
+                tuple_(Review.created_at, Review.id) < tuple_(after_ts, after_id)
+            )
+        stmt += lambda s: s.order_by(Review.created_at.desc(), Review.id.desc())
+        rows, p = keyset_page(stmt, per_page, key=lambda r: (r.created_at, r.id))
+
+        return {
+            "items": [_serialize_review(r) for r in rows],
+            "per_page": p["per_page"],
+            "next_cursor": p["next_cursor"],
+            "has_next": p["has_next"]
+        }, "리뷰 목록", 200
+
     q = Review.query.filter(Review.res_id == res_id)
 
     if order == "oldest":
@@ -207,19 +232,18 @@ def delete_review_service(review_id, actor_user_id=None, is_admin=False):
 
 # 리뷰 요약(평균/개수/분포)
 def get_restaurant_review_summary_service(res_id):
-    if RestaurantInfo.query.get(res_id) is None:
+    if not restaurant_exists(res_id):
         return None, "해당 res_id 식당이 존재하지 않습니다.", 404
 
-    avg, cnt = db.session.query(
-        func.avg(Review.rating), func.count(Review.id)
+    # 평균/개수/별점 분포를 한 번의 스캔으로 (COUNT(*) FILTER (WHERE rating = n))
+    row = db.session.query(
+        func.avg(Review.rating),
+        func.count(Review.id),
+        *[func.count(Review.id).filter(Review.rating == i) for i in range(1, 6)]
     ).filter(Review.res_id == res_id).one()
+    avg, cnt = row[0], row[1]
 
-    hist = {i: 0 for i in range(1, 6)}
-    rows = db.session.query(Review.rating, func.count(Review.id)).filter(
-        Review.res_id == res_id
-    ).group_by(Review.rating).all()
-    for rating, c in rows:
-        hist[int(rating)] = int(c)
+    hist = {i: int(c) for i, c in zip(range(1, 6), row[2:])}
 
     return {
         "res_id": res_id,
@@ -0,0 +1,67 @@
+# services/schedulerService.py
+# 주기 작업 (APScheduler BackgroundScheduler)
+# - apscheduler가 없으면 스케줄러 없이 기동 (작업은 건너뜀)
+
+import datetime
+
+from models import db, EmailVerification
+from services.restaurantService import refresh_category_counts
+
+try:
+    from apscheduler.schedulers.background import BackgroundScheduler
+except ImportError:
+    BackgroundScheduler = None
+
+# 인증 코드 유효시간은 3분 → 5분 지난 행은 어떤 경우에도 쓸모없음
+EMAIL_CODE_RETENTION = datetime.timedelta(minutes=5)
+
+_scheduler = None
+
+
+def purge_expired_email_codes(app) -> int:
+    """만료된 이메일 인증 코드 삭제 (created_at은 앱에서 utcnow로 기록하므로 같은 기준으로 비교)"""
+    with app.app_context():
+        cutoff = datetime.datetime.utcnow() - EMAIL_CODE_RETENTION
+        try:
+            deleted = EmailVerification.query.filter(
+                EmailVerification.created_at < cutoff
+            ).delete(synchronize_session=False)
+            db.session.commit()
+            return deleted
+        except Exception as e:
+            db.session.rollback()
+            print(f"[SCHEDULER] purge_expired_email_codes failed: {e}")
+            return 0
+
+
+def refresh_restaurant_stats(app) -> None:
+    """통계 API용 카테고리 개수 materialized view 갱신"""
+    with app.app_context():
+        try:
+            refresh_category_counts()
+        except Exception as e:
+            db.session.rollback()
+            print(f"[SCHEDULER] refresh_restaurant_stats failed: {e}")
+
+
+def start_scheduler(app):
+    """app.run() 전에 1회 호출 (중복 호출 시 기존 스케줄러 반환)"""
+    global _scheduler
+    if _scheduler is not None:
+        return _scheduler
+    if BackgroundScheduler is None:
+        print("[SCHEDULER] apscheduler not installed → periodic jobs disabled")
+        return None
+
+    _scheduler = BackgroundScheduler(daemon=True)
+    _scheduler.add_job(
+        purge_expired_email_codes, "interval", minutes=5, args=[app],
+        id="purge_expired_email_codes", coalesce=True, max_instances=1,
+    )
+    _scheduler.add_job(
+        refresh_restaurant_stats, "interval", minutes=5, args=[app],
+        id="refresh_restaurant_stats", coalesce=True, max_instances=1,
+    )
+    _scheduler.start()
+    print("[SCHEDULER] ✓ started")
+    return _scheduler
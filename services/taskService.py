@@ -0,0 +1,67 @@
+# services/taskService.py
+# 외부 API 호출 등 오래 걸리는 작업을 요청 밖(RQ 워커)에서 실행
+# - rq 패키지 + REDIS_URL + FETCH_DETAIL_ASYNC=1 일 때만 큐 사용, 아니면 호출부가 동기 실행
+# - 워커 실행: rq worker default   (프로젝트 루트에서, 같은 .env/REDIS_URL로)
+
+import os
+
+from services.cacheService import get_redis
+
+try:
+    from rq import Queue
+    from rq.job import Job
+    from rq.exceptions import NoSuchJobError
+except ImportError:
+    Queue = None
+
+# 완료된 작업 결과 보관 시간 (클라이언트 폴링용)
+TASK_RESULT_TTL = 60 * 60
+
+_queue = None
+
+
+def get_task_queue():
+    """비동기 모드가 아니면 None (.env가 import 이후에 로드되므로 첫 호출 때 판단)"""
+    global _queue
+    if _queue is None and Queue is not None and os.environ.get("FETCH_DETAIL_ASYNC", "0") == "1":
+        client = get_redis()
+        if client is not None:
+            _queue = Queue("default", connection=client)
+    return _queue
+
+
+def run_fetch_restaurant_detail(data: dict) -> dict:
+    """RQ 워커에서 실행: 앱 컨텍스트 안에서 서비스 호출 후 (result, msg, status)를 dict로 저장"""
+    from app import app
+    from services.restaurantService import fetch_restaurant_detail_from_naver_service
+
+    with app.app_context():
+        result, msg, status = fetch_restaurant_detail_from_naver_service(data)
+    return {"result": result, "message": msg, "status": status}
+
+
+def enqueue_fetch_restaurant_detail(data: dict):
+    """큐에 넣고 job id 반환 (큐가 없으면 None)"""
+    queue = get_task_queue()
+    if queue is None:
+        return None
+    job = queue.enqueue(run_fetch_restaurant_detail, data, result_ttl=TASK_RESULT_TTL)
+    return job.id
+
+
+def get_task_status(task_id: str):
+    """
+    Returns: (status, payload)
+      - status: queued/started/deferred/scheduled/finished/failed, 없는 작업은 None
+      - payload: finished면 run_fetch_restaurant_detail 반환값
+    """
+    queue = get_task_queue()
+    if queue is None:
+        return None, None
+    try:
+        job = Job.fetch(task_id, connection=queue.connection)
+    except NoSuchJobError:
+        return None, None
+    status = job.get_status()
+    status = getattr(status, "value", status)
+    return status, job.result if status == "finished" else None
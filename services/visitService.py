@@ -2,6 +2,8 @@ from flask import session
 import requests
 from sqlalchemy import func, literal
 from models import db, Visit, RestaurantInfo
+from services.cacheService import invalidate_restaurant_cache
+from services.restaurantService import restaurant_exists
 import os
 import math
 import datetime
@@ -18,7 +20,7 @@ def create_visit_service(data):
         return None, "visit_date는 필수입니다. (YYYY-MM-DD)", 400
 
     # FK 존재 확인
-    if RestaurantInfo.query.get(res_id) is None:
+    if not restaurant_exists(res_id):
         return None, "해당 res_id 식당이 존재하지 않습니다.", 404
 
     # 날짜 파싱
@@ -34,6 +36,7 @@ def create_visit_service(data):
         )
         db.session.add(v)
         db.session.commit()
+        invalidate_restaurant_cache()
 
         return {
             "vi_id": v.vi_id,
@@ -47,7 +50,7 @@ def create_visit_service(data):
 
 # 특정 식당의 방문 목록(최근 방문순)
 def get_visits_by_restaurant_service(res_id, page=1, per_page=20, order="recent"):
-    if RestaurantInfo.query.get(res_id) is None:
+    if not restaurant_exists(res_id):
         return None, "해당 res_id 식당이 존재하지 않습니다.", 404
 
     q = Visit.query.filter(Visit.res_id == res_id)
@@ -92,7 +95,7 @@ def get_visits_in_range_service(start_date, end_date, res_id=None, page=1, per_p
     q = Visit.query.filter(Visit.visit_date.between(sd, ed))
 
     if res_id is not None:
-        if RestaurantInfo.query.get(res_id) is None:
+        if not restaurant_exists(res_id):
             return None, "해당 res_id 식당이 존재하지 않습니다.", 404
         q = q.filter(Visit.res_id == res_id)
 
@@ -143,7 +146,7 @@ def update_visit_service(vi_id, data, is_admin=False):
         new_res_id = data.get("res_id")
         if not new_res_id:
             return None, "res_id는 비어 있을 수 없습니다.", 400
-        if RestaurantInfo.query.get(new_res_id) is None:
+        if not restaurant_exists(new_res_id):
             return None, "해당 res_id 식당이 존재하지 않습니다.", 404
         v.res_id = new_res_id
         changed = True
@@ -191,7 +194,7 @@ def delete_visit_service(vi_id, is_admin=False):
 
 # 방문 집계(최근 N일, 일자별 카운트)
 def get_visit_counts_by_day_service(res_id, days=30):
-    if RestaurantInfo.query.get(res_id) is None:
+    if not restaurant_exists(res_id):
         return None, "해당 res_id 식당이 존재하지 않습니다.", 404
 
     try: